@@ -0,0 +1,73 @@
+"""Admin endpoints for the request profiler.
+
+Only mounted when PROFILING_TOKEN is set. Every call must send the same
+token in the `X-Admin-Token` header.
+"""
+
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+
+from app.config import PROFILING_TOKEN
+from app.schemas.admin import ProfileSummary, ProfilingSettings, ProfilingStatus
+from app.services.profiler import (
+    get_profile,
+    get_sample_rate,
+    list_profiles,
+    set_sample_rate,
+)
+
+
+def require_admin_token(x_admin_token: str = Header("")) -> None:
+    if not hmac.compare_digest(x_admin_token.encode(), PROFILING_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["admin"],
+    dependencies=[Depends(require_admin_token)],
+)
+
+
+def _status() -> ProfilingStatus:
+    return ProfilingStatus(
+        sample_rate=get_sample_rate(),
+        profiles=[
+            ProfileSummary(
+                id=p.id,
+                method=p.method,
+                path=p.path,
+                duration_ms=p.duration_ms,
+                samples=p.samples,
+            )
+            for p in list_profiles()
+        ],
+    )
+
+
+@router.get("/profiling", response_model=ProfilingStatus)
+async def profiling_status() -> ProfilingStatus:
+    """Current sample rate and the most recent captured profiles."""
+    return _status()
+
+
+@router.put("/profiling", response_model=ProfilingStatus)
+async def update_profiling(settings: ProfilingSettings) -> ProfilingStatus:
+    """Set the fraction of requests profiled automatically (0 to disable)."""
+    set_sample_rate(settings.sample_rate)
+    return _status()
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str) -> FileResponse:
+    """Download a profile as a flamegraph-compatible collapsed-stack file."""
+    info = get_profile(profile_id)
+    if info is None:
+        raise HTTPException(status_code=404, detail=f"Profile '{profile_id}' not found")
+    return FileResponse(
+        info.path_on_disk,
+        media_type="text/plain",
+        filename=f"{profile_id}.collapsed",
+    )
@@ -0,0 +1,133 @@
+"""Category / ABC analysis endpoints.
+
+Answers come from a cube precomputed once per store data version (see
+app.services.analytics), so a query costs the size of its result rather
+than a pass over products and sales history. The analytics module (and
+numpy with it) is imported on first use rather than at startup.
+"""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, Query, Response
+
+from app.api.v1.stores import StoreId
+from app.schemas.analytics import AnalyticsCubeResponse, CubeCell, CubeSku
+from app.services.cube_dimensions import ABC_CLASSES, DIMENSIONS
+from app.services.response_cache import cached_json
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+GROUP_BY = (*DIMENSIONS, "sku")
+DEFAULT_SKU_LIMIT = 100
+MAX_SKU_LIMIT = 1000
+
+
+def _cell(key: str | None, values: dict[str, float]) -> dict:
+    units_sold = values["units_sold"]
+    moved = units_sold + values["available"]
+    return {
+        "key": key,
+        "sku_count": int(values["skus"]),
+        "available": int(values["available"]),
+        "inventory_value": round(values["inventory_value"], 2),
+        "reorder_cost": round(values["reorder_cost"], 2),
+        "units_sold": int(units_sold),
+        "revenue": round(values["revenue"], 2),
+        "sell_through": round(units_sold / moved, 4) if moved > 0 else None,
+    }
+
+
+def _build_cube_body(
+    store_id: str,
+    category: str | None,
+    abc: str | None,
+    at_risk: bool | None,
+    group_by: str | None,
+    limit: int,
+) -> bytes:
+    from app.services.analytics import build_cube, query_cube
+
+    cube = build_cube(store_id)
+    totals, rows = query_cube(
+        cube,
+        category=category,
+        abc=abc,
+        at_risk=at_risk,
+        group_by=group_by,
+        limit=limit,
+    )
+    response = AnalyticsCubeResponse(
+        store_id=store_id,
+        version=cube.version,
+        abc_basis=cube.basis,
+        totals=CubeCell(**_cell(None, totals)),
+    )
+    if group_by == "sku":
+        response.skus = [
+            CubeSku(
+                **_cell(row.key, row.values),
+                name=row.product["name"],
+                category=row.product["category"],
+                abc_class=row.abc,
+                at_risk=row.at_risk,
+            )
+            for row in rows
+        ]
+    else:
+        response.groups = [CubeCell(**_cell(row.key, row.values)) for row in rows]
+    return response.model_dump_json(by_alias=True).encode()
+
+
+def warm_cube(store_id: str) -> None:
+    """Rebuild a store's cube for its current data (run after imports)."""
+    from app.services.analytics import build_cube
+
+    build_cube(store_id)
+
+
+@router.get("/cube", response_model=AnalyticsCubeResponse)
+async def analytics_cube(
+    store_id: StoreId,
+    category: str | None = Query(None, description="Only this category"),
+    abc: str | None = Query(None, description="Only this ABC class (A, B or C)"),
+    at_risk: bool | None = Query(
+        None, description="Only SKUs at (true) or not at (false) stockout risk"
+    ),
+    group_by: str | None = Query(
+        None, description="Break the slice down by category, abc, at_risk or sku"
+    ),
+    limit: int = Query(
+        DEFAULT_SKU_LIMIT,
+        ge=1,
+        le=MAX_SKU_LIMIT,
+        description="Maximum SKU rows when group_by=sku",
+    ),
+) -> Response:
+    """Inventory value, reorder cost, sell-through and revenue for a slice.
+
+    Filters select a slice of (category, ABC class, at-risk); group_by
+    drills down one dimension, or lists the slice's SKUs highest revenue
+    first. ABC classes are a Pareto split by revenue over the uploaded
+    sales history (A: first 80%, B: next 15%, C: the rest), or by
+    inventory value when the store has no sales history (see abcBasis).
+    Bodies are cached per store data version.
+    TODO: Replace with a materialized view (Phase 1, Step 6).
+    """
+    if abc is not None and abc not in ABC_CLASSES:
+        raise HTTPException(
+            status_code=400, detail=f"abc must be one of {', '.join(ABC_CLASSES)}"
+        )
+    if group_by is not None and group_by not in GROUP_BY:
+        raise HTTPException(
+            status_code=400, detail=f"group_by must be one of {', '.join(GROUP_BY)}"
+        )
+
+    if group_by != "sku":
+        limit = DEFAULT_SKU_LIMIT
+    key = f"analytics:{category}:{abc}:{at_risk}:{group_by}:{limit}"
+    body = cached_json(
+        key,
+        lambda: _build_cube_body(store_id, category, abc, at_risk, group_by, limit),
+        store_id,
+    )
+    return Response(body, media_type="application/json")
@@ -0,0 +1,101 @@
+"""Server-sent change feed, so dashboards refresh on change instead of polling.
+
+Import and job endpoints call publish_data_change / publish_job_completed
+after they commit; every connected client then receives a small `change`
+event with the new data version, the dashboard metrics that changed and
+the SKUs whose rows changed, and only refetches what it needs. Events
+name the store they concern; `?store_id=` limits a stream to one store.
+
+Metrics are only computed while someone is listening for the store;
+otherwise the event carries the new version without `metrics`, so
+imports don't pay for a product-view rebuild nobody reads.
+"""
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.schemas.changes import DataChangeEvent
+from app.schemas.dashboard import DashboardMetrics
+from app.services.change_feed import has_subscribers, publish, subscribe
+from app.services.seed_data import get_dashboard_metrics, get_data_version
+from app.services.snapshots import STORE_ID_PATTERN
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+# Larger change sets are sent as skus=null ("refetch the lists")
+MAX_EVENT_SKUS = 1000
+
+# Per store: metric values as of its last event, to send only what changed
+_published_metrics: dict[str, dict[str, int | float]] = {}
+
+
+def publish_data_change(
+    source: str, store_id: str, skus: set[str] | None = None
+) -> None:
+    """Publish a `change` event for a store's data just committed by `source`.
+
+    skus=None means every SKU may have changed (a full upload).
+    """
+    if has_subscribers(store_id):
+        metrics = DashboardMetrics(**get_dashboard_metrics(store_id)).model_dump(
+            by_alias=True
+        )
+        published = _published_metrics.setdefault(store_id, {})
+        changed = {k: v for k, v in metrics.items() if published.get(k) != v}
+        published.update(metrics)
+    else:
+        # Not computed; the next computed event sends every metric
+        changed = None
+        _published_metrics.pop(store_id, None)
+
+    listed = skus is not None and len(skus) <= MAX_EVENT_SKUS
+    event = DataChangeEvent(
+        store_id=store_id,
+        version=get_data_version(store_id),
+        source=source,
+        metrics=changed,
+        skus=sorted(skus) if listed else None,
+        sku_count=len(skus) if skus is not None else None,
+    )
+    publish("change", event.model_dump(by_alias=True, exclude_none=True), store_id)
+
+
+def publish_job_completed(source: str, job_id: str, store_id: str) -> None:
+    """Publish a `change` event for a store's finished job (no data changed)."""
+    event = DataChangeEvent(
+        store_id=store_id,
+        version=get_data_version(store_id),
+        source=source,
+        metrics={},
+        job_id=job_id,
+    )
+    publish("change", event.model_dump(by_alias=True, exclude_none=True), store_id)
+
+
+@router.get("/stream", response_class=StreamingResponse)
+async def change_stream(
+    last_event_id: str | None = Header(
+        None, description="Sent by EventSource on reconnect; resumes after it"
+    ),
+    since: str | None = Query(
+        None, description="Event id to resume after (when headers can't be set)"
+    ),
+    store_id: str | None = Query(
+        None, description="Only send this store's events (default: all stores)"
+    ),
+) -> StreamingResponse:
+    """Server-sent events (text/event-stream) for data changes.
+
+    Events: `change` (DataChangeEvent JSON) and `resync`, sent when the
+    client can't be resumed (unknown id, server restart, or it fell too
+    far behind) - refetch the full state on resync. Comment lines are sent
+    as keep-alives while idle.
+    """
+    if store_id is not None and not STORE_ID_PATTERN.fullmatch(store_id):
+        raise HTTPException(status_code=400, detail=f"Invalid store_id '{store_id}'")
+    return StreamingResponse(
+        subscribe(last_event_id or since, store_id),
+        media_type="text/event-stream",
+        # Stop nginx-style proxies buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
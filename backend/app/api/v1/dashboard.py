@@ -1,21 +1,28 @@
 """Dashboard endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from app.schemas.dashboard import DashboardMetrics, DashboardSummaryResponse
+from app.api.v1.stores import StoreId
+from app.config import DEFAULT_STORE_ID
+from app.schemas.dashboard import (
+    DashboardMetrics,
+    DashboardRollupResponse,
+    DashboardSummaryResponse,
+    StoreMetrics,
+)
 from app.schemas.product import Product
-from app.services.seed_data import get_products, get_total_skus
+from app.services.response_cache import cached_json, cached_rollup_json
+from app.services.seed_data import (
+    get_dashboard_metrics,
+    get_products,
+    get_rollup_metrics,
+)
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
-@router.get("/summary", response_model=DashboardSummaryResponse)
-async def dashboard_summary() -> DashboardSummaryResponse:
-    """Return dashboard metrics and at-risk products list.
-
-    TODO: Replace seed data with database queries (Phase 1, Step 6).
-    """
-    raw_products = get_products()
+def _build_summary(store_id: str) -> bytes:
+    raw_products = get_products(store_id)
 
     products = [
         Product(
@@ -32,15 +39,47 @@ async def dashboard_summary() -> DashboardSummaryResponse:
         for p in raw_products
     ]
 
-    # Same formulas the frontend uses for its metric cards
-    reorder_cost = sum(p.recommended_qty * p.unit_cost for p in products)
-    potential_revenue = reorder_cost * 2.5  # ~2.5x markup for retail
+    metrics = DashboardMetrics(**get_dashboard_metrics(store_id))
+
+    summary = DashboardSummaryResponse(metrics=metrics, products=products)
+    return summary.model_dump_json(by_alias=True).encode()
 
-    metrics = DashboardMetrics(
-        total_skus=get_total_skus(),
-        at_risk_skus=len(products),
-        reorder_cost=reorder_cost,
-        potential_revenue=potential_revenue,
+
+def warm_summary(store_id: str = DEFAULT_STORE_ID) -> bytes:
+    """Pre-serialize a store's summary for the current data (startup warm-up)."""
+    return cached_json("dashboard_summary", lambda: _build_summary(store_id), store_id)
+
+
+def _build_rollup() -> bytes:
+    totals, stores = get_rollup_metrics()
+    rollup = DashboardRollupResponse(
+        metrics=DashboardMetrics(**totals),
+        stores=[
+            StoreMetrics(store_id=store_id, metrics=DashboardMetrics(**metrics))
+            for store_id, metrics in sorted(stores.items())
+        ],
     )
+    return rollup.model_dump_json(by_alias=True).encode()
+
 
-    return DashboardSummaryResponse(metrics=metrics, products=products)
+@router.get("/summary", response_model=DashboardSummaryResponse)
+async def dashboard_summary(store_id: StoreId) -> Response:
+    """Return a store's dashboard metrics and at-risk products list.
+
+    The body is serialized once per store data version and reused.
+    TODO: Replace seed data with database queries (Phase 1, Step 6).
+    """
+    return Response(warm_summary(store_id), media_type="application/json")
+
+
+@router.get("/rollup", response_model=DashboardRollupResponse)
+async def dashboard_rollup() -> Response:
+    """Return metric totals across all stores, plus each store's metrics.
+
+    Totals are maintained incrementally from per-store aggregates: only
+    stores that changed since the last request are re-read.
+    TODO: Replace with a database rollup (Phase 1, Step 6).
+    """
+    return Response(
+        cached_rollup_json("rollup", _build_rollup), media_type="application/json"
+    )
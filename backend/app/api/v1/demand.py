@@ -0,0 +1,85 @@
+"""Demand time-series endpoints (chart data built from sales_history)."""
+
+from datetime import date
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+
+from app.api.v1.stores import StoreId
+from app.schemas.demand import DemandPoint, DemandSeriesResponse, RollingStat
+from app.services.demand_store import (
+    GRANULARITIES,
+    MAX_QUERY_DAYS,
+    ROLLING_WINDOWS,
+    get_series,
+)
+
+router = APIRouter(prefix="/demand", tags=["demand"])
+
+
+@router.get("/{sku}", response_model=DemandSeriesResponse)
+async def get_demand_series(
+    sku: str,
+    store_id: StoreId,
+    granularity: str = Query("day", description="Bucket size: day, week, or month"),
+    start: Annotated[
+        date | None, Query(description="First day (default: first sale)")
+    ] = None,
+    end: Annotated[
+        date | None, Query(description="Last day (default: last sale)")
+    ] = None,
+    window: int | None = Query(
+        None,
+        ge=1,
+        le=365,
+        description="Add a trailing N-day rolling mean to each point (day only)",
+    ),
+) -> DemandSeriesResponse:
+    """Return a SKU's demand series in a store, for charts.
+
+    TODO: Replace in-memory demand store with database query (Phase 1, Step 6).
+    """
+    if granularity not in GRANULARITIES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"granularity must be one of {', '.join(GRANULARITIES)}",
+        )
+
+    series = get_series(sku, store_id)
+    if series is None:
+        raise HTTPException(status_code=404, detail=f"No sales history for SKU '{sku}'")
+
+    first = start.toordinal() if start else series.start
+    last = end.toordinal() if end else series.end
+    if last < first:
+        raise HTTPException(status_code=400, detail="end must be on or after start")
+    if last - first + 1 > MAX_QUERY_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range too long. Maximum is {MAX_QUERY_DAYS} days.",
+        )
+
+    buckets = series.rollup(granularity, first, last)
+    means: list[float | None] = [None] * len(buckets)
+    if window is not None and granularity == "day":
+        means = [round(m, 2) for m in series.rolling_means(window, first, last)]
+
+    return DemandSeriesResponse(
+        sku=sku,
+        granularity=granularity,
+        start=date.fromordinal(first),
+        end=date.fromordinal(last),
+        total=series.range_sum(first, last),
+        rolling=[
+            RollingStat(
+                window_days=w,
+                total=series.rolling_sum(w, last),
+                daily_mean=round(series.rolling_mean(w, last), 2),
+            )
+            for w in ROLLING_WINDOWS
+        ],
+        points=[
+            DemandPoint(period_start=period, quantity=qty, rolling_mean=mean)
+            for (period, qty), mean in zip(buckets, means, strict=True)
+        ],
+    )
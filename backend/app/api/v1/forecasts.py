@@ -3,24 +3,82 @@
 These endpoints return hardcoded responses so the frontend can wire to them
 before SQS/EventBridge infrastructure exists.
 
+The "backtest" job type is real: it runs in-process in the background and
+its report is served from GET /backtests/latest.
+
 TODO: Connect POST /trigger to SQS queue (Phase 1, Step 7).
 TODO: Read GET /runs/latest from forecast_runs DB table (Phase 1, Step 7).
 """
 
-from fastapi import APIRouter
+import uuid
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 
-from app.schemas.forecast import ForecastRunResponse, ForecastTriggerResponse
+from app.api.v1.changes import publish_job_completed
+from app.api.v1.stores import StoreId
+from app.schemas.forecast import (
+    BacktestMethodScore,
+    BacktestReportResponse,
+    ForecastRunResponse,
+    ForecastTriggerResponse,
+)
+from app.services.backtest import (
+    claim_backtest,
+    get_latest_backtest,
+    run_backtest_job,
+)
+from app.services.seed_data import get_uploaded_rows
 
 router = APIRouter(prefix="/forecasts", tags=["forecasts"])
 
+JOB_TYPES = ("forecast", "backtest")
+
+
+def _run_backtest(job_id: str, store_id: str) -> None:
+    run_backtest_job(job_id, store_id=store_id)
+    publish_job_completed("backtest", job_id, store_id)
+
 
 @router.post("/trigger", response_model=ForecastTriggerResponse, status_code=202)
-async def trigger_forecast() -> ForecastTriggerResponse:
+async def trigger_forecast(
+    background_tasks: BackgroundTasks,
+    store_id: StoreId,
+    job_type: str = Query("forecast", description="Job type: forecast or backtest"),
+) -> ForecastTriggerResponse:
     """Enqueue a forecast job.
 
-    Stub: returns accepted but does not actually enqueue anything.
+    forecast: stub, returns accepted but does not actually enqueue anything.
+    backtest: scores every forecasting method against the store's uploaded
+    sales_history in the background.
     TODO: Connect to SQS queue (Phase 1, Step 7).
     """
+    if job_type not in JOB_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"job_type must be one of {', '.join(JOB_TYPES)}",
+        )
+
+    if job_type == "backtest":
+        if get_uploaded_rows("sales_history", store_id) is None:
+            raise HTTPException(
+                status_code=400,
+                detail="Upload a sales_history CSV before running a backtest",
+            )
+        job_id = f"backtest-{uuid.uuid4().hex[:12]}"
+        # Claimed now, not when the task starts, so a second trigger gets 409
+        running = claim_backtest(job_id, store_id)
+        if running is not None:
+            raise HTTPException(
+                status_code=409, detail=f"Backtest '{running}' is already running"
+            )
+        background_tasks.add_task(_run_backtest, job_id, store_id)
+        return ForecastTriggerResponse(
+            status="accepted",
+            message="Backtest job started",
+            job_type=job_type,
+            job_id=job_id,
+        )
+
     return ForecastTriggerResponse(
         status="accepted",
         message="Forecast job queued (stub - SQS not connected)",
@@ -28,7 +86,7 @@ async def trigger_forecast() -> ForecastTriggerResponse:
 
 
 @router.get("/runs/latest", response_model=ForecastRunResponse)
-async def latest_forecast_run() -> ForecastRunResponse:
+async def latest_forecast_run(store_id: StoreId) -> ForecastRunResponse:
     """Return the most recent forecast run status.
 
     Stub: returns a hardcoded successful run so the dashboard can
@@ -47,3 +105,37 @@ async def latest_forecast_run() -> ForecastRunResponse:
         rows_processed=847,
         error_message=None,
     )
+
+
+@router.get("/backtests/latest", response_model=BacktestReportResponse)
+async def latest_backtest(store_id: StoreId) -> BacktestReportResponse:
+    """Return a store's most recent backtest accuracy and runtime report."""
+    report = get_latest_backtest(store_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="No backtest has completed yet")
+
+    return BacktestReportResponse(
+        id=report.id,
+        started_at=report.started_at,
+        completed_at=report.completed_at,
+        horizon_days=report.horizon_days,
+        step_days=report.step_days,
+        min_train_days=report.min_train_days,
+        skus_evaluated=report.skus_evaluated,
+        skus_skipped=report.skus_skipped,
+        workers=report.workers,
+        wall_seconds=report.wall_seconds,
+        methods=[
+            BacktestMethodScore(
+                method=m.method,
+                mape=m.mape,
+                wape=m.wape,
+                bias=m.bias,
+                fill_rate=m.fill_rate,
+                forecasts=m.forecasts,
+                cpu_seconds=m.cpu_seconds,
+                us_per_forecast=m.us_per_forecast,
+            )
+            for m in report.methods
+        ],
+    )
@@ -1,8 +1,9 @@
 """Health and readiness check endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.schemas.health import HealthResponse, ReadyResponse
+from app.services.warmup import get_startup_report, is_ready
 
 router = APIRouter(tags=["health"])
 
@@ -14,7 +15,20 @@ async def healthz() -> HealthResponse:
 
 
 @router.get("/readyz", response_model=ReadyResponse)
-async def readyz() -> ReadyResponse:
-    """Readiness probe - can the app serve traffic?"""
+async def readyz(response: Response) -> ReadyResponse:
+    """Readiness probe - can the app serve traffic?
+
+    Returns 503 until startup warm-up has loaded data and built the
+    cached views, so load balancers only route to warm workers.
+    """
     # TODO: Check DB connection when database is connected (Phase 1, Step 6)
-    return ReadyResponse(status="ready", database="not_connected")
+    phases, errors = get_startup_report()
+    ready = is_ready()
+    if not ready:
+        response.status_code = 503
+    return ReadyResponse(
+        status="ready" if ready else "starting",
+        database="not_connected",
+        warmup=phases,
+        warmup_errors=errors,
+    )
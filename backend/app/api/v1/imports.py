@@ -1,17 +1,136 @@
-"""CSV import/upload endpoint."""
+"""CSV import/upload endpoints."""
 
-from fastapi import APIRouter, HTTPException, UploadFile
+import asyncio
+import io
+import time
+import zipfile
 
-from app.schemas.imports import ImportResult, RejectedRow
-from app.services.csv_validator import MAX_FILE_BYTES, PREVIEW_LIMIT, validate_csv
-from app.services.seed_data import store_uploaded_rows
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Header,
+    HTTPException,
+    Request,
+    UploadFile,
+)
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.v1.analytics import warm_cube
+from app.api.v1.changes import publish_data_change
+from app.api.v1.stores import ImportStoreId
+from app.schemas.imports import (
+    BatchFileResult,
+    BatchImportResult,
+    ImportResult,
+    RejectedRow,
+    StreamBatchAck,
+    StreamEventError,
+    StreamImportResult,
+)
+from app.services.csv_validator import (
+    MAX_FILE_BYTES,
+    PREVIEW_LIMIT,
+    ValidationResult,
+    sniff_csv_type,
+    validate_csv,
+)
+from app.services.demand_store import build_demand
+from app.services.import_pool import run_import_task
+from app.services.metrics import IMPORT_ROWS, IMPORT_STAGE_DURATION, stage_timer
+from app.services.seed_data import persist_uploaded_rows, store_uploaded_rows
+from app.services.stream_ingest import StreamIngestor, get_committed_offset
 
 router = APIRouter(prefix="/imports", tags=["imports"])
 
+CSV_CONTENT_TYPES = (
+    "text/csv",
+    "application/vnd.ms-excel",
+    "application/octet-stream",
+    "text/plain",
+)
+ZIP_CONTENT_TYPES = ("application/zip", "application/x-zip-compressed")
+NDJSON_CONTENT_TYPES = (
+    "application/x-ndjson",
+    "application/jsonl",
+    "application/json",
+    "text/plain",
+    "application/octet-stream",
+)
+
+# Upper bounds for one batch (files after unzipping, and their total size)
+MAX_BATCH_FILES = 100
+MAX_BATCH_BYTES = 50 * 1024 * 1024  # 50 MB
+
+
+def _decode(raw_bytes: bytes, filename: str | None = None) -> str:
+    """Decode CSV bytes as UTF-8, falling back to Latin-1."""
+    with stage_timer("decode"):
+        try:
+            return raw_bytes.decode("utf-8")
+        except UnicodeDecodeError:
+            try:
+                return raw_bytes.decode("latin-1")
+            except UnicodeDecodeError:
+                prefix = f"{filename}: " if filename else ""
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{prefix}Could not decode file. Please upload a UTF-8 or Latin-1 encoded CSV.",
+                ) from None
+
+
+def _record_metrics(result: ValidationResult) -> None:
+    IMPORT_STAGE_DURATION.observe(result.parse_seconds, "parse")
+    IMPORT_STAGE_DURATION.observe(result.validate_seconds, "validate")
+    IMPORT_ROWS.inc(result.csv_type, "accepted", amount=len(result.accepted_rows))
+    IMPORT_ROWS.inc(result.csv_type, "rejected", amount=len(result.rejected_rows))
+
+
+def _result_fields(result: ValidationResult) -> dict:
+    """Response fields shared by single-file and batch import results."""
+    return {
+        "csv_type": result.csv_type,
+        "detected_columns": result.detected_columns,
+        "required_columns": result.required_columns,
+        "optional_columns_found": result.optional_columns_found,
+        "total_rows": result.total_rows,
+        "accepted_count": len(result.accepted_rows),
+        "rejected_count": len(result.rejected_rows),
+        "warnings": result.warnings,
+        "accepted_preview": result.accepted_rows[:PREVIEW_LIMIT],
+        "rejected_rows": [
+            RejectedRow(
+                row_number=r["row_number"],
+                data=r["data"],
+                errors=r["errors"],
+            )
+            for r in result.rejected_rows
+        ],
+    }
+
+
+async def _apply(by_type: dict[str, list[dict]], *, store_id: str) -> None:
+    """Store accepted rows without blocking the event loop.
+
+    Demand series are built and snapshots written in worker threads; only
+    the swap into the store runs on the loop, with no await between types,
+    so requests never observe a half-applied batch.
+    """
+    demand = None
+    if "sales_history" in by_type:
+        demand = await run_in_threadpool(build_demand, by_type["sales_history"])
+    for csv_type, rows in by_type.items():
+        store_uploaded_rows(
+            csv_type, rows, store_id=store_id, persist=False, demand=demand
+        )
+    for csv_type, rows in by_type.items():
+        await run_in_threadpool(persist_uploaded_rows, csv_type, rows, store_id)
+
 
 @router.post("/upload", response_model=ImportResult)
-async def upload_csv(file: UploadFile) -> ImportResult:
-    """Upload and validate a CSV file.
+async def upload_csv(
+    file: UploadFile, store_id: ImportStoreId, background_tasks: BackgroundTasks
+) -> ImportResult:
+    """Upload and validate a CSV file into a store.
 
     Accepts inventory_snapshot or sales_history CSVs.
     Returns validation results including accepted/rejected counts,
@@ -22,12 +141,7 @@ async def upload_csv(file: UploadFile) -> ImportResult:
     """
     # Validate content type (basic check - also accept octet-stream
     # since some clients send that for .csv files)
-    if file.content_type and file.content_type not in (
-        "text/csv",
-        "application/vnd.ms-excel",
-        "application/octet-stream",
-        "text/plain",
-    ):
+    if file.content_type and file.content_type not in CSV_CONTENT_TYPES:
         raise HTTPException(
             status_code=400,
             detail=f"Expected a CSV file, got content type '{file.content_type}'",
@@ -41,49 +155,260 @@ async def upload_csv(file: UploadFile) -> ImportResult:
             detail=f"File too large ({len(raw_bytes)} bytes). Maximum is {MAX_FILE_BYTES} bytes (5 MB).",
         )
 
-    # Decode to string
-    try:
-        content = raw_bytes.decode("utf-8")
-    except UnicodeDecodeError:
-        try:
-            content = raw_bytes.decode("latin-1")
-        except UnicodeDecodeError:
-            raise HTTPException(
-                status_code=400,
-                detail="Could not decode file. Please upload a UTF-8 or Latin-1 encoded CSV.",
-            ) from None
+    content = _decode(raw_bytes)
 
-    # Validate CSV
+    # Validate CSV in a low-priority worker process so the event loop keeps
+    # serving reads (admission control already limits concurrent imports)
     try:
-        result = validate_csv(content)
+        result = await run_import_task(validate_csv, content)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    # Build response
-    rejected = [
-        RejectedRow(
-            row_number=r["row_number"],
-            data=r["data"],
-            errors=r["errors"],
-        )
-        for r in result.rejected_rows
-    ]
+    _record_metrics(result)
 
     # Store accepted rows in memory so dashboard/products endpoints
     # can serve uploaded data instead of seed data.
     # TODO: Replace with DB persistence (Phase 1, Step 6).
     if result.accepted_rows:
-        store_uploaded_rows(result.csv_type, result.accepted_rows)
-
-    return ImportResult(
-        csv_type=result.csv_type,
-        detected_columns=result.detected_columns,
-        required_columns=result.required_columns,
-        optional_columns_found=result.optional_columns_found,
-        total_rows=result.total_rows,
-        accepted_count=len(result.accepted_rows),
-        rejected_count=len(result.rejected_rows),
-        warnings=result.warnings,
-        accepted_preview=result.accepted_rows[:PREVIEW_LIMIT],
-        rejected_rows=rejected,
+        with stage_timer("store"):
+            await _apply({result.csv_type: result.accepted_rows}, store_id=store_id)
+        publish_data_change("upload", store_id)
+        # Recompute the analytics cube once the response has gone out
+        background_tasks.add_task(warm_cube, store_id)
+
+    return ImportResult(**_result_fields(result))
+
+
+def _unzip(raw_bytes: bytes, archive_name: str, budget: int) -> list[tuple[str, bytes]]:
+    """Return (name, bytes) for every CSV in a zip archive.
+
+    Sizes are enforced while reading (not trusted from the zip header), so
+    a zip bomb stops at the per-file or remaining batch budget.
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(raw_bytes))
+    except zipfile.BadZipFile:
+        raise HTTPException(
+            status_code=400, detail=f"{archive_name}: not a valid zip archive"
+        ) from None
+
+    members: list[tuple[str, bytes]] = []
+    with archive:
+        for info in archive.infolist():
+            base = info.filename.rsplit("/", 1)[-1]
+            if (
+                info.is_dir()
+                or info.filename.startswith("__MACOSX/")
+                or base.startswith(".")
+                or not base.lower().endswith(".csv")
+            ):
+                continue
+            limit = min(MAX_FILE_BYTES, budget)
+            with archive.open(info) as f:
+                data = f.read(limit + 1)
+            if len(data) > limit:
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"{archive_name}/{info.filename}: file too large. Maximum is "
+                        f"{MAX_FILE_BYTES} bytes per file and {MAX_BATCH_BYTES} per batch."
+                    ),
+                )
+            budget -= len(data)
+            members.append((f"{archive_name}/{info.filename}", data))
+    return members
+
+
+async def _read_batch(files: list[UploadFile]) -> list[tuple[str, bytes]]:
+    """Expand zip archives and apply the batch size limits."""
+    members: list[tuple[str, bytes]] = []
+    budget = MAX_BATCH_BYTES
+    for upload in files:
+        name = upload.filename or "upload"
+        raw_bytes = await upload.read()
+        if upload.content_type in ZIP_CONTENT_TYPES or name.lower().endswith(".zip"):
+            expanded = _unzip(raw_bytes, name, budget)
+        else:
+            if upload.content_type and upload.content_type not in CSV_CONTENT_TYPES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{name}: expected a CSV or zip file, got content type '{upload.content_type}'",
+                )
+            if len(raw_bytes) > MAX_FILE_BYTES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{name}: file too large ({len(raw_bytes)} bytes). Maximum is {MAX_FILE_BYTES} bytes (5 MB).",
+                )
+            expanded = [(name, raw_bytes)]
+        budget -= sum(len(data) for _, data in expanded)
+        if budget < 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Batch too large. Maximum is {MAX_BATCH_BYTES} bytes of CSV in total.",
+            )
+        members.extend(expanded)
+        if len(members) > MAX_BATCH_FILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many files. Maximum is {MAX_BATCH_FILES} CSVs per batch.",
+            )
+    if not members:
+        raise HTTPException(status_code=400, detail="No CSV files found in upload")
+    return members
+
+
+async def _validate_file(name: str, content: str) -> ValidationResult:
+    try:
+        return await run_import_task(validate_csv, content)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"{name}: {exc}") from exc
+
+
+@router.post("/batch", response_model=BatchImportResult)
+async def upload_batch(
+    files: list[UploadFile],
+    store_id: ImportStoreId,
+    background_tasks: BackgroundTasks,
+) -> BatchImportResult:
+    """Upload several CSVs into a store at once, as a zip and/or multiple files.
+
+    Each file's type is detected from its header before any validation
+    starts, then all files are validated concurrently in the import worker
+    pool, so the batch takes about as long as its largest file. Accepted
+    rows are applied atomically: if any file cannot be read or its type
+    is not recognized, nothing is stored. Files of the same type are
+    concatenated in upload order (e.g. one day's files from several tills).
+
+    TODO: Persist accepted rows to DB in one transaction (Phase 1, Step 6).
+    """
+    start = time.perf_counter()
+    members = await _read_batch(files)
+    contents = [_decode(data, name) for name, data in members]
+
+    unknown = [
+        name
+        for (name, _), content in zip(members, contents, strict=True)
+        if sniff_csv_type(content) is None
+    ]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Could not detect CSV type for: {', '.join(unknown[:20])}. "
+                "Each file must be an inventory_snapshot or sales_history CSV."
+            ),
+        )
+
+    results = await asyncio.gather(
+        *(
+            _validate_file(name, content)
+            for (name, _), content in zip(members, contents, strict=True)
+        )
+    )
+
+    by_type: dict[str, list[dict]] = {}
+    for result in results:
+        _record_metrics(result)
+        if result.accepted_rows:
+            rows = by_type.setdefault(result.csv_type, [])
+            rows.extend(result.accepted_rows)
+
+    with stage_timer("store"):
+        await _apply(by_type, store_id=store_id)
+    if by_type:
+        publish_data_change("batch", store_id)
+        background_tasks.add_task(warm_cube, store_id)
+
+    return BatchImportResult(
+        files=[
+            BatchFileResult(filename=name, **_result_fields(result))
+            for (name, _), result in zip(members, results, strict=True)
+        ],
+        applied={csv_type: len(rows) for csv_type, rows in by_type.items()},
+        accepted_count=sum(len(r.accepted_rows) for r in results),
+        rejected_count=sum(len(r.rejected_rows) for r in results),
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+    )
+
+
+@router.post("/stream", response_model=StreamImportResult)
+async def stream_events(
+    request: Request,
+    store_id: ImportStoreId,
+    x_producer_id: str | None = Header(
+        None, description="Stable producer id; enables idempotent retries"
+    ),
+    x_start_offset: int = Header(0, ge=0, description="Offset of the first line"),
+) -> StreamImportResult:
+    """Ingest a store's NDJSON sale/inventory events in micro-batches.
+
+    The body is read incrementally; events are validated with the CSV
+    rules and applied every STREAM_BATCH_EVENTS events or
+    STREAM_FLUSH_SECONDS, whichever is first, so a long-running request
+    makes data visible as it goes. Sales are added to the demand store
+    and inventory rows upserted by SKU, without a full rebuild.
+
+    Line i has offset X-Start-Offset + i. Events at or below the
+    producer's committed offset for the store are skipped, so retrying a
+    failed request is safe; resume from committedOffset + 1.
+    TODO: Persist events to DB (Phase 1, Step 6).
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type and content_type not in NDJSON_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Expected NDJSON (application/x-ndjson), got content type '{content_type}'",
+        )
+
+    ingestor = StreamIngestor(
+        x_producer_id,
+        x_start_offset,
+        store_id,
+        on_apply=lambda skus: publish_data_change("stream", store_id, skus),
+    )
+    chunks = request.stream()
+    next_chunk = asyncio.ensure_future(anext(chunks))
+    try:
+        while True:
+            # Wake up for the time-based flush even if the producer goes quiet
+            done, _ = await asyncio.wait({next_chunk}, timeout=ingestor.flush_due())
+            if not done:
+                ingestor.flush()
+                continue
+            try:
+                chunk = next_chunk.result()
+            except StopAsyncIteration:
+                break
+            ingestor.feed(chunk)
+            next_chunk = asyncio.ensure_future(anext(chunks))
+    finally:
+        if not next_chunk.done():
+            next_chunk.cancel()
+        # Whatever arrived before a disconnect is still applied and committed
+        ingestor.finish()
+
+    return StreamImportResult(
+        producer_id=x_producer_id,
+        committed_offset=(
+            get_committed_offset(x_producer_id, store_id)
+            if x_producer_id
+            else ingestor.next_offset - 1
+        ),
+        received=ingestor.received,
+        accepted=ingestor.accepted,
+        rejected=ingestor.rejected,
+        duplicates=ingestor.duplicates,
+        batches=[
+            StreamBatchAck(
+                first_offset=b.first_offset,
+                last_offset=b.last_offset,
+                accepted=b.accepted,
+                rejected=b.rejected,
+                duplicates=b.duplicates,
+            )
+            for b in ingestor.batches
+        ],
+        errors=[
+            StreamEventError(offset=e.offset, errors=e.errors) for e in ingestor.errors
+        ],
     )
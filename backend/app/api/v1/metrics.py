@@ -0,0 +1,17 @@
+"""Prometheus metrics endpoint."""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.services.metrics import render_prometheus
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Request latency histograms, in-flight requests, response sizes and
+    import pipeline counters in Prometheus text format."""
+    return PlainTextResponse(
+        render_prometheus(), media_type="text/plain; version=0.0.4"
+    )
@@ -1,64 +1,132 @@
 """Products endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+from collections.abc import Iterator
 
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.api.v1.stores import StoreId
+from app.config import DEFAULT_STORE_ID
 from app.schemas.product import Product
+from app.services.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson, wants_ndjson
+from app.services.response_cache import cached_json
 from app.services.seed_data import get_product_by_id, get_products
 
 router = APIRouter(prefix="/products", tags=["products"])
 
+DEFAULT_SORT = "sku"
+DEFAULT_LIMIT = 50
+# JSON bodies are built in memory; larger results should use NDJSON
+MAX_JSON_LIMIT = 500
+
+_product_list = TypeAdapter(list[Product])
+
+# Product fields that can be sorted on; product dicts also carry internal
+# fields (safety_stock, supplier, ...) that are not part of Product
+SORT_FIELDS = frozenset(Product.model_fields)
+
+
+def _to_model(p: dict) -> Product:
+    return Product(
+        id=p["id"],
+        sku=p["sku"],
+        name=p["name"],
+        category=p["category"],
+        available=p["available"],
+        days_until_stockout=p["days_until_stockout"],
+        lead_time_days=p["lead_time_days"],
+        recommended_qty=p["recommended_qty"],
+        unit_cost=p["unit_cost"],
+    )
+
+
+def _select(sort: str, limit: int | None, store_id: str) -> list[dict]:
+    raw = get_products(store_id)
+
+    # Sort by requested field if it is a Product field (None sorts last)
+    if sort in SORT_FIELDS:
+        raw.sort(key=lambda p: (p.get(sort) is None, p.get(sort)))
+
+    return raw[:limit] if limit is not None else raw
+
 
-@router.get("", response_model=list[Product])
+def _build_list(sort: str, limit: int, store_id: str) -> bytes:
+    products = [_to_model(p) for p in _select(sort, limit, store_id)]
+    return _product_list.dump_json(products, by_alias=True)
+
+
+def _iter_models(sort: str, limit: int | None, store_id: str) -> Iterator[Product]:
+    # Selection runs inside the stream (in the threadpool), after the
+    # response headers have gone out
+    for p in _select(sort, limit, store_id):
+        yield _to_model(p)
+
+
+def warm_list(
+    sort: str = DEFAULT_SORT,
+    limit: int = DEFAULT_LIMIT,
+    store_id: str = DEFAULT_STORE_ID,
+) -> bytes:
+    """Pre-serialize a store's product list page for the current data."""
+    return cached_json(
+        f"products:{sort}:{limit}", lambda: _build_list(sort, limit, store_id), store_id
+    )
+
+
+@router.get(
+    "",
+    response_model=list[Product],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 async def list_products(
-    sort: str = Query("sku", description="Field to sort by (sku, name, category)"),
-    limit: int = Query(50, ge=1, le=500, description="Max results to return"),
-) -> list[Product]:
-    """List all products with optional sort and limit.
+    store_id: StoreId,
+    sort: str = Query(
+        DEFAULT_SORT, description="Field to sort by (sku, name, category)"
+    ),
+    limit: int | None = Query(
+        None,
+        ge=1,
+        description=(
+            f"Max results to return (JSON: default {DEFAULT_LIMIT}, max "
+            f"{MAX_JSON_LIMIT}; NDJSON: default all)"
+        ),
+    ),
+    accept: str | None = Header(None),
+) -> Response:
+    """List a store's products with optional sort and limit.
 
+    With `Accept: application/x-ndjson` the products are streamed one per
+    line as they are encoded. JSON bodies are serialized once per data
+    version and parameter set.
     TODO: Replace with database query (Phase 1, Step 6).
     """
-    raw = get_products()
-
-    # Sort by requested field if it exists on the product dict
-    if raw and sort in raw[0]:
-        raw.sort(key=lambda p: p.get(sort, ""))
-
-    raw = raw[:limit]
-
-    return [
-        Product(
-            id=p["id"],
-            sku=p["sku"],
-            name=p["name"],
-            category=p["category"],
-            available=p["available"],
-            days_until_stockout=p["days_until_stockout"],
-            lead_time_days=p["lead_time_days"],
-            recommended_qty=p["recommended_qty"],
-            unit_cost=p["unit_cost"],
+    if wants_ndjson(accept):
+        return StreamingResponse(
+            iter_ndjson(_iter_models(sort, limit, store_id)),
+            media_type=NDJSON_MEDIA_TYPE,
         )
-        for p in raw
-    ]
+
+    limit = limit or DEFAULT_LIMIT
+    if limit > MAX_JSON_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"limit must be at most {MAX_JSON_LIMIT} for JSON responses; "
+                f"request {NDJSON_MEDIA_TYPE} to stream larger results"
+            ),
+        )
+    return Response(warm_list(sort, limit, store_id), media_type="application/json")
 
 
 @router.get("/{product_id}", response_model=Product)
-async def get_product(product_id: str) -> Product:
+async def get_product(product_id: str, store_id: StoreId) -> Product:
     """Get a single product by ID or SKU.
 
     TODO: Replace with database query (Phase 1, Step 6).
     """
-    p = get_product_by_id(product_id)
+    p = get_product_by_id(product_id, store_id)
     if p is None:
         raise HTTPException(status_code=404, detail=f"Product '{product_id}' not found")
 
-    return Product(
-        id=p["id"],
-        sku=p["sku"],
-        name=p["name"],
-        category=p["category"],
-        available=p["available"],
-        days_until_stockout=p["days_until_stockout"],
-        lead_time_days=p["lead_time_days"],
-        recommended_qty=p["recommended_qty"],
-        unit_cost=p["unit_cost"],
-    )
+    return _to_model(p)
@@ -1,12 +1,35 @@
 """Recommendations endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query
+from collections.abc import Iterator
+from itertools import islice
 
+from fastapi import APIRouter, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.api.v1.stores import StoreId
+from app.config import DEFAULT_STORE_ID
 from app.schemas.recommendation import Recommendation
-from app.services.seed_data import get_seed_recommendations
+from app.services.ndjson import NDJSON_MEDIA_TYPE, iter_ndjson, wants_ndjson
+from app.services.po_export import (
+    EXPORT_FORMATS,
+    GROUP_BY_FIELDS,
+    MEDIA_TYPES,
+    filter_recommendations,
+    iter_recommendations,
+    stream_export,
+)
+from app.services.response_cache import cached_json
+from app.services.seed_data import get_recommendation_by_id, get_recommendations
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
+DEFAULT_LIMIT = 50
+# JSON bodies are built in memory; larger results should use NDJSON
+MAX_JSON_LIMIT = 500
+
+_recommendation_list = TypeAdapter(list[Recommendation])
+
 
 def _to_model(r: dict) -> Recommendation:
     return Recommendation(
@@ -25,38 +48,150 @@ def _to_model(r: dict) -> Recommendation:
     )
 
 
-@router.get("", response_model=list[Recommendation])
+def _iter_models(
+    at_risk: bool | None, limit: int | None, store_id: str
+) -> Iterator[Recommendation]:
+    # Lazy end to end: the view is read inside the stream, filtered and
+    # cut off without building intermediate lists
+    rows = get_recommendations(store_id)
+    if at_risk is True:
+        rows = (r for r in rows if r["days_left"] <= 5)
+    for r in islice(rows, limit):
+        yield _to_model(r)
+
+
+def _build_list(at_risk: bool | None, limit: int, store_id: str) -> bytes:
+    return _recommendation_list.dump_json(
+        list(_iter_models(at_risk, limit, store_id)), by_alias=True
+    )
+
+
+def warm_list(
+    at_risk: bool | None = None,
+    limit: int = DEFAULT_LIMIT,
+    store_id: str = DEFAULT_STORE_ID,
+) -> bytes:
+    """Pre-serialize a store's recommendation list page for the current data."""
+    return cached_json(
+        f"recommendations:{at_risk is True}:{limit}",
+        lambda: _build_list(at_risk, limit, store_id),
+        store_id,
+    )
+
+
+@router.get(
+    "",
+    response_model=list[Recommendation],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 async def list_recommendations(
+    store_id: StoreId,
     at_risk: bool | None = Query(
         None, description="If true, only return products with days_left <= 5"
     ),
-    limit: int = Query(50, ge=1, le=500, description="Max results to return"),
-) -> list[Recommendation]:
-    """List reorder recommendations.
+    limit: int | None = Query(
+        None,
+        ge=1,
+        description=(
+            f"Max results to return (JSON: default {DEFAULT_LIMIT}, max "
+            f"{MAX_JSON_LIMIT}; NDJSON: default all)"
+        ),
+    ),
+    accept: str | None = Header(None),
+) -> Response:
+    """List a store's reorder recommendations.
 
+    With `Accept: application/x-ndjson` the recommendations are streamed
+    one per line as they are encoded. JSON bodies are serialized once per
+    data version and parameter set.
     TODO: Replace with database query (Phase 1, Step 6).
     """
-    raw = get_seed_recommendations()
+    if wants_ndjson(accept):
+        return StreamingResponse(
+            iter_ndjson(_iter_models(at_risk, limit, store_id)),
+            media_type=NDJSON_MEDIA_TYPE,
+        )
 
-    if at_risk is True:
-        raw = [r for r in raw if r["days_left"] <= 5]
+    limit = limit or DEFAULT_LIMIT
+    if limit > MAX_JSON_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"limit must be at most {MAX_JSON_LIMIT} for JSON responses; "
+                f"request {NDJSON_MEDIA_TYPE} to stream larger results"
+            ),
+        )
+    return Response(warm_list(at_risk, limit, store_id), media_type="application/json")
 
-    raw = raw[:limit]
-    return [_to_model(r) for r in raw]
+
+@router.get("/export")
+async def export_recommendations(
+    store_id: StoreId,
+    format: str = Query("csv", description="Export format: csv or ndjson"),
+    group_by: str | None = Query(
+        None, description="Group rows by category or supplier"
+    ),
+    gzip: bool = Query(False, description="Gzip-compress the download"),
+    at_risk: bool | None = Query(
+        None, description="If true, only export products with days_left <= 5"
+    ),
+    category: str | None = Query(None, description="Only export this category"),
+    supplier: str | None = Query(None, description="Only export this supplier"),
+    min_order_qty: int = Query(
+        1, ge=0, description="Skip lines recommending fewer units than this"
+    ),
+) -> StreamingResponse:
+    """Stream every matching recommendation in a store as a purchase-order file.
+
+    Unlike the list endpoint there is no limit: rows are encoded and sent
+    as they are produced, so memory stays flat for any catalog size.
+    TODO: Stream from a database cursor (Phase 1, Step 6).
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"format must be one of {', '.join(EXPORT_FORMATS)}",
+        )
+    if group_by is not None and group_by not in GROUP_BY_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"group_by must be one of {', '.join(GROUP_BY_FIELDS)}",
+        )
+
+    # Lazy, so a cold view (and group order) is built inside the stream (in
+    # the threadpool), after the header has already been sent
+    rows = filter_recommendations(
+        iter_recommendations(group_by, store_id),
+        at_risk=at_risk,
+        category=category,
+        supplier=supplier,
+        min_order_qty=min_order_qty,
+    )
+
+    filename = f"purchase-order.{format}" + (".gz" if gzip else "")
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    media_type = MEDIA_TYPES[format]
+    if gzip:
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream_export(rows, format, group_by=group_by, gzip=gzip),
+        media_type=media_type,
+        headers=headers,
+    )
 
 
 @router.get("/{product_id}", response_model=Recommendation)
-async def get_recommendation(product_id: str) -> Recommendation:
+async def get_recommendation(product_id: str, store_id: StoreId) -> Recommendation:
     """Get recommendation for a single product by product ID or SKU.
 
     TODO: Replace with database query (Phase 1, Step 6).
     """
-    recs = get_seed_recommendations()
-    for r in recs:
-        if r["product_id"] == product_id or r["sku"] == product_id:
-            return _to_model(r)
-
-    raise HTTPException(
-        status_code=404,
-        detail=f"Recommendation for product '{product_id}' not found",
-    )
+    r = get_recommendation_by_id(product_id, store_id)
+    if r is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Recommendation for product '{product_id}' not found",
+        )
+
+    return _to_model(r)
@@ -2,11 +2,16 @@
 
 from fastapi import APIRouter
 
+from app.api.v1.analytics import router as analytics_router
+from app.api.v1.changes import router as changes_router
 from app.api.v1.dashboard import router as dashboard_router
+from app.api.v1.demand import router as demand_router
 from app.api.v1.forecasts import router as forecasts_router
 from app.api.v1.imports import router as imports_router
 from app.api.v1.products import router as products_router
 from app.api.v1.recommendations import router as recommendations_router
+from app.api.v1.simulations import router as simulations_router
+from app.api.v1.stores import router as stores_router
 
 api_router = APIRouter()
 
@@ -15,3 +20,8 @@ api_router.include_router(products_router)
 api_router.include_router(recommendations_router)
 api_router.include_router(forecasts_router)
 api_router.include_router(imports_router)
+api_router.include_router(demand_router)
+api_router.include_router(simulations_router)
+api_router.include_router(changes_router)
+api_router.include_router(stores_router)
+api_router.include_router(analytics_router)
@@ -0,0 +1,125 @@
+"""Stockout-risk simulation endpoints.
+
+The simulation module (and numpy with it) is imported on the first
+request rather than at startup, so it does not add to cold-start time.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.v1.stores import StoreId
+from app.schemas.simulation import (
+    StockoutRisk,
+    StockoutSimulationRequest,
+    StockoutSimulationResponse,
+)
+from app.services.seed_data import get_products, get_recommendations
+
+if TYPE_CHECKING:
+    from app.services.stockout_sim import SkuRiskInput
+
+router = APIRouter(prefix="/simulations", tags=["simulations"])
+
+# Upper bound on SKUs per request (keeps response size and runtime bounded)
+MAX_SIMULATION_SKUS = 50_000
+
+
+def _risk_inputs(body: StockoutSimulationRequest, store_id: str) -> list[SkuRiskInput]:
+    """Build simulation inputs from a store's products and recommendations."""
+    from app.services.stockout_sim import SkuRiskInput
+
+    wanted = set(body.skus) if body.skus is not None else None
+    inputs: list[SkuRiskInput] = []
+    for p, r in zip(get_products(store_id), get_recommendations(store_id), strict=True):
+        if wanted is not None and p["sku"] not in wanted:
+            continue
+        if body.at_risk and p["days_until_stockout"] > 5:
+            continue
+        daily_rate = p.get("avg_daily_demand")
+        if daily_rate is None:
+            daily_rate = r["avg_weekly_demand"] / 7
+        inputs.append(
+            SkuRiskInput(
+                sku=p["sku"],
+                on_hand=p["available"],
+                recommended_qty=p["recommended_qty"],
+                lead_time_days=p["lead_time_days"],
+                daily_rate=daily_rate,
+            )
+        )
+    return inputs
+
+
+@router.post("/stockout", response_model=StockoutSimulationResponse)
+async def simulate_stockout(
+    body: StockoutSimulationRequest,
+    store_id: StoreId,
+) -> StockoutSimulationResponse:
+    """Monte Carlo stockout probability and expected lost units over lead time.
+
+    Compares current stock against stock after the recommended order, and
+    reports the order quantity needed to hit the requested service level.
+    """
+    from app.services.stockout_sim import SOURCES, simulate_stockout_risk
+
+    if body.source not in SOURCES:
+        raise HTTPException(
+            status_code=400, detail=f"source must be one of {', '.join(SOURCES)}"
+        )
+
+    inputs = _risk_inputs(body, store_id)
+    if body.skus is not None:
+        missing = set(body.skus) - {i.sku for i in inputs}
+        if missing and not body.at_risk:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Unknown SKU(s): {', '.join(sorted(missing)[:20])}",
+            )
+    if len(inputs) > MAX_SIMULATION_SKUS:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Too many SKUs ({len(inputs)}). Maximum is {MAX_SIMULATION_SKUS} "
+                "per request; pass skus or atRisk to narrow the set."
+            ),
+        )
+
+    start = time.perf_counter()
+    risks = await run_in_threadpool(
+        simulate_stockout_risk,
+        inputs,
+        trials=body.trials,
+        source=body.source,
+        service_level=body.service_level,
+        seed=body.seed,
+        store_id=store_id,
+    )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    return StockoutSimulationResponse(
+        trials=body.trials,
+        source=body.source,
+        service_level=body.service_level,
+        elapsed_ms=round(elapsed_ms, 1),
+        results=[
+            StockoutRisk(
+                sku=r.sku,
+                source=r.source,
+                on_hand=r.on_hand,
+                recommended_qty=r.recommended_qty,
+                lead_time_days=r.lead_time_days,
+                mean_lead_time_demand=r.mean_lead_time_demand,
+                stockout_probability=r.stockout_probability,
+                expected_lost_units=r.expected_lost_units,
+                stockout_probability_after_order=r.stockout_probability_after_order,
+                expected_lost_units_after_order=r.expected_lost_units_after_order,
+                service_level_order_qty=r.service_level_order_qty,
+            )
+            for r in risks
+        ],
+    )
@@ -0,0 +1,83 @@
+"""Store scoping shared by every data endpoint, and the store list.
+
+Data is partitioned by store. Read endpoints take `?store_id=` (default:
+DEFAULT_STORE_ID) through the StoreId dependency, which rejects malformed
+ids and unknown stores. Imports use ImportStoreId instead, which creates
+the store on its first upload (up to MAX_STORES per process).
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.config import DEFAULT_STORE_ID, MAX_STORES
+from app.schemas.store import StoreSummary
+from app.services.seed_data import (
+    get_data_version,
+    get_store_ids,
+    get_total_skus,
+    get_uploaded_rows,
+    store_exists,
+)
+from app.services.snapshots import STORE_ID_PATTERN
+
+router = APIRouter(prefix="/stores", tags=["stores"])
+
+
+def _check_format(store_id: str) -> None:
+    if not STORE_ID_PATTERN.fullmatch(store_id):
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                "store_id must be 1-64 letters, digits, '-' or '_', "
+                "starting with a letter or digit"
+            ),
+        )
+
+
+def store_id_param(
+    store_id: str = Query(
+        DEFAULT_STORE_ID, description="Store to scope the request to"
+    ),
+) -> str:
+    _check_format(store_id)
+    if not store_exists(store_id):
+        raise HTTPException(status_code=404, detail=f"Store '{store_id}' not found")
+    return store_id
+
+
+def import_store_id_param(
+    store_id: str = Query(
+        DEFAULT_STORE_ID,
+        description="Store to import into (created on its first upload)",
+    ),
+) -> str:
+    _check_format(store_id)
+    if not store_exists(store_id) and len(get_store_ids()) >= MAX_STORES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many stores. Maximum is {MAX_STORES} per server.",
+        )
+    return store_id
+
+
+StoreId = Annotated[str, Depends(store_id_param)]
+ImportStoreId = Annotated[str, Depends(import_store_id_param)]
+
+
+@router.get("", response_model=list[StoreSummary])
+async def list_stores() -> list[StoreSummary]:
+    """List every store that has received data.
+
+    TODO: Replace with a stores DB table (Phase 1, Step 6).
+    """
+    return [
+        StoreSummary(
+            store_id=store_id,
+            version=get_data_version(store_id),
+            total_skus=get_total_skus(store_id),
+            has_inventory=get_uploaded_rows("inventory_snapshot", store_id) is not None,
+            has_sales_history=get_uploaded_rows("sales_history", store_id) is not None,
+        )
+        for store_id in get_store_ids()
+    ]
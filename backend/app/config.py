@@ -1,10 +1,78 @@
 """Application configuration loaded from environment variables."""
 
 import os
+import tempfile
 
 CORS_ORIGINS: list[str] = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
 
 API_V1_PREFIX: str = "/api/v1"
 
+# Optional CSV of per-SKU / per-category supplier lead times (sku, category,
+# lead_time_days). Empty means every product uses the default lead time.
+LEAD_TIME_TABLE_PATH: str = os.getenv("LEAD_TIME_TABLE_PATH", "")
+
+# Directory where accepted uploads are snapshotted and reloaded from at
+# startup. Empty means uploads live in memory only and are lost on restart.
+UPLOAD_PERSIST_DIR: str = os.getenv("UPLOAD_PERSIST_DIR", "")
+
+# Data is partitioned by store; requests without ?store_id use this store
+# (which also serves the demo seed data until it has uploads). Imports may
+# create up to MAX_STORES stores per process.
+DEFAULT_STORE_ID: str = os.getenv("DEFAULT_STORE_ID", "default")
+MAX_STORES: int = int(os.getenv("MAX_STORES", "1000"))
+
+# Import admission control. At most IMPORT_CONCURRENCY imports run at once;
+# up to IMPORT_QUEUE_SIZE more wait IMPORT_QUEUE_TIMEOUT_SECONDS for a slot
+# before a 503. A client's concurrent uploads may total
+# IMPORT_CLIENT_MAX_BYTES before a 429.
+IMPORT_CONCURRENCY: int = int(os.getenv("IMPORT_CONCURRENCY", "2"))
+IMPORT_QUEUE_SIZE: int = int(os.getenv("IMPORT_QUEUE_SIZE", "8"))
+IMPORT_QUEUE_TIMEOUT_SECONDS: float = float(
+    os.getenv("IMPORT_QUEUE_TIMEOUT_SECONDS", "15")
+)
+IMPORT_CLIENT_MAX_BYTES: int = int(
+    os.getenv("IMPORT_CLIENT_MAX_BYTES", str(12 * 1024 * 1024))
+)
+# Low-priority worker processes that validate import files (defaults to all
+# cores, so a batch validates its files in parallel). 0 validates in the
+# threadpool instead, without extra processes.
+IMPORT_WORKERS: int = int(os.getenv("IMPORT_WORKERS", str(os.cpu_count() or 1)))
+# Nice increment for import worker processes (0 = same priority as the API)
+IMPORT_WORKER_NICE: int = int(os.getenv("IMPORT_WORKER_NICE", "10"))
+
+# Per-route latency/size metrics exposed at /metrics (set to "false" to disable)
+METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+# JSON responses at least this large are gzip/brotli compressed when the
+# client accepts it (0 compresses everything). Brotli needs the optional
+# `brotli` package.
+COMPRESSION_MIN_BYTES: int = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+# Server-sent change feed (/api/v1/changes/stream): events kept per worker
+# for Last-Event-ID resume, and the keep-alive comment interval. Clients
+# that fall further behind than the buffer get a "resync" event.
+CHANGE_FEED_BUFFER: int = int(os.getenv("CHANGE_FEED_BUFFER", "1024"))
+CHANGE_FEED_HEARTBEAT_SECONDS: float = float(
+    os.getenv("CHANGE_FEED_HEARTBEAT_SECONDS", "15")
+)
+
+# Per-request sampling profiler. Empty token = profiling fully disabled (the
+# middleware and admin endpoints are not installed). The same token is sent
+# as X-Profile-Token to profile a request and as X-Admin-Token for /admin.
+PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+PROFILE_DIR: str = os.getenv(
+    "PROFILE_DIR", os.path.join(tempfile.gettempdir(), "inventorypilot-profiles")
+)
+PROFILE_INTERVAL_MS: float = float(os.getenv("PROFILE_INTERVAL_MS", "2"))
+
+# Worker processes used by forecast backtest jobs (defaults to all cores)
+BACKTEST_WORKERS: int = int(os.getenv("BACKTEST_WORKERS", "0")) or os.cpu_count() or 1
+
+# Threads per stockout simulation request (defaults to all cores). Each one
+# holds a few 4 MB batch matrices, so lower it to cap per-request memory.
+SIMULATION_WORKERS: int = (
+    int(os.getenv("SIMULATION_WORKERS", "0")) or os.cpu_count() or 1
+)
+
 # TODO: Add DATABASE_URL when DB is connected (Phase 1, Step 6)
 # DATABASE_URL: str = os.getenv("DATABASE_URL", "")
@@ -1,16 +1,75 @@
 """FastAPI application entrypoint."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.v1 import dashboard, products, recommendations
 from app.api.v1.health import router as health_router
+from app.api.v1.metrics import router as metrics_router
 from app.api.v1.router import api_router
-from app.config import API_V1_PREFIX, CORS_ORIGINS
+from app.config import (
+    API_V1_PREFIX,
+    COMPRESSION_MIN_BYTES,
+    CORS_ORIGINS,
+    IMPORT_CLIENT_MAX_BYTES,
+    IMPORT_CONCURRENCY,
+    IMPORT_QUEUE_SIZE,
+    IMPORT_QUEUE_TIMEOUT_SECONDS,
+    METRICS_ENABLED,
+    PROFILING_TOKEN,
+)
+from app.middleware.admission import AdmissionMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.timing import TimingMiddleware
+from app.services.admission import ImportGovernor
+from app.services.import_pool import shutdown_import_pool
+from app.services.seed_data import flush_snapshots
+from app.services.warmup import run_warmup
+
+# Response bodies pre-serialized during warm-up (the dashboard's first loads)
+HOT_RESPONSES = (
+    dashboard.warm_summary,
+    products.warm_list,
+    recommendations.warm_list,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Warm up off the event loop: /healthz answers straight away and
+    # /readyz returns 503 until the thread finishes
+    warmup = asyncio.create_task(asyncio.to_thread(run_warmup, HOT_RESPONSES))
+    yield
+    # The thread can't be interrupted; let it finish before shutting down
+    await warmup
+    shutdown_import_pool()
+    # Streamed events are applied in memory only; keep them across restarts
+    flush_snapshots()
+
 
 app = FastAPI(
     title="InventoryPilot API",
     description="Inventory management and forecasting API for local retailers",
     version="0.1.0",
+    lifespan=lifespan,
+)
+
+# Import admission control - reads are never queued behind imports. Added
+# before CORS, so CORS wraps it and its 429/503 responses carry CORS headers
+app.add_middleware(
+    AdmissionMiddleware,
+    governor=ImportGovernor(
+        concurrency=IMPORT_CONCURRENCY,
+        queue_size=IMPORT_QUEUE_SIZE,
+        queue_timeout=IMPORT_QUEUE_TIMEOUT_SECONDS,
+        client_max_bytes=IMPORT_CLIENT_MAX_BYTES,
+    ),
+    prefix=f"{API_V1_PREFIX}/imports",
+    exempt=(f"{API_V1_PREFIX}/imports/stream",),
 )
 
 # CORS - allow frontend dev server
@@ -20,10 +79,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets the frontend back off on admission control's 429/503
+    expose_headers=["Retry-After"],
 )
 
-# Health endpoints at root level (infrastructure concern, not versioned)
+# Compress large JSON/NDJSON responses (inside timing, so sizes are wire sizes)
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_BYTES)
+
+# Opt-in request profiler - not installed at all unless a token is configured
+if PROFILING_TOKEN:
+    from app.middleware.profiling import ProfilingMiddleware
+
+    app.add_middleware(ProfilingMiddleware, token=PROFILING_TOKEN)
+
+# Request timing - added last so it wraps every other middleware
+if METRICS_ENABLED:
+    app.add_middleware(TimingMiddleware)
+
+# Health and metrics endpoints at root level (infrastructure concern, not versioned)
 app.include_router(health_router)
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 # Versioned API routes
 app.include_router(api_router, prefix=API_V1_PREFIX)
+if PROFILING_TOKEN:
+    from app.api.v1.admin import router as admin_router
+
+    app.include_router(admin_router, prefix=API_V1_PREFIX)
@@ -0,0 +1,63 @@
+"""Admission control for import requests.
+
+Runs before the multipart body is read, so a rejected upload costs the
+server nothing beyond the headers. Only POSTs under /api/v1/imports are
+governed; every other request passes straight through.
+
+Long-lived streams (POST /imports/stream) are exempt: a feed can stay
+open for hours, so it would hold a slot (charged MAX_FILE_BYTES, having
+no Content-Length) for as long as it is connected, starve CSV uploads,
+and skew the duration average Retry-After is computed from. Their cost
+is bounded per micro-batch instead (STREAM_BATCH_EVENTS).
+"""
+
+from __future__ import annotations
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.admission import AdmissionRejected, ImportGovernor
+from app.services.csv_validator import MAX_FILE_BYTES
+
+
+class AdmissionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        governor: ImportGovernor,
+        prefix: str,
+        exempt: tuple[str, ...] = (),
+    ) -> None:
+        self.app = app
+        self.governor = governor
+        self.prefix = prefix
+        self.exempt = exempt
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].startswith(self.prefix)
+            or scope["path"] in self.exempt
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope["client"][0] if scope.get("client") else "unknown"
+        try:
+            size = int(Headers(scope=scope).get("content-length", ""))
+        except ValueError:
+            # Chunked upload: assume the largest file we accept
+            size = MAX_FILE_BYTES
+
+        try:
+            async with self.governor.admit(client, size):
+                await self.app(scope, receive, send)
+        except AdmissionRejected as exc:
+            response = JSONResponse(
+                {"detail": exc.detail},
+                status_code=exc.status_code,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
+            await response(scope, receive, send)
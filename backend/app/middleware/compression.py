@@ -0,0 +1,155 @@
+"""Negotiated gzip/brotli compression for JSON responses.
+
+Plain ASGI (like TimingMiddleware) so streamed bodies stay streamed:
+  - a complete body smaller than COMPRESSION_MIN_BYTES is sent as-is;
+    larger ones are compressed in one call with an exact Content-Length
+  - a streamed body (no Content-Length) is compressed chunk by chunk and
+    flushed after every chunk, so the client receives each piece as soon
+    as the endpoint yields it. Its headers are sent straight away, not
+    held until the first chunk, so time to first byte does not wait for
+    the endpoint's first yield
+
+Only JSON and NDJSON responses are touched. Responses that already carry
+a Content-Encoding (e.g. a gzip export) and event streams are passed
+through unchanged. Brotli is used when the optional `brotli` package is
+installed and the client prefers it; otherwise gzip.
+"""
+
+from __future__ import annotations
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson")
+GZIP_LEVEL = 6
+# Brotli quality 4 compresses about as well as gzip 6 at similar speed;
+# higher settings are too slow for per-request dynamic content
+BROTLI_QUALITY = 4
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """Pick "br" or "gzip" from an Accept-Encoding header, or None."""
+    offered: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        offered[name.strip()] = q
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best = max(candidates, key=lambda e: offered.get(e, offered.get("*", 0.0)))
+    return best if offered.get(best, offered.get("*", 0.0)) > 0 else None
+
+
+class _Compressor:
+    def __init__(self, encoding: str) -> None:
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._br = None
+            self._gz = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress and flush, so everything so far is decodable."""
+        if self._br is not None:
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._br is not None:
+            return self._br.finish()
+        return self._gz.flush()
+
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return zlib.compress(data, GZIP_LEVEL, wbits=16 + zlib.MAX_WBITS)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: _Compressor | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                content_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                )
+                if passthrough:
+                    await send(message)
+                elif "content-length" not in headers:
+                    # Streaming: commit to compression and send headers now
+                    compressor = _Compressor(encoding)
+                    streamed = MutableHeaders(raw=list(message.get("headers", [])))
+                    streamed.add_vary_header("Accept-Encoding")
+                    streamed["Content-Encoding"] = encoding
+                    await send({**message, "headers": streamed.raw})
+                else:
+                    # Held until the body shows whether it is worth compressing
+                    start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start is not None:
+                headers = MutableHeaders(raw=list(start.get("headers", [])))
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send({**start, "headers": headers.raw})
+                    await send(message)
+                    return
+                headers["Content-Encoding"] = encoding
+                if more_body:
+                    del headers["Content-Length"]
+                    compressor = _Compressor(encoding)
+                    body = compressor.compress(body)
+                else:
+                    body = compress_body(body, encoding)
+                    headers["Content-Length"] = str(len(body))
+                await send({**start, "headers": headers.raw})
+                start = None
+            elif compressor is not None:
+                body = compressor.compress(body)
+                if not more_body:
+                    body += compressor.finish()
+
+            await send(
+                {"type": "http.response.body", "body": body, "more_body": more_body}
+            )
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,72 @@
+"""Per-request sampling profiler hook.
+
+A request is profiled when it carries the profiling token as an
+`X-Profile-Token` header (never a query parameter, which would end up in
+access logs), or when it is picked by the admin-controlled sample rate. The response gets an
+`X-Profile-Id` header; the collapsed-stack file can be downloaded from
+GET /api/v1/admin/profiles/{id}.
+
+The middleware is only installed when PROFILING_TOKEN is set, so with
+profiling disabled it costs nothing. When installed, an unprofiled
+request costs one header scan and one float comparison.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hmac
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services import profiler
+
+_HEADER = b"x-profile-token"
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, token: str) -> None:
+        self.app = app
+        self.token = token.encode()
+
+    def _requested(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == _HEADER:
+                return hmac.compare_digest(value, self.token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not (
+            self._requested(scope) or profiler.should_sample()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        active = profiler.try_begin()
+        if active is None:
+            # Another request is being profiled on this worker
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profiler.new_profile_id()
+        started = time.time()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Writing the profile (and pruning old ones) is file I/O
+            await asyncio.to_thread(
+                profiler.finish,
+                active,
+                profile_id,
+                scope["method"],
+                scope["path"],
+                started,
+            )
@@ -0,0 +1,99 @@
+"""Request timing middleware feeding the /metrics endpoint.
+
+Written as a plain ASGI middleware (not BaseHTTPMiddleware) so it adds no
+extra task or response buffering: it only wraps `send` to see the status
+code and count body bytes. Latency is labelled by route template
+(e.g. /api/v1/products/{product_id}) rather than raw path, so label
+cardinality stays bounded.
+
+Server-sent event streams (the change feed) stay open for as long as the
+client listens, so they leave the in-flight gauge once their headers go
+out and record no latency or size sample; the feed tracks its own
+subscribers.
+"""
+
+from __future__ import annotations
+
+import time
+
+from starlette.routing import NoMatchFound
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.services.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    HTTP_RESPONSE_SIZE,
+    METRICS_OVERHEAD,
+)
+
+
+def route_label(scope: Scope) -> str:
+    """Full route template of a request, e.g. /api/v1/products/{product_id}.
+
+    The router stores the matched route on the scope, but an included
+    router's route carries only its own path (/products/{product_id}), so
+    the prefix it was mounted under is recovered from the request path.
+    """
+    route = scope.get("route")
+    template = getattr(route, "path", None)
+    if template is None:
+        return "unmatched"
+    try:
+        concrete = route.url_path_for(route.name, **scope.get("path_params", {}))
+    except NoMatchFound:
+        return template
+    path = scope["path"]
+    if not path.endswith(concrete):
+        return template
+    return path[: len(path) - len(concrete)] + template
+
+
+_EVENT_STREAM = b"text/event-stream"
+
+
+def _is_event_stream(message: Message) -> bool:
+    for name, value in message.get("headers", ()):
+        if name.lower() == b"content-type":
+            return value.startswith(_EVENT_STREAM)
+    return False
+
+
+class TimingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        clock = time.perf_counter
+        start = clock()
+        status = 500
+        size = 0
+        in_flight = True
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size, in_flight
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if _is_event_stream(message):
+                    in_flight = False
+                    HTTP_REQUESTS_IN_FLIGHT.dec()
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Event streams already left the gauge; see the module docstring
+            if in_flight:
+                done = clock()
+                HTTP_REQUESTS_IN_FLIGHT.dec()
+                route = route_label(scope)
+                method = scope["method"]
+                HTTP_REQUEST_DURATION.observe(done - start, method, route, status)
+                HTTP_RESPONSE_SIZE.observe(size, method, route)
+                METRICS_OVERHEAD.inc(amount=clock() - done)
@@ -0,0 +1,32 @@
+"""Pydantic models for admin (profiling) endpoints."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ProfilingSettings(BaseModel):
+    """PUT /api/v1/admin/profiling request body."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    sample_rate: float = Field(ge=0, le=1, alias="sampleRate")
+
+
+class ProfileSummary(BaseModel):
+    """A captured request profile."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    method: str
+    path: str
+    duration_ms: float = Field(alias="durationMs")
+    samples: int
+
+
+class ProfilingStatus(BaseModel):
+    """GET/PUT /api/v1/admin/profiling response."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    sample_rate: float = Field(alias="sampleRate")
+    profiles: list[ProfileSummary]
@@ -0,0 +1,48 @@
+"""Pydantic models for the analytics cube endpoint."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CubeCell(BaseModel):
+    """Measure totals for a slice of the cube (or for one SKU)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    # Group value: a category, ABC class, "true"/"false" (at_risk) or a SKU;
+    # null for the slice totals
+    key: str | None = None
+    sku_count: int = Field(alias="skuCount")
+    available: int
+    inventory_value: float = Field(alias="inventoryValue")
+    reorder_cost: float = Field(alias="reorderCost")
+    units_sold: int = Field(alias="unitsSold")
+    revenue: float
+    # units_sold / (units_sold + available); null when both are 0
+    sell_through: float | None = Field(None, alias="sellThrough")
+
+
+class CubeSku(CubeCell):
+    """One SKU of a drill-down (group_by=sku)."""
+
+    name: str
+    category: str
+    abc_class: str = Field(alias="abcClass")
+    at_risk: bool = Field(alias="atRisk")
+
+
+class AnalyticsCubeResponse(BaseModel):
+    """GET /api/v1/analytics/cube response."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    store_id: str = Field(alias="storeId")
+    # Data version the cube was computed for
+    version: int
+    # What ABC classes rank by: "revenue", or "inventory_value" when the
+    # store has no sales history
+    abc_basis: str = Field(alias="abcBasis")
+    totals: CubeCell
+    # One entry per value of the group_by dimension present in the slice
+    groups: list[CubeCell] = []
+    # The slice's SKUs, highest ABC ranking first (group_by=sku)
+    skus: list[CubeSku] = []
@@ -0,0 +1,25 @@
+"""Pydantic models for the server-sent change feed."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DataChangeEvent(BaseModel):
+    """Payload of a `change` event on GET /api/v1/changes/stream."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    store_id: str = Field(alias="storeId")
+    # Increases on every change to the store's data; matches the version of
+    # its cached responses
+    version: int
+    # What committed the change: upload, batch, stream or backtest
+    source: str
+    # Dashboard metric cards whose value changed (camelCase names); omitted
+    # when they were not computed (nobody was listening) - refetch the
+    # summary if you need them
+    metrics: dict[str, int | float] | None = None
+    # SKUs whose product/recommendation rows changed; null means "too many
+    # or all" - refetch the lists
+    skus: list[str] | None = None
+    sku_count: int | None = Field(None, alias="skuCount")
+    job_id: str | None = Field(None, alias="jobId")
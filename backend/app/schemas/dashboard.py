@@ -21,3 +21,20 @@ class DashboardSummaryResponse(BaseModel):
 
     metrics: DashboardMetrics
     products: list[Product]
+
+
+class StoreMetrics(BaseModel):
+    """One store's metric card values within the cross-store rollup."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    store_id: str = Field(alias="storeId")
+    metrics: DashboardMetrics
+
+
+class DashboardRollupResponse(BaseModel):
+    """GET /api/v1/dashboard/rollup response."""
+
+    # Totals across every store with uploaded inventory
+    metrics: DashboardMetrics
+    stores: list[StoreMetrics]
@@ -0,0 +1,39 @@
+"""Pydantic models for the demand series endpoint."""
+
+from datetime import date
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DemandPoint(BaseModel):
+    """Units sold in one day/week/month bucket."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    period_start: date = Field(alias="periodStart")
+    quantity: int
+    rolling_mean: float | None = Field(default=None, alias="rollingMean")
+
+
+class RollingStat(BaseModel):
+    """Trailing-window demand totals as of the series end date."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    window_days: int = Field(alias="windowDays")
+    total: int
+    daily_mean: float = Field(alias="dailyMean")
+
+
+class DemandSeriesResponse(BaseModel):
+    """GET /api/v1/demand/{sku} response."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    sku: str
+    granularity: str
+    start: date
+    end: date
+    total: int
+    rolling: list[RollingStat]
+    points: list[DemandPoint]
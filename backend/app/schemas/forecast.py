@@ -6,8 +6,12 @@ from pydantic import BaseModel, ConfigDict, Field
 class ForecastTriggerResponse(BaseModel):
     """Response from POST /api/v1/forecasts/trigger."""
 
+    model_config = ConfigDict(populate_by_name=True)
+
     status: str
     message: str
+    job_type: str = Field(default="forecast", alias="jobType")
+    job_id: str | None = Field(default=None, alias="jobId")
 
 
 class ForecastRunResponse(BaseModel):
@@ -22,3 +26,36 @@ class ForecastRunResponse(BaseModel):
     method: str
     rows_processed: int = Field(alias="rowsProcessed")
     error_message: str | None = Field(default=None, alias="errorMessage")
+
+
+class BacktestMethodScore(BaseModel):
+    """Accuracy and runtime of one forecasting method across all SKUs."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    method: str
+    mape: float | None
+    wape: float | None
+    bias: float | None
+    fill_rate: float | None = Field(alias="fillRate")
+    forecasts: int
+    cpu_seconds: float = Field(alias="cpuSeconds")
+    us_per_forecast: float = Field(alias="usPerForecast")
+
+
+class BacktestReportResponse(BaseModel):
+    """Response from GET /api/v1/forecasts/backtests/latest."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: str
+    started_at: str = Field(alias="startedAt")
+    completed_at: str = Field(alias="completedAt")
+    horizon_days: int = Field(alias="horizonDays")
+    step_days: int = Field(alias="stepDays")
+    min_train_days: int = Field(alias="minTrainDays")
+    skus_evaluated: int = Field(alias="skusEvaluated")
+    skus_skipped: int = Field(alias="skusSkipped")
+    workers: int
+    wall_seconds: float = Field(alias="wallSeconds")
+    methods: list[BacktestMethodScore]
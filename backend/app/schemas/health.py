@@ -10,3 +10,6 @@ class HealthResponse(BaseModel):
 class ReadyResponse(BaseModel):
     status: str
     database: str
+    # Startup warm-up phase durations in milliseconds (see services/warmup.py)
+    warmup: dict[str, float] = {}
+    warmup_errors: list[str] = []
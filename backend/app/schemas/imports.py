@@ -32,3 +32,57 @@ class ImportResult(BaseModel):
     warnings: list[str]
     accepted_preview: list[dict[str, str]] = Field(alias="acceptedPreview")
     rejected_rows: list[RejectedRow] = Field(alias="rejectedRows")
+
+
+class BatchFileResult(ImportResult):
+    """One file's section of a batch import result."""
+
+    filename: str
+
+
+class BatchImportResult(BaseModel):
+    """Response from POST /api/v1/imports/batch."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    files: list[BatchFileResult]
+    # Rows stored per csv_type (files of the same type are concatenated)
+    applied: dict[str, int]
+    accepted_count: int = Field(alias="acceptedCount")
+    rejected_count: int = Field(alias="rejectedCount")
+    elapsed_ms: float = Field(alias="elapsedMs")
+
+
+class StreamBatchAck(BaseModel):
+    """One applied micro-batch of a stream import (offsets inclusive)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    first_offset: int = Field(alias="firstOffset")
+    last_offset: int = Field(alias="lastOffset")
+    accepted: int
+    rejected: int
+    duplicates: int
+
+
+class StreamEventError(BaseModel):
+    """A streamed event that failed validation."""
+
+    offset: int
+    errors: list[str]
+
+
+class StreamImportResult(BaseModel):
+    """Response from POST /api/v1/imports/stream."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    producer_id: str | None = Field(alias="producerId")
+    # Highest offset applied for this producer; resume from committedOffset + 1
+    committed_offset: int | None = Field(alias="committedOffset")
+    received: int
+    accepted: int
+    rejected: int
+    duplicates: int
+    batches: list[StreamBatchAck]
+    errors: list[StreamEventError]
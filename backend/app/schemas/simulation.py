@@ -0,0 +1,57 @@
+"""Pydantic models for the stockout-risk simulation endpoint."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StockoutSimulationRequest(BaseModel):
+    """POST /api/v1/simulations/stockout request body."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    skus: list[str] | None = Field(
+        default=None, description="SKUs to simulate (default: every product)"
+    )
+    at_risk: bool = Field(
+        default=False,
+        alias="atRisk",
+        description="Only simulate products with days until stockout <= 5",
+    )
+    trials: int = Field(default=10_000, ge=1, le=20_000)
+    source: str = Field(
+        default="empirical",
+        description="Demand source: empirical (sales_history) or forecast",
+    )
+    service_level: float = Field(default=0.95, gt=0, lt=1, alias="serviceLevel")
+    seed: int | None = None
+
+
+class StockoutRisk(BaseModel):
+    """Simulated stockout risk over lead time for one SKU."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    sku: str
+    source: str
+    on_hand: int = Field(alias="onHand")
+    recommended_qty: int = Field(alias="recommendedQty")
+    lead_time_days: int = Field(alias="leadTimeDays")
+    mean_lead_time_demand: float = Field(alias="meanLeadTimeDemand")
+    stockout_probability: float = Field(alias="stockoutProbability")
+    expected_lost_units: float = Field(alias="expectedLostUnits")
+    stockout_probability_after_order: float = Field(
+        alias="stockoutProbabilityAfterOrder"
+    )
+    expected_lost_units_after_order: float = Field(alias="expectedLostUnitsAfterOrder")
+    service_level_order_qty: int = Field(alias="serviceLevelOrderQty")
+
+
+class StockoutSimulationResponse(BaseModel):
+    """POST /api/v1/simulations/stockout response."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    trials: int
+    source: str
+    service_level: float = Field(alias="serviceLevel")
+    elapsed_ms: float = Field(alias="elapsedMs")
+    results: list[StockoutRisk]
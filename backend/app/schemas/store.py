@@ -0,0 +1,16 @@
+"""Pydantic models for the stores endpoint."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StoreSummary(BaseModel):
+    """A store that has received data (GET /api/v1/stores)."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    store_id: str = Field(alias="storeId")
+    # Changes whenever the store's data changes (see the change feed)
+    version: int
+    total_skus: int = Field(alias="totalSkus")
+    has_inventory: bool = Field(alias="hasInventory")
+    has_sales_history: bool = Field(alias="hasSalesHistory")
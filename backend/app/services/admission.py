@@ -0,0 +1,142 @@
+"""Admission control for imports.
+
+Imports are the only requests that can tie up a worker for seconds, so
+they pass through a governor before any of their body is read:
+
+  - per-client bytes in flight: a client's concurrent uploads (by
+    Content-Length) may not exceed IMPORT_CLIENT_MAX_BYTES -> 429. A lone
+    upload is always let through; its size is capped by MAX_FILE_BYTES.
+  - concurrency: at most IMPORT_CONCURRENCY imports run at once; up to
+    IMPORT_QUEUE_SIZE more wait (FIFO) for IMPORT_QUEUE_TIMEOUT_SECONDS.
+    A full queue or a timed-out wait -> 503
+
+Rejections carry Retry-After, estimated from recent import durations and
+the current queue depth. Read endpoints never pass through here, so they
+are never queued behind an import. Every decision is counted in the
+admission_decisions_total metric.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.services.metrics import (
+    ADMISSION_DECISIONS,
+    ADMISSION_QUEUE_WAIT,
+    IMPORTS_QUEUED,
+    IMPORTS_RUNNING,
+)
+
+# Initial guess for an import's duration, before any have completed
+DEFAULT_IMPORT_SECONDS = 2.0
+# Weight of the newest sample in the moving average of import durations
+DURATION_SMOOTHING = 0.2
+
+
+class AdmissionRejected(Exception):
+    """An import was refused; maps to an HTTP error with Retry-After."""
+
+    def __init__(self, status_code: int, detail: str, retry_after: int) -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class ImportGovernor:
+    def __init__(
+        self,
+        concurrency: int,
+        queue_size: int,
+        queue_timeout: float,
+        client_max_bytes: int,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.client_max_bytes = client_max_bytes
+        self.running = 0
+        self.waiting = 0
+        self._client_bytes: dict[str, int] = {}
+        self._avg_seconds = DEFAULT_IMPORT_SECONDS
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free for a new arrival."""
+        ahead = self.waiting + 1
+        return max(1, math.ceil(self._avg_seconds * ahead / self.concurrency))
+
+    def _reject(
+        self, decision: str, status_code: int, detail: str
+    ) -> AdmissionRejected:
+        ADMISSION_DECISIONS.inc("import", decision)
+        return AdmissionRejected(status_code, detail, self.retry_after())
+
+    @asynccontextmanager
+    async def admit(self, client: str, size: int) -> AsyncIterator[None]:
+        """Hold an import slot and `size` bytes of the client's budget."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        in_flight = self._client_bytes.get(client, 0)
+        if in_flight and in_flight + size > self.client_max_bytes:
+            raise self._reject(
+                "rejected_client_bytes",
+                429,
+                f"Too many upload bytes in flight for this client "
+                f"({in_flight + size} > {self.client_max_bytes}). "
+                "Wait for earlier imports to finish.",
+            )
+
+        if self._semaphore.locked():
+            if self.waiting >= self.queue_size:
+                raise self._reject(
+                    "rejected_queue_full", 503, "Import queue is full. Try again later."
+                )
+            self._client_bytes[client] = in_flight + size
+            self.waiting += 1
+            IMPORTS_QUEUED.set(self.waiting)
+            queued_at = time.perf_counter()
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except TimeoutError:
+                self._release_bytes(client, size)
+                raise self._reject(
+                    "rejected_timeout",
+                    503,
+                    f"No import slot became free within {self.queue_timeout:g}s. "
+                    "Try again later.",
+                ) from None
+            finally:
+                self.waiting -= 1
+                IMPORTS_QUEUED.set(self.waiting)
+            ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - queued_at, "import")
+            ADMISSION_DECISIONS.inc("import", "admitted_after_queue")
+        else:
+            await self._semaphore.acquire()
+            self._client_bytes[client] = in_flight + size
+            ADMISSION_DECISIONS.inc("import", "admitted")
+
+        self.running += 1
+        IMPORTS_RUNNING.set(self.running)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._avg_seconds += DURATION_SMOOTHING * (elapsed - self._avg_seconds)
+            self.running -= 1
+            IMPORTS_RUNNING.set(self.running)
+            self._release_bytes(client, size)
+            self._semaphore.release()
+
+    def _release_bytes(self, client: str, size: int) -> None:
+        remaining = self._client_bytes.get(client, 0) - size
+        if remaining > 0:
+            self._client_bytes[client] = remaining
+        else:
+            self._client_bytes.pop(client, None)
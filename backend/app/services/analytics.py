@@ -0,0 +1,266 @@
+"""Category / ABC analysis cube over a store's products and sales.
+
+For every SKU the cube holds on-hand units, inventory value (available x
+unit_cost), reorder cost (recommended_qty x unit_cost), units sold and
+revenue (quantity x unit_price over the uploaded sales_history), plus
+three dimensions:
+
+  - category
+  - ABC class: Pareto by revenue. SKUs ranked by revenue; those within
+    the first ABC_A_SHARE of cumulative revenue are A, up to ABC_B_SHARE
+    are B, the rest (and SKUs that never sold) are C. Without sales
+    history, inventory value is ranked instead (see Cube.basis).
+  - at-risk: days_until_stockout <= AT_RISK_DAYS (as in recommendations)
+
+Everything is computed in one vectorized numpy pass per store data
+version and kept as arrays:
+
+  - `cells`: measure totals per (category, ABC class, at-risk) cell, so a
+    slice or drill-down by dimension sums at most categories x 6 cells
+  - `order` / `offsets`: SKU positions grouped by cell (highest revenue
+    first), so listing a slice's SKUs touches only those SKUs
+
+The cube is rebuilt lazily when the store's data version changes, and
+eagerly after CSV imports (build_cube is scheduled as a background task).
+This module imports numpy, so the API imports it on first use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.services.cube_dimensions import ABC_CLASSES, AT_RISK_DAYS
+from app.services.seed_data import get_data_version, get_products, get_uploaded_rows
+
+# Summed per cell; skus counts rows
+MEASURES = (
+    "skus",
+    "available",
+    "inventory_value",
+    "reorder_cost",
+    "units_sold",
+    "revenue",
+)
+# Cumulative revenue share bounds of the A and B classes
+ABC_A_SHARE = 0.80
+ABC_B_SHARE = 0.95
+
+
+@dataclass
+class Cube:
+    store_id: str
+    version: int
+    # What ABC classes rank by: "revenue", or "inventory_value" without sales
+    basis: str
+    categories: list[str]
+    category_codes: dict[str, int]
+    # (measure, category, abc, at_risk) totals
+    cells: np.ndarray
+    # Per SKU, in product order: (measure, sku) values and dimension codes
+    sku_values: np.ndarray
+    sku_category: np.ndarray
+    sku_abc: np.ndarray
+    sku_at_risk: np.ndarray
+    # Product positions grouped by cell; cell c is order[offsets[c]:offsets[c + 1]]
+    order: np.ndarray
+    offsets: np.ndarray
+    products: list[dict]
+
+
+# store_id -> most recently built cube
+_cubes: dict[str, Cube] = {}
+
+
+def _sales_by_position(
+    store_id: str, positions: dict[str, int], n: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """(units sold, revenue) per product position from the store's sales."""
+    rows = get_uploaded_rows("sales_history", store_id)
+    if rows is None:
+        return np.zeros(n), np.zeros(n)
+    count = len(rows)
+    codes = np.fromiter((positions.get(r["sku"], -1) for r in rows), np.int64, count)
+    quantity = np.array([r["quantity"] for r in rows], dtype=np.float64)
+    price = np.array([r["unit_price"] for r in rows], dtype=np.float64)
+    # Sales for SKUs without an inventory row have no category; skip them
+    known = codes >= 0
+    codes = codes[known]
+    units = np.bincount(codes, weights=quantity[known], minlength=n)
+    revenue = np.bincount(codes, weights=(quantity * price)[known], minlength=n)
+    return units, revenue
+
+
+def _abc_classes(ranking: np.ndarray) -> np.ndarray:
+    """ABC class code (0=A, 1=B, 2=C) per SKU from a Pareto ranking."""
+    abc = np.full(len(ranking), 2, dtype=np.int8)
+    total = ranking.sum()
+    if total <= 0:
+        return abc
+    order = np.argsort(-ranking, kind="stable")
+    ranked = ranking[order]
+    # Share of the total held by higher-ranked SKUs
+    share_before = (np.cumsum(ranked) - ranked) / total
+    classes = np.where(
+        share_before < ABC_A_SHARE, 0, np.where(share_before < ABC_B_SHARE, 1, 2)
+    )
+    classes[ranked <= 0] = 2
+    abc[order] = classes
+    return abc
+
+
+def build_cube(store_id: str) -> Cube:
+    """Build (or return the current) cube for a store's data version."""
+    version = get_data_version(store_id)
+    cube = _cubes.get(store_id)
+    if cube is not None and cube.version == version:
+        return cube
+
+    products = get_products(store_id)
+    n = len(products)
+    positions: dict[str, int] = {}
+    for i, p in enumerate(products):
+        positions.setdefault(p["sku"], i)
+
+    categories = sorted({p["category"] for p in products})
+    category_codes = {c: i for i, c in enumerate(categories)}
+    category = np.fromiter(
+        (category_codes[p["category"]] for p in products), np.int64, n
+    )
+    available = np.fromiter((p["available"] for p in products), np.float64, n)
+    unit_cost = np.fromiter((p["unit_cost"] for p in products), np.float64, n)
+    recommended = np.fromiter((p["recommended_qty"] for p in products), np.float64, n)
+    days = np.fromiter((p["days_until_stockout"] for p in products), np.int64, n)
+    units_sold, revenue = _sales_by_position(store_id, positions, n)
+
+    inventory_value = available * unit_cost
+    basis = "revenue" if revenue.sum() > 0 else "inventory_value"
+    ranking = revenue if basis == "revenue" else inventory_value
+    abc = _abc_classes(ranking)
+    at_risk = days <= AT_RISK_DAYS
+
+    sku_values = np.stack(
+        [
+            np.ones(n),
+            available,
+            inventory_value,
+            recommended * unit_cost,
+            units_sold,
+            revenue,
+        ]
+    )
+    n_cells = len(categories) * len(ABC_CLASSES) * 2
+    cell = (category * len(ABC_CLASSES) + abc) * 2 + at_risk
+    cells = np.stack(
+        [np.bincount(cell, weights=values, minlength=n_cells) for values in sku_values]
+    ).reshape(len(MEASURES), len(categories), len(ABC_CLASSES), 2)
+    # Grouped by cell, highest ranking first within each
+    order = np.lexsort((-ranking, cell))
+    offsets = np.zeros(n_cells + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cell, minlength=n_cells), out=offsets[1:])
+
+    cube = Cube(
+        store_id=store_id,
+        version=version,
+        basis=basis,
+        categories=categories,
+        category_codes=category_codes,
+        cells=cells,
+        sku_values=sku_values,
+        sku_category=category,
+        sku_abc=abc,
+        sku_at_risk=at_risk,
+        order=order,
+        offsets=offsets,
+        products=products,
+    )
+    # Only keep it if the data did not change while it was being built
+    if get_data_version(store_id) == version:
+        _cubes[store_id] = cube
+    return cube
+
+
+@dataclass
+class CubeRow:
+    """Measure totals for one group (or one SKU) of a cube query."""
+
+    key: str
+    values: dict[str, float]
+    product: dict | None = None
+    abc: str | None = None
+    at_risk: bool | None = None
+
+
+def _selection(
+    cube: Cube, category: str | None, abc: str | None, at_risk: bool | None
+) -> tuple[list[int], list[int], list[int]]:
+    """Cell indexes along each axis selected by the filters."""
+    if category is None:
+        cats = list(range(len(cube.categories)))
+    else:
+        code = cube.category_codes.get(category)
+        cats = [] if code is None else [code]
+    abcs = list(range(len(ABC_CLASSES))) if abc is None else [ABC_CLASSES.index(abc)]
+    risks = [0, 1] if at_risk is None else [int(at_risk)]
+    return cats, abcs, risks
+
+
+def _values(totals: np.ndarray) -> dict[str, float]:
+    return dict(zip(MEASURES, totals.tolist(), strict=True))
+
+
+def query_cube(
+    cube: Cube,
+    *,
+    category: str | None = None,
+    abc: str | None = None,
+    at_risk: bool | None = None,
+    group_by: str | None = None,
+    limit: int = 100,
+) -> tuple[dict[str, float], list[CubeRow]]:
+    """Slice the cube and drill down; returns (slice totals, rows).
+
+    group_by is a dimension (one row per value present in the slice),
+    "sku" (the slice's SKUs, highest revenue first, up to `limit`) or None.
+    """
+    cats, abcs, risks = _selection(cube, category, abc, at_risk)
+    sub = cube.cells[:, cats][:, :, abcs][:, :, :, risks]
+    totals = _values(sub.sum(axis=(1, 2, 3)))
+
+    rows: list[CubeRow] = []
+    if group_by == "category":
+        for i, values in zip(cats, sub.sum(axis=(2, 3)).T, strict=True):
+            if values[0]:
+                rows.append(CubeRow(cube.categories[i], _values(values)))
+    elif group_by == "abc":
+        for i, values in zip(abcs, sub.sum(axis=(1, 3)).T, strict=True):
+            if values[0]:
+                rows.append(CubeRow(ABC_CLASSES[i], _values(values)))
+    elif group_by == "at_risk":
+        for i, values in zip(risks, sub.sum(axis=(1, 2)).T, strict=True):
+            if values[0]:
+                rows.append(CubeRow(str(bool(i)).lower(), _values(values)))
+    elif group_by == "sku":
+        n_abc = len(ABC_CLASSES)
+        cells = [(c * n_abc + a) * 2 + r for c in cats for a in abcs for r in risks]
+        picked = [cube.order[cube.offsets[c] : cube.offsets[c + 1]] for c in cells]
+        positions = np.concatenate(picked) if picked else np.zeros(0, np.int64)
+        if len(cells) > 1:
+            # Re-rank across cells; each cell is already ranked internally
+            revenue = cube.sku_values[MEASURES.index("revenue"), positions]
+            value = cube.sku_values[MEASURES.index("inventory_value"), positions]
+            ranking = revenue if cube.basis == "revenue" else value
+            positions = positions[np.argsort(-ranking, kind="stable")]
+        for pos in positions[:limit].tolist():
+            product = cube.products[pos]
+            rows.append(
+                CubeRow(
+                    product["sku"],
+                    _values(cube.sku_values[:, pos]),
+                    product=product,
+                    abc=ABC_CLASSES[cube.sku_abc[pos]],
+                    at_risk=bool(cube.sku_at_risk[pos]),
+                )
+            )
+    return totals, rows
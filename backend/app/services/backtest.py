@@ -0,0 +1,447 @@
+"""Rolling-origin backtests for demand forecasting methods.
+
+Replays each SKU's daily demand series: at every origin (every `step_days`
+after an initial `min_train_days`), each method forecasts total demand over
+the next `horizon_days` using only data before the origin, and the forecast
+is scored against what actually sold.
+
+Scores per method:
+  - MAPE: mean absolute percentage error over origins with non-zero actuals
+  - WAPE: sum |error| / sum actual (stable for intermittent SKUs)
+  - bias: sum (forecast - actual) / sum actual (positive = over-forecast)
+  - fill rate: share of actual demand served if stock were set to the
+    recommendation formula's reorder point (lead-time demand + safety
+    stock) computed from the forecast, with lead time = horizon
+  - runtime: CPU seconds spent inside the method, to weigh accuracy
+    against compute cost
+
+SKUs are split into chunks and scored across a process pool. Each method
+forecasts every origin of a series in one pass (prefix sums / a single
+smoothing sweep), so a SKU costs O(days) per method.
+
+Runnable as a CLI:
+    python -m app.services.backtest sales_history.csv --output report.json
+or as a forecast job type (POST /api/v1/forecasts/trigger?job_type=backtest).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from itertools import accumulate
+from multiprocessing import get_context
+
+from app.config import BACKTEST_WORKERS, DEFAULT_STORE_ID
+from app.services.demand_store import DemandSeries, get_demand_skus, get_series
+from app.services.lead_times import DEFAULT_LEAD_TIME_DAYS
+from app.services.seed_data import SAFETY_STOCK_WEEKS, VELOCITY_WINDOW_DAYS
+
+DEFAULT_STEP_DAYS = 7
+DEFAULT_MIN_TRAIN_DAYS = 28
+SMOOTHING_ALPHA = 0.3
+
+# Below this many SKUs a process pool costs more than it saves
+MIN_SKUS_PER_WORKER = 200
+
+# A forecast method maps (daily demand, origins, horizon) to the forecast
+# total demand over [origin, origin + horizon) for each origin.
+ForecastMethod = Callable[[Sequence[int], Sequence[int], int], list[float]]
+
+
+# ---------------------------------------------------------------------------
+# Forecast methods
+# ---------------------------------------------------------------------------
+
+
+def _moving_average(window: int) -> ForecastMethod:
+    def forecast(
+        daily: Sequence[int], origins: Sequence[int], horizon: int
+    ) -> list[float]:
+        prefix = [0, *accumulate(daily)]
+        return [
+            (prefix[o] - prefix[max(0, o - window)]) / min(window, o) * horizon
+            for o in origins
+        ]
+
+    return forecast
+
+
+def _exponential_smoothing(
+    daily: Sequence[int], origins: Sequence[int], horizon: int
+) -> list[float]:
+    # levels[t] = smoothed daily level using days [0, t)
+    levels = [float(daily[0])]
+    level = float(daily[0])
+    for qty in daily:
+        level = SMOOTHING_ALPHA * qty + (1 - SMOOTHING_ALPHA) * level
+        levels.append(level)
+    return [levels[o] * horizon for o in origins]
+
+
+def _seasonal_naive(
+    daily: Sequence[int], origins: Sequence[int], horizon: int
+) -> list[float]:
+    # Repeat the last observed week across the horizon
+    return [float(sum(daily[o - 7 + (h % 7)] for h in range(horizon))) for o in origins]
+
+
+FORECAST_METHODS: dict[str, ForecastMethod] = {
+    # Production method: same window as the sales-velocity join
+    "moving_average": _moving_average(VELOCITY_WINDOW_DAYS),
+    "moving_average_7": _moving_average(7),
+    "exponential_smoothing": _exponential_smoothing,
+    "seasonal_naive": _seasonal_naive,
+}
+
+
+# ---------------------------------------------------------------------------
+# Report types
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MethodScore:
+    method: str
+    mape: float | None
+    wape: float | None
+    bias: float | None
+    fill_rate: float | None
+    forecasts: int
+    cpu_seconds: float
+    us_per_forecast: float
+
+
+@dataclass
+class SkuScore:
+    sku: str
+    method: str
+    mape: float | None
+    bias: float | None
+    fill_rate: float | None
+
+
+@dataclass
+class BacktestReport:
+    id: str
+    started_at: str
+    completed_at: str
+    horizon_days: int
+    step_days: int
+    min_train_days: int
+    skus_evaluated: int
+    skus_skipped: int
+    workers: int
+    wall_seconds: float
+    methods: list[MethodScore]
+    per_sku: list[SkuScore] = field(default_factory=list)
+
+
+@dataclass
+class _Totals:
+    ape_sum: float = 0.0
+    ape_count: int = 0
+    abs_err: float = 0.0
+    err: float = 0.0
+    actual: float = 0.0
+    served: float = 0.0
+    forecasts: int = 0
+    seconds: float = 0.0
+
+    def merge(self, other: _Totals) -> None:
+        self.ape_sum += other.ape_sum
+        self.ape_count += other.ape_count
+        self.abs_err += other.abs_err
+        self.err += other.err
+        self.actual += other.actual
+        self.served += other.served
+        self.forecasts += other.forecasts
+        self.seconds += other.seconds
+
+
+def _ratio(num: float, den: float) -> float | None:
+    return round(num / den, 4) if den else None
+
+
+# ---------------------------------------------------------------------------
+# Scoring (runs inside worker processes)
+# ---------------------------------------------------------------------------
+
+
+def _score_chunk(
+    chunk: list[tuple[str, list[int]]],
+    methods: list[str],
+    horizon: int,
+    step: int,
+    min_train: int,
+    per_sku: bool,
+) -> tuple[dict[str, _Totals], list[SkuScore]]:
+    """Score every method on a chunk of (sku, daily demand) series."""
+    safety_days = 7 * SAFETY_STOCK_WEEKS
+    totals = {m: _Totals() for m in methods}
+    sku_scores: list[SkuScore] = []
+
+    for sku, daily in chunk:
+        prefix = [0, *accumulate(daily)]
+        origins = range(min_train, len(daily) - horizon + 1, step)
+        actuals = [prefix[o + horizon] - prefix[o] for o in origins]
+
+        for method in methods:
+            start = time.process_time()
+            forecasts = FORECAST_METHODS[method](daily, origins, horizon)
+            elapsed = time.process_time() - start
+
+            t = _Totals(forecasts=len(forecasts), seconds=elapsed)
+            for forecast, actual in zip(forecasts, actuals, strict=True):
+                error = forecast - actual
+                t.abs_err += abs(error)
+                t.err += error
+                t.actual += actual
+                if actual:
+                    t.ape_sum += abs(error) / actual
+                    t.ape_count += 1
+                # Stock to the reorder point implied by this forecast
+                rate = forecast / horizon
+                stock = rate * horizon + rate * safety_days
+                t.served += min(actual, stock)
+
+            totals[method].merge(t)
+            if per_sku:
+                sku_scores.append(
+                    SkuScore(
+                        sku=sku,
+                        method=method,
+                        mape=_ratio(t.ape_sum, t.ape_count),
+                        bias=_ratio(t.err, t.actual),
+                        fill_rate=_ratio(t.served, t.actual),
+                    )
+                )
+
+    return totals, sku_scores
+
+
+def _chunks(items: list, n: int) -> list[list]:
+    size = max(1, -(-len(items) // n))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_backtest(
+    series: dict[str, DemandSeries],
+    methods: Sequence[str] | None = None,
+    *,
+    horizon_days: int = DEFAULT_LEAD_TIME_DAYS,
+    step_days: int = DEFAULT_STEP_DAYS,
+    min_train_days: int = DEFAULT_MIN_TRAIN_DAYS,
+    workers: int | None = None,
+    per_sku: bool = False,
+) -> BacktestReport:
+    """Backtest forecasting methods over a set of demand series.
+
+    Series shorter than min_train_days + horizon_days are skipped.
+    Raises ValueError for unknown methods or non-positive parameters.
+    """
+    methods = list(methods or FORECAST_METHODS)
+    unknown = [m for m in methods if m not in FORECAST_METHODS]
+    if unknown:
+        raise ValueError(
+            f"Unknown forecast method(s): {', '.join(unknown)}. "
+            f"Available: {', '.join(FORECAST_METHODS)}"
+        )
+    if horizon_days < 1 or step_days < 1 or min_train_days < 7:
+        raise ValueError(
+            "horizon_days and step_days must be >= 1 and min_train_days >= 7"
+        )
+
+    started = datetime.now(UTC)
+    wall_start = time.perf_counter()
+
+    min_len = min_train_days + horizon_days
+    items = [
+        (sku, s.daily.tolist()) for sku, s in series.items() if len(s.daily) >= min_len
+    ]
+    skipped = len(series) - len(items)
+
+    workers = workers or BACKTEST_WORKERS
+    workers = max(1, min(workers, len(items) // MIN_SKUS_PER_WORKER or 1))
+    args = (methods, horizon_days, step_days, min_train_days, per_sku)
+
+    totals = {m: _Totals() for m in methods}
+    sku_scores: list[SkuScore] = []
+    if workers == 1:
+        results = [_score_chunk(items, *args)]
+    else:
+        # spawn, not fork: the API process has live threads
+        with ProcessPoolExecutor(workers, mp_context=get_context("spawn")) as pool:
+            futures = [
+                pool.submit(_score_chunk, chunk, *args)
+                for chunk in _chunks(items, workers * 4)
+            ]
+            results = [f.result() for f in futures]
+
+    for chunk_totals, chunk_scores in results:
+        for method, t in chunk_totals.items():
+            totals[method].merge(t)
+        sku_scores.extend(chunk_scores)
+
+    scores = [
+        MethodScore(
+            method=m,
+            mape=_ratio(t.ape_sum, t.ape_count),
+            wape=_ratio(t.abs_err, t.actual),
+            bias=_ratio(t.err, t.actual),
+            fill_rate=_ratio(t.served, t.actual),
+            forecasts=t.forecasts,
+            cpu_seconds=round(t.seconds, 4),
+            us_per_forecast=round(t.seconds / t.forecasts * 1e6, 2)
+            if t.forecasts
+            else 0.0,
+        )
+        for m, t in totals.items()
+    ]
+
+    return BacktestReport(
+        id=f"backtest-{uuid.uuid4().hex[:12]}",
+        started_at=started.isoformat(),
+        completed_at=datetime.now(UTC).isoformat(),
+        horizon_days=horizon_days,
+        step_days=step_days,
+        min_train_days=min_train_days,
+        skus_evaluated=len(items),
+        skus_skipped=skipped,
+        workers=workers,
+        wall_seconds=round(time.perf_counter() - wall_start, 4),
+        methods=scores,
+        per_sku=sku_scores,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Forecast job type (in-memory run registry)
+# TODO: Run on the SQS forecast worker and persist to forecast_runs (Phase 1, Step 7).
+# ---------------------------------------------------------------------------
+_latest_reports: dict[str, BacktestReport] = {}
+# store_id -> id of the backtest running for that store
+_running_jobs: dict[str, str] = {}
+
+
+def run_backtest_job(
+    job_id: str,
+    methods: Sequence[str] | None = None,
+    store_id: str = DEFAULT_STORE_ID,
+) -> None:
+    """Backtest every SKU in a store's demand and keep the report in memory.
+
+    Releases the store's running slot when done (see claim_backtest).
+    """
+    try:
+        series = {sku: get_series(sku, store_id) for sku in get_demand_skus(store_id)}
+        report = run_backtest(series, methods)
+        report.id = job_id
+        _latest_reports[store_id] = report
+    finally:
+        if _running_jobs.get(store_id) == job_id:
+            del _running_jobs[store_id]
+
+
+def get_latest_backtest(store_id: str = DEFAULT_STORE_ID) -> BacktestReport | None:
+    """Return a store's most recent completed backtest report, if any."""
+    return _latest_reports.get(store_id)
+
+
+def claim_backtest(job_id: str, store_id: str = DEFAULT_STORE_ID) -> str | None:
+    """Mark `job_id` as the store's running backtest before it is scheduled.
+
+    Returns the id of the backtest already running for the store instead
+    (nothing is claimed then). Called on the event loop, so two triggers
+    can't both claim the slot; run_backtest_job clears it when it finishes.
+    """
+    running = _running_jobs.get(store_id)
+    if running is not None:
+        return running
+    _running_jobs[store_id] = job_id
+    return None
+
+
+def get_running_backtest(store_id: str = DEFAULT_STORE_ID) -> str | None:
+    """Return the id of the backtest job running for a store, if any."""
+    return _running_jobs.get(store_id)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _format_table(report: BacktestReport) -> str:
+    lines = [
+        f"{report.skus_evaluated} SKUs ({report.skus_skipped} skipped), "
+        f"{report.workers} worker(s), {report.wall_seconds}s wall",
+        f"{'method':<24}{'MAPE':>8}{'WAPE':>8}{'bias':>8}{'fill':>8}"
+        f"{'cpu s':>10}{'us/fc':>10}",
+    ]
+    for s in report.methods:
+        cells = [s.mape, s.wape, s.bias, s.fill_rate]
+        lines.append(
+            f"{s.method:<24}"
+            + "".join(f"{'-' if v is None else f'{v:.3f}':>8}" for v in cells)
+            + f"{s.cpu_seconds:>10.3f}{s.us_per_forecast:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    # Imported here so the API process doesn't pay for it
+    from app.services.csv_validator import validate_csv
+    from app.services.demand_store import ingest_sales_rows, reset_demand
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.backtest",
+        description="Backtest forecasting methods on a sales_history CSV.",
+    )
+    parser.add_argument("csv_path", help="Path to a sales_history CSV")
+    parser.add_argument(
+        "--methods",
+        nargs="+",
+        choices=list(FORECAST_METHODS),
+        help="Methods to compare (default: all)",
+    )
+    parser.add_argument("--horizon", type=int, default=DEFAULT_LEAD_TIME_DAYS)
+    parser.add_argument("--step", type=int, default=DEFAULT_STEP_DAYS)
+    parser.add_argument("--min-train", type=int, default=DEFAULT_MIN_TRAIN_DAYS)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--per-sku", action="store_true", help="Include per-SKU scores")
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    with open(args.csv_path, encoding="utf-8") as f:
+        result = validate_csv(f.read(), max_rows=None)
+    if result.csv_type != "sales_history":
+        parser.error(f"Expected a sales_history CSV, got {result.csv_type}")
+
+    reset_demand()
+    ingest_sales_rows(result.accepted_rows)
+    series = {sku: get_series(sku) for sku in get_demand_skus()}
+
+    report = run_backtest(
+        series,
+        args.methods,
+        horizon_days=args.horizon,
+        step_days=args.step,
+        min_train_days=args.min_train,
+        workers=args.workers,
+        per_sku=args.per_sku,
+    )
+    print(_format_table(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(asdict(report), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
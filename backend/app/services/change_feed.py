@@ -0,0 +1,202 @@
+"""In-process broadcast buffer behind the server-sent change feed.
+
+Every committed data change (import, stream batch, backtest) is published
+once: it gets the next event id and is encoded to its SSE frame a single
+time, then appended to a ring buffer of the last CHANGE_FEED_BUFFER events.
+Subscribers don't have their own queues; each keeps a cursor (the last id
+it sent) and copies whatever is newer out of the shared buffer, so fan-out
+to thousands of connections costs one wake-up and one slice per client.
+
+Backpressure: a subscriber only reads from the buffer after its previous
+write has been accepted by the socket, so a slow client just lags behind
+(catching up in one coalesced write) and holds no extra memory. A client
+whose cursor has been overwritten by the ring gets a "resync" event and
+should refetch the full state.
+
+Events are tagged with the store they concern; a subscriber may ask for a
+single store's events (the cursor still advances over every event).
+
+Event ids are "<epoch>-<seq>", where the epoch is unique per worker
+process, so a Last-Event-ID from before a restart (or from another
+worker) is detected and answered with a resync rather than silently
+skipping events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from app.config import CHANGE_FEED_BUFFER, CHANGE_FEED_HEARTBEAT_SECONDS
+from app.services.metrics import CHANGE_FEED_RESYNCS, CHANGE_FEED_SUBSCRIBERS
+
+# Client reconnect delay sent with the first frame (milliseconds)
+RETRY_MS = 3000
+HEARTBEAT_FRAME = b": keep-alive\n\n"
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    seq: int
+    store_id: str | None
+    frame: bytes
+
+
+# ---------------------------------------------------------------------------
+# Module state (per worker process)
+# ---------------------------------------------------------------------------
+_epoch = uuid.uuid4().hex[:8]
+_lock = threading.Lock()
+_events: deque[FeedEvent] = deque(maxlen=CHANGE_FEED_BUFFER)
+_last_seq = 0
+# Replaced on every publish; subscribers wait on the one current when they
+# caught up. Created/set on the event loop that serves the subscribers.
+_wakeup: asyncio.Event | None = None
+_loop: asyncio.AbstractEventLoop | None = None
+# Connected subscribers per store filter (None = all stores)
+_subscribers: Counter[str | None] = Counter()
+
+
+def _frame(event: str, seq: int, data: dict) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"))
+    return f"id: {_epoch}-{seq}\nevent: {event}\ndata: {payload}\n\n".encode()
+
+
+def _notify() -> None:
+    global _wakeup
+    if _wakeup is not None:
+        waiting, _wakeup = _wakeup, asyncio.Event()
+        waiting.set()
+
+
+def publish(event: str, data: dict, store_id: str | None = None) -> str:
+    """Append an event to the broadcast buffer and wake subscribers.
+
+    Safe to call from worker threads (e.g. background jobs). Returns the
+    event id.
+    """
+    global _last_seq
+    with _lock:
+        _last_seq += 1
+        seq = _last_seq
+        _events.append(FeedEvent(seq, store_id, _frame(event, seq, data)))
+    loop = _loop
+    if loop is not None and not loop.is_closed():
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            _notify()
+        else:
+            loop.call_soon_threadsafe(_notify)
+    return f"{_epoch}-{seq}"
+
+
+def has_subscribers(store_id: str) -> bool:
+    """Whether any connected client receives this store's events."""
+    return _subscribers[None] > 0 or _subscribers[store_id] > 0
+
+
+def last_event_id() -> str:
+    return f"{_epoch}-{_last_seq}"
+
+
+def _resume_cursor(last_id: str | None) -> int | None:
+    """Cursor to resume from a Last-Event-ID, or None if it can't be resumed."""
+    if not last_id:
+        return _last_seq
+    epoch, _, seq = last_id.partition("-")
+    if epoch != _epoch or not seq.isdigit():
+        return None
+    cursor = int(seq)
+    oldest = _events[0].seq if _events else _last_seq + 1
+    if cursor > _last_seq or cursor < oldest - 1:
+        return None
+    return cursor
+
+
+def _read_after(cursor: int, store_id: str | None) -> tuple[int, bytes] | None:
+    """(new cursor, frames) for events after `cursor`; None if overwritten."""
+    with _lock:
+        behind = _last_seq - cursor
+        if behind <= 0:
+            return cursor, b""
+        if behind > len(_events):
+            return None
+        # Index from the right: cursors are almost always near the end
+        events = (_events[-i] for i in range(behind, 0, -1))
+        frames = [e.frame for e in events if store_id is None or e.store_id == store_id]
+        return _last_seq, b"".join(frames)
+
+
+def _resync_frame(reason: str) -> bytes:
+    CHANGE_FEED_RESYNCS.inc()
+    # Carries the current id, so a reconnect after it resumes from here
+    return _frame("resync", _last_seq, {"reason": reason})
+
+
+def subscribe(
+    last_id: str | None = None, store_id: str | None = None
+) -> AsyncIterator[bytes]:
+    """SSE-encoded chunks for one client until it disconnects.
+
+    With store_id, only that store's events are sent.
+
+    The position is taken now (not on first iteration), so nothing
+    published while the response headers are sent is missed.
+    """
+    with _lock:
+        cursor = _resume_cursor(last_id)
+        if cursor is None:
+            cursor = _last_seq
+            resync = _resync_frame("unknown or expired Last-Event-ID")
+        else:
+            resync = None
+    return _stream(cursor, resync, store_id)
+
+
+async def _stream(
+    cursor: int, resync: bytes | None, store_id: str | None
+) -> AsyncIterator[bytes]:
+    global _loop, _wakeup
+    loop = asyncio.get_running_loop()
+    if _loop is not loop:
+        _loop, _wakeup = loop, asyncio.Event()
+
+    CHANGE_FEED_SUBSCRIBERS.inc()
+    _subscribers[store_id] += 1
+    try:
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        if resync is not None:
+            yield resync
+
+        while True:
+            wakeup = _wakeup
+            read = _read_after(cursor, store_id)
+            if read is None:
+                # Fell further behind than the ring buffer holds
+                with _lock:
+                    cursor = _last_seq
+                    frame = _resync_frame("fell behind the change buffer")
+                yield frame
+                continue
+            cursor, frames = read
+            if frames:
+                yield frames
+                continue
+            try:
+                await asyncio.wait_for(
+                    wakeup.wait(), timeout=CHANGE_FEED_HEARTBEAT_SECONDS
+                )
+            except TimeoutError:
+                # Keeps proxies from closing an idle connection
+                yield HEARTBEAT_FRAME
+    finally:
+        _subscribers[store_id] -= 1
+        CHANGE_FEED_SUBSCRIBERS.dec()
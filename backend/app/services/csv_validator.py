@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import csv
 import io
+import time
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -39,6 +41,9 @@ class ValidationResult:
     rejected_rows: list[dict]  # each has rowNumber, data, errors
     warnings: list[str]
     total_rows: int = 0
+    # Time spent reading CSV records vs. checking them (for import metrics)
+    parse_seconds: float = 0.0
+    validate_seconds: float = 0.0
 
 
 # ---------------------------------------------------------------------------
@@ -58,6 +63,19 @@ def _truncate(value: str) -> str:
     return value
 
 
+def _timed_rows(rows: Iterable[dict], elapsed: list[float]) -> Iterator[dict]:
+    """Yield rows from a csv reader, adding time spent reading to elapsed[0]."""
+    clock = time.perf_counter
+    it = iter(rows)
+    while True:
+        start = clock()
+        row = next(it, None)
+        elapsed[0] += clock() - start
+        if row is None:
+            return
+        yield row
+
+
 def _detect_csv_type(
     normalized_headers: list[str],
 ) -> tuple[str, list[str]] | None:
@@ -76,6 +94,19 @@ def _detect_csv_type(
     return None
 
 
+def sniff_csv_type(content: str) -> str | None:
+    """Detect the CSV type from the header line alone (no row parsing).
+
+    Lets batch imports reject unrecognized files before any of them are
+    validated. Returns None if the header matches neither schema.
+    """
+    header = next(csv.reader(io.StringIO(content)), None)
+    if not header:
+        return None
+    detection = _detect_csv_type([_normalize_header(h) for h in header])
+    return detection[0] if detection else None
+
+
 # ---------------------------------------------------------------------------
 # Field validators
 # ---------------------------------------------------------------------------
@@ -175,21 +206,52 @@ _VALIDATORS: dict[tuple[str, str], callable] = {
 }
 
 
+REQUIRED_COLUMNS = {
+    "inventory_snapshot": INVENTORY_SNAPSHOT_REQUIRED,
+    "sales_history": SALES_HISTORY_REQUIRED,
+}
+
+
+def validate_row(csv_type: str, row: dict[str, str]) -> list[str]:
+    """Check a normalized row's required fields; returns error messages.
+
+    Shared by CSV validation and the NDJSON stream import, so both apply
+    exactly the same rules.
+    """
+    errors: list[str] = []
+    for col in REQUIRED_COLUMNS[csv_type]:
+        validator = _VALIDATORS.get((csv_type, col))
+        if validator:
+            errors.extend(validator(row.get(col, "")))
+    return errors
+
+
+def normalize_value(value: object) -> str:
+    """Render a non-CSV value (e.g. from JSON) the way a CSV cell would read."""
+    if value is None:
+        return ""
+    return _truncate(str(value)).strip()
+
+
 # ---------------------------------------------------------------------------
 # Main validation function
 # ---------------------------------------------------------------------------
 
 
-def validate_csv(content: str) -> ValidationResult:
+def validate_csv(content: str, max_rows: int | None = MAX_ROWS) -> ValidationResult:
     """Parse and validate CSV content.
 
     Returns a ValidationResult with accepted rows, rejected rows,
     detected columns, and warnings. Never raises on bad data -
     all issues are captured in the result.
 
+    Rows beyond `max_rows` are skipped with a warning. Offline tools
+    (backtests, benchmarks) pass None to process the whole file.
+
     Raises ValueError if the content cannot be parsed at all
     (e.g. empty file, no headers, unrecognized CSV type).
     """
+    started = time.perf_counter()
     reader = csv.DictReader(io.StringIO(content))
 
     if reader.fieldnames is None:
@@ -235,13 +297,15 @@ def validate_csv(content: str) -> ValidationResult:
     accepted: list[dict[str, str]] = []
     rejected: list[dict] = []
     total_rows = 0
+    parse_elapsed = [0.0]
 
-    for row_idx, raw_row in enumerate(reader, start=2):  # row 1 is header
+    # row 1 is header
+    for row_idx, raw_row in enumerate(_timed_rows(reader, parse_elapsed), start=2):
         total_rows += 1
 
-        if total_rows > MAX_ROWS:
+        if max_rows is not None and total_rows > max_rows:
             warnings.append(
-                f"CSV has more than {MAX_ROWS} rows. Only the first {MAX_ROWS} were processed."
+                f"CSV has more than {max_rows} rows. Only the first {max_rows} were processed."
             )
             break
 
@@ -265,12 +329,7 @@ def validate_csv(content: str) -> ValidationResult:
             row[norm_key] = val.strip()
 
         # Validate required fields
-        row_errors: list[str] = []
-        for col in required_columns:
-            cell_value = row.get(col, "")
-            validator = _VALIDATORS.get((csv_type, col))
-            if validator:
-                row_errors.extend(validator(cell_value))
+        row_errors = validate_row(csv_type, row)
 
         if row_errors:
             rejected.append(
@@ -283,6 +342,7 @@ def validate_csv(content: str) -> ValidationResult:
         else:
             accepted.append(row)
 
+    total_seconds = time.perf_counter() - started
     return ValidationResult(
         csv_type=csv_type,
         detected_columns=normalized_headers,
@@ -292,4 +352,6 @@ def validate_csv(content: str) -> ValidationResult:
         rejected_rows=rejected,
         warnings=warnings,
         total_rows=total_rows,
+        parse_seconds=parse_elapsed[0],
+        validate_seconds=total_seconds - parse_elapsed[0],
     )
@@ -0,0 +1,10 @@
+"""Dimensions of the analytics cube.
+
+Kept apart from app.services.analytics (which imports numpy) so the API
+can validate query parameters without loading it.
+"""
+
+DIMENSIONS = ("category", "abc", "at_risk")
+ABC_CLASSES = ("A", "B", "C")
+# Same threshold as the recommendations' at_risk filter
+AT_RISK_DAYS = 5
@@ -0,0 +1,235 @@
+"""Per-SKU daily demand time series built from sales_history rows.
+
+Accepted sales rows are bucketed by calendar day into one dense array per
+SKU, so consumers never have to re-parse order_date/quantity or group rows
+themselves. Each series keeps a lazily rebuilt prefix-sum array, which makes
+any range sum (and therefore any rolling sum/mean) an O(1) lookup.
+
+Week and month rollups, and rolling series for charts, are O(days) passes
+over the dense array.
+
+Series are partitioned by store. Data lives in memory and a store's
+series are rebuilt whenever its sales_history upload replaces the previous
+one.
+TODO: Replace with a daily_demand DB table (Phase 1, Step 6).
+"""
+
+from __future__ import annotations
+
+import calendar
+from array import array
+from collections.abc import Iterable
+from datetime import date, datetime
+from itertools import accumulate
+
+from app.config import DEFAULT_STORE_ID
+
+# Rolling windows (in days) reported alongside every series
+ROLLING_WINDOWS = (7, 28, 90)
+
+GRANULARITIES = ("day", "week", "month")
+
+# Longest date range a single series query may span (~5 years)
+MAX_QUERY_DAYS = 5 * 366
+
+
+def parse_order_day(value: str) -> int:
+    """Return the proleptic ordinal of the calendar day in an ISO order_date."""
+    return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).toordinal()
+
+
+class DemandSeries:
+    """Dense daily demand for a single SKU.
+
+    `daily[i]` holds the units sold on day `start + i` (date ordinals).
+    Days without sales are stored as 0 so indexing is positional.
+    """
+
+    __slots__ = ("start", "daily", "_prefix")
+
+    def __init__(self, start: int) -> None:
+        self.start = start
+        self.daily = array("q")
+        self._prefix: array | None = None
+
+    @property
+    def end(self) -> int:
+        """Ordinal of the last day covered (start - 1 when empty)."""
+        return self.start + len(self.daily) - 1
+
+    def add(self, day: int, quantity: int) -> None:
+        """Add units sold on `day`, growing the dense array as needed."""
+        if not self.daily:
+            self.start = day
+            self.daily.append(quantity)
+        elif day < self.start:
+            gap = self.start - day
+            self.daily = (
+                array("q", [quantity]) + array("q", bytes(8 * (gap - 1))) + self.daily
+            )
+            self.start = day
+        elif day > self.end:
+            self.daily.extend(array("q", bytes(8 * (day - self.end - 1))))
+            self.daily.append(quantity)
+        else:
+            self.daily[day - self.start] += quantity
+        self._prefix = None
+
+    def _prefix_sums(self) -> array:
+        """prefix[i] = sum(daily[:i]); rebuilt once after each mutation."""
+        if self._prefix is None:
+            self._prefix = array("q", accumulate(self.daily, initial=0))
+        return self._prefix
+
+    def range_sum(self, first: int, last: int) -> int:
+        """Total units sold between two day ordinals (inclusive). O(1)."""
+        lo = max(first, self.start) - self.start
+        hi = min(last, self.end) - self.start
+        if hi < lo:
+            return 0
+        prefix = self._prefix_sums()
+        return prefix[hi + 1] - prefix[lo]
+
+    def rolling_sum(self, window: int, as_of: int | None = None) -> int:
+        """Units sold in the `window` days ending on `as_of` (default: end)."""
+        last = self.end if as_of is None else as_of
+        return self.range_sum(last - window + 1, last)
+
+    def rolling_mean(self, window: int, as_of: int | None = None) -> float:
+        """Average units per day over the `window` days ending on `as_of`."""
+        return self.rolling_sum(window, as_of) / window
+
+    def rolling_means(self, window: int, first: int, last: int) -> list[float]:
+        """Trailing `window`-day mean for every day in [first, last]. O(days)."""
+        return [
+            self.range_sum(day - window + 1, day) / window
+            for day in range(first, last + 1)
+        ]
+
+    def rollup(self, granularity: str, first: int, last: int) -> list[tuple[date, int]]:
+        """Bucket daily demand in [first, last] into day/week/month periods.
+
+        Weeks start on Monday; months on the 1st. Periods are labelled by
+        their first calendar day (clamped to `first` for the opening bucket).
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity '{granularity}'")
+
+        buckets: list[tuple[date, int]] = []
+        day = first
+        while day <= last:
+            period_start = date.fromordinal(day)
+            if granularity == "day":
+                next_day = day + 1
+            elif granularity == "week":
+                next_day = day + 7 - period_start.weekday()
+            else:
+                # Day arithmetic, so December 9999 needs no date after date.max
+                month_days = calendar.monthrange(period_start.year, period_start.month)[
+                    1
+                ]
+                next_day = day + month_days - period_start.day + 1
+            period_end = min(next_day - 1, last)
+            buckets.append((period_start, self.range_sum(day, period_end)))
+            day = next_day
+        return buckets
+
+
+# ---------------------------------------------------------------------------
+# In-memory store: store_id -> SKU -> series.
+# TODO: Replace with database persistence (Phase 1, Step 6).
+# ---------------------------------------------------------------------------
+_stores: dict[str, dict[str, DemandSeries]] = {}
+_EMPTY: dict[str, DemandSeries] = {}
+
+
+def reset_demand(store_id: str = DEFAULT_STORE_ID) -> None:
+    """Drop a store's series (used when a new sales_history replaces the old)."""
+    _stores.pop(store_id, None)
+
+
+def _add_rows(store: dict[str, DemandSeries], rows: Iterable[dict]) -> set[str]:
+    touched: set[str] = set()
+    for row in rows:
+        sku = row["sku"]
+        series = store.get(sku)
+        if series is None:
+            series = store[sku] = DemandSeries(0)
+        series.add(parse_order_day(row["order_date"]), int(row["quantity"]))
+        touched.add(sku)
+    return touched
+
+
+def ingest_sales_rows(
+    rows: Iterable[dict], store_id: str = DEFAULT_STORE_ID
+) -> set[str]:
+    """Add validated sales_history rows to a store's series.
+
+    Returns the set of SKUs whose series changed.
+    """
+    return _add_rows(_stores.setdefault(store_id, {}), rows)
+
+
+def build_demand(rows: Iterable[dict]) -> dict[str, DemandSeries]:
+    """Build series from sales_history rows without touching any store.
+
+    The expensive half of rebuild_demand; safe to run in a worker thread,
+    then swap in with replace_demand.
+    """
+    store: dict[str, DemandSeries] = {}
+    _add_rows(store, rows)
+    return store
+
+
+def replace_demand(
+    series: dict[str, DemandSeries], store_id: str = DEFAULT_STORE_ID
+) -> None:
+    """Make `series` (from build_demand) the store's series."""
+    _stores[store_id] = series
+
+
+def rebuild_demand(rows: Iterable[dict], store_id: str = DEFAULT_STORE_ID) -> set[str]:
+    """Replace a store's series with series built from `rows`."""
+    series = build_demand(rows)
+    replace_demand(series, store_id)
+    return set(series)
+
+
+def get_series(sku: str, store_id: str = DEFAULT_STORE_ID) -> DemandSeries | None:
+    """Return the demand series for a SKU, or None if it has no sales."""
+    return _stores.get(store_id, _EMPTY).get(sku)
+
+
+def get_demand_skus(store_id: str = DEFAULT_STORE_ID) -> list[str]:
+    """Return every SKU that has at least one recorded sale."""
+    return list(_stores.get(store_id, _EMPTY))
+
+
+def latest_demand_day(store_id: str = DEFAULT_STORE_ID) -> int | None:
+    """Ordinal of the most recent sales day across a store's SKUs, if any.
+
+    Used as the shared "as of" date so rolling windows line up across SKUs
+    even when some SKUs stopped selling earlier.
+    """
+    series = _stores.get(store_id)
+    if not series:
+        return None
+    return max(s.end for s in series.values())
+
+
+def build_velocity_index(
+    window: int, store_id: str = DEFAULT_STORE_ID
+) -> dict[str, float]:
+    """Map each SKU to its average daily demand over the trailing window.
+
+    All SKUs share the same "as of" day (the store's latest sale), so a
+    SKU that stopped selling weeks ago correctly reports low velocity.
+    One O(1) prefix-sum lookup per SKU.
+    """
+    as_of = latest_demand_day(store_id)
+    if as_of is None:
+        return {}
+    return {
+        sku: series.rolling_mean(window, as_of)
+        for sku, series in _stores[store_id].items()
+    }
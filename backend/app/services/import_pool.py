@@ -0,0 +1,69 @@
+"""Dedicated, low-priority worker processes for CPU-heavy import work.
+
+CSV parsing and validation are pure Python, so running them on the event
+loop (or a thread) competes with read requests for the GIL. Here they run
+in separate processes, niced by IMPORT_WORKER_NICE so the OS scheduler
+favours the API process: dashboard reads stay fast while imports run.
+
+The pool is created on first use with IMPORT_WORKERS processes; how many
+imports may use it at once is limited separately by admission control
+(app.services.admission). Set IMPORT_WORKERS=0 to validate in the
+threadpool instead (no extra processes, e.g. for constrained containers).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import get_context
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.config import IMPORT_WORKER_NICE, IMPORT_WORKERS
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _lower_priority() -> None:
+    if IMPORT_WORKER_NICE and hasattr(os, "nice"):
+        os.nice(IMPORT_WORKER_NICE)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                IMPORT_WORKERS,
+                mp_context=get_context("spawn"),
+                initializer=_lower_priority,
+            )
+        return _pool
+
+
+async def run_import_task(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a picklable function in the import pool without blocking the loop."""
+    if IMPORT_WORKERS <= 0:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_pool(), partial(fn, *args, **kwargs))
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); start a fresh pool next time
+        shutdown_import_pool()
+        raise
+
+
+def shutdown_import_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
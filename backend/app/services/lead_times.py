@@ -0,0 +1,98 @@
+"""Supplier lead-time lookup for reorder calculations.
+
+Lead times resolve in this order:
+  1. a `lead_time_days` pass-through column on the inventory_snapshot row
+  2. a per-SKU entry in the lead-time table
+  3. a per-category entry in the lead-time table
+  4. DEFAULT_LEAD_TIME_DAYS
+
+The optional table is a CSV at LEAD_TIME_TABLE_PATH with columns
+`sku, category, lead_time_days`. Rows with a sku are per-SKU entries;
+rows with only a category are per-category entries. If the file can't be
+read, the error is logged once and every lookup falls back to the defaults.
+
+TODO: Move to a supplier_lead_times DB table (Phase 1, Step 6).
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+
+from app.config import LEAD_TIME_TABLE_PATH
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEAD_TIME_DAYS = 14
+
+_by_sku: dict[str, int] = {}
+_by_category: dict[str, int] = {}
+_loaded = False
+
+
+def _parse_days(value: str | None) -> int | None:
+    """Return a positive integer day count, or None if missing/invalid."""
+    if not value:
+        return None
+    try:
+        days = int(value.strip())
+    except ValueError:
+        return None
+    return days if days > 0 else None
+
+
+def load_lead_time_table(path: str) -> None:
+    """Load per-SKU and per-category lead times from a CSV file.
+
+    Invalid or empty lead_time_days values are skipped.
+    """
+    by_sku: dict[str, int] = {}
+    by_category: dict[str, int] = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            row = {(k or "").strip().lower(): (v or "").strip() for k, v in row.items()}
+            days = _parse_days(row.get("lead_time_days"))
+            if days is None:
+                continue
+            if row.get("sku"):
+                by_sku[row["sku"]] = days
+            elif row.get("category"):
+                by_category[row["category"]] = days
+    set_lead_time_table(by_sku, by_category)
+
+
+def set_lead_time_table(by_sku: dict[str, int], by_category: dict[str, int]) -> None:
+    """Replace the in-memory lead-time table."""
+    global _loaded
+    _by_sku.clear()
+    _by_sku.update(by_sku)
+    _by_category.clear()
+    _by_category.update(by_category)
+    _loaded = True
+
+
+def _ensure_loaded() -> None:
+    global _loaded
+    if not _loaded:
+        # Set first, so an unreadable table is only tried (and logged) once
+        _loaded = True
+        if LEAD_TIME_TABLE_PATH:
+            try:
+                load_lead_time_table(LEAD_TIME_TABLE_PATH)
+            except (OSError, ValueError, csv.Error):
+                logger.exception(
+                    "Can't read lead-time table %s; using default lead times",
+                    LEAD_TIME_TABLE_PATH,
+                )
+
+
+def resolve_lead_time(row: dict, sku: str, category: str) -> int:
+    """Return the lead time in days for an inventory row."""
+    _ensure_loaded()
+    days = _parse_days(row.get("lead_time_days"))
+    if days is not None:
+        return days
+    days = _by_sku.get(sku)
+    if days is not None:
+        return days
+    return _by_category.get(category, DEFAULT_LEAD_TIME_DAYS)
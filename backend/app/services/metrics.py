@@ -0,0 +1,232 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+A deliberately small subset of the Prometheus client model: counters,
+gauges and histograms with positional label values. Recording is a dict
+lookup plus a few integer/float updates, so it is cheap enough to run on
+every request. Values are per worker process (scrape each worker, or sum
+in Prometheus).
+
+Updates are not locked: the event loop records almost everything, and an
+occasional lost increment from a threadpool race is acceptable for
+monitoring data. Series creation is locked so label sets are never lost.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Latency buckets (seconds): 1 ms .. 30 s
+DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+# Response size buckets (bytes): 100 B .. 50 MB
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 50_000_000)
+
+_registry: list[_Metric] = []
+_create_lock = threading.Lock()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = labelnames
+        _registry.append(self)
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self._samples()
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        try:
+            self._values[labels] += amount
+        except KeyError:
+            with _create_lock:
+                self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0)
+
+    def _samples(self) -> Iterator[str]:
+        for labels, value in list(self._values.items()):
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels) -> None:
+        self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = buckets
+        # per label set: [count per bucket..., +Inf count, sum]
+        self._series: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *labels) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            with _create_lock:
+                series = self._series.setdefault(
+                    labels, [0] * (len(self.buckets) + 1) + [0.0]
+                )
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def _samples(self) -> Iterator[str]:
+        bounds = (*self.buckets, float("inf"))
+        for labels, series in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, series, strict=False):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield (
+                    f"{self.name}_bucket{_labels(self.labelnames, labels, le)} "
+                    f"{cumulative}"
+                )
+            label_str = _labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_str} {_format_value(series[-1])}"
+            yield f"{self.name}_count{label_str} {cumulative}"
+
+
+def render_prometheus() -> str:
+    """Render every registered metric in Prometheus text format (0.0.4)."""
+    lines: list[str] = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ---------------------------------------------------------------------------
+# Application metrics
+# ---------------------------------------------------------------------------
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Response body size by route template.",
+    ("method", "route"),
+    buckets=SIZE_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "Requests currently being served."
+)
+METRICS_OVERHEAD = Counter(
+    "http_metrics_overhead_seconds_total",
+    "Time spent recording request metrics (the middleware's own cost).",
+)
+
+IMPORT_STAGE_DURATION = Histogram(
+    "import_stage_duration_seconds",
+    "Time spent in each import pipeline stage (decode, parse, validate, store).",
+    ("stage",),
+)
+IMPORT_ROWS = Counter(
+    "import_rows_total",
+    "CSV rows processed by the import pipeline, by outcome.",
+    ("csv_type", "outcome"),
+)
+
+ADMISSION_DECISIONS = Counter(
+    "admission_decisions_total",
+    "Admission control outcomes (admitted, admitted_after_queue, rejected_*).",
+    ("pool", "decision"),
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "admission_queue_wait_seconds",
+    "Time admitted requests spent queued for a slot.",
+    ("pool",),
+)
+IMPORTS_RUNNING = Gauge("imports_running", "Imports currently holding a slot.")
+IMPORTS_QUEUED = Gauge("imports_queued", "Imports waiting for a slot.")
+
+CHANGE_FEED_SUBSCRIBERS = Gauge(
+    "change_feed_subscribers", "Clients connected to the change feed."
+)
+CHANGE_FEED_RESYNCS = Counter(
+    "change_feed_resyncs_total",
+    "Resync events sent to change-feed clients that could not be resumed.",
+)
+
+STARTUP_PHASE_DURATION = Gauge(
+    "startup_phase_duration_seconds",
+    "Duration of each startup warm-up phase.",
+    ("phase",),
+)
+APP_READY = Gauge("app_ready", "1 once startup warm-up has finished.")
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """Record the duration of an import pipeline stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        IMPORT_STAGE_DURATION.observe(time.perf_counter() - start, stage)
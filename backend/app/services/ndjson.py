@@ -0,0 +1,38 @@
+"""Streaming NDJSON encoding for list endpoints.
+
+Clients that send `Accept: application/x-ndjson` get one JSON object per
+line, encoded lazily from a generator and flushed in ~CHUNK_BYTES pieces.
+Only one chunk is held at a time, so memory and time to first byte do not
+grow with the result size.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from pydantic import BaseModel
+
+from app.services.po_export import CHUNK_BYTES
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(accept: str | None) -> bool:
+    """True if the Accept header asks for NDJSON."""
+    return accept is not None and NDJSON_MEDIA_TYPE in accept
+
+
+def iter_ndjson(items: Iterable[BaseModel]) -> Iterator[bytes]:
+    """Encode models as NDJSON (camelCase aliases), ~CHUNK_BYTES at a time."""
+    buffer: list[bytes] = []
+    size = 0
+    for item in items:
+        line = item.model_dump_json(by_alias=True).encode() + b"\n"
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
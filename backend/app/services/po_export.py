@@ -0,0 +1,185 @@
+"""Streaming purchase-order export of reorder recommendations.
+
+Rows are encoded one at a time from a generator and handed to the response
+in ~64 KB chunks, so server memory stays flat no matter how many lines the
+export has. The header (CSV) is yielded before any filtering or grouping
+work starts, so the first byte goes out immediately.
+
+Grouped exports walk the store's recommendations in group order from a
+position index built once per store data version (see grouped_order), so
+a request never sorts them itself.
+
+Optional gzip compression runs incrementally over the same chunks.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+
+from app.config import DEFAULT_STORE_ID
+from app.services.seed_data import get_data_version, get_recommendations
+
+EXPORT_FORMATS = ("csv", "ndjson")
+GROUP_BY_FIELDS = ("category", "supplier")
+
+# Flush encoded rows to the client once this many bytes are buffered
+CHUNK_BYTES = 64 * 1024
+
+EXPORT_COLUMNS = [
+    "group",
+    "sku",
+    "name",
+    "category",
+    "supplier",
+    "recommended_order_qty",
+    "unit_cost",
+    "line_cost",
+    "days_left",
+    "reorder_point",
+]
+
+MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# (store_id, group_by) -> (data version, recommendation positions in group order)
+_group_orders: dict[tuple[str, str], tuple[int, array]] = {}
+
+
+def _group(r: dict, group_by: str) -> str:
+    return r[group_by] or "Unassigned"
+
+
+def grouped_order(recs: list[dict], group_by: str, store_id: str) -> array:
+    """Positions of a store's recommendations ordered by group (stable).
+
+    Built once per store data version and shared by every grouped export.
+    `recs` must be the store's current get_recommendations() list.
+    """
+    version = get_data_version(store_id)
+    cached = _group_orders.get((store_id, group_by))
+    if cached is not None and cached[0] == version and len(cached[1]) == len(recs):
+        return cached[1]
+    order = array(
+        "q", sorted(range(len(recs)), key=lambda i: _group(recs[i], group_by))
+    )
+    # Only keep it if the data did not change while it was being built
+    if get_data_version(store_id) == version:
+        _group_orders[(store_id, group_by)] = (version, order)
+    return order
+
+
+def iter_recommendations(
+    group_by: str | None = None, store_id: str = DEFAULT_STORE_ID
+) -> Iterator[dict]:
+    """Lazily yield a store's recommendations, in group order if grouped."""
+    recs = get_recommendations(store_id)
+    if group_by is None:
+        yield from recs
+        return
+    for pos in grouped_order(recs, group_by, store_id):
+        yield recs[pos]
+
+
+def filter_recommendations(
+    recs: Iterable[dict],
+    *,
+    at_risk: bool | None = None,
+    category: str | None = None,
+    supplier: str | None = None,
+    min_order_qty: int = 0,
+) -> Iterator[dict]:
+    """Lazily apply export filters to recommendation dicts."""
+    for r in recs:
+        if at_risk is True and r["days_left"] > 5:
+            continue
+        if category is not None and r["category"] != category:
+            continue
+        if supplier is not None and r["supplier"] != supplier:
+            continue
+        if r["recommended_order_qty"] < min_order_qty:
+            continue
+        yield r
+
+
+def _export_row(r: dict, group_by: str | None) -> dict:
+    qty = r["recommended_order_qty"]
+    return {
+        "group": _group(r, group_by) if group_by else "",
+        "sku": r["sku"],
+        "name": r["name"],
+        "category": r["category"],
+        "supplier": r["supplier"],
+        "recommended_order_qty": qty,
+        "unit_cost": r["unit_cost"],
+        "line_cost": round(qty * r["unit_cost"], 2),
+        "days_left": r["days_left"],
+        "reorder_point": r["reorder_point"],
+    }
+
+
+def _encode_rows(
+    rows: Iterable[dict], fmt: str, group_by: str | None
+) -> Iterator[bytes]:
+    """Encode rows as CSV or NDJSON, yielding ~CHUNK_BYTES at a time.
+
+    Rows are written in the order given; grouped rows must already be in
+    group order (see iter_recommendations).
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if fmt == "csv" else None
+
+    if writer is not None:
+        writer.writerow(EXPORT_COLUMNS)
+        # Send the header right away so the client sees the download start
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    for r in rows:
+        row = _export_row(r, group_by)
+        if writer is not None:
+            writer.writerow(row[c] for c in EXPORT_COLUMNS)
+        else:
+            buffer.write(json.dumps(row, separators=(",", ":")))
+            buffer.write("\n")
+        if buffer.tell() >= CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Gzip a byte stream incrementally, flushing after every chunk."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_export(
+    recs: Iterable[dict],
+    fmt: str = "csv",
+    *,
+    group_by: str | None = None,
+    gzip: bool = False,
+) -> Iterator[bytes]:
+    """Return a byte iterator for a purchase-order export.
+
+    With group_by set, `recs` must already be in group order.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'")
+    if group_by is not None and group_by not in GROUP_BY_FIELDS:
+        raise ValueError(f"Cannot group by '{group_by}'")
+
+    chunks = _encode_rows(recs, fmt, group_by)
+    return _gzip_chunks(chunks) if gzip else chunks
@@ -0,0 +1,167 @@
+"""Opt-in sampling profiler for individual requests.
+
+While a profiled request runs, a background thread snapshots the stack of
+the thread serving it every PROFILE_INTERVAL_MS and folds the samples into
+collapsed-stack format ("frame;frame;frame count" per line), which
+flamegraph.pl, speedscope and inferno read directly.
+
+Only one request is profiled at a time per worker: async endpoints share
+the event loop thread, so overlapping profiles would sample each other.
+Work handed to the threadpool (run_in_threadpool, sync endpoints) runs on
+other threads and is not captured.
+
+Profiles are written to PROFILE_DIR as <id>.collapsed; the most recent
+MAX_PROFILES are kept.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass
+
+from app.config import PROFILE_DIR, PROFILE_INTERVAL_MS
+
+MAX_PROFILES = 50
+# Hard stop so a hung request can't sample forever
+MAX_PROFILE_SECONDS = 60
+
+
+@dataclass
+class ProfileInfo:
+    id: str
+    method: str
+    path: str
+    started_at: float
+    duration_ms: float
+    samples: int
+    path_on_disk: str
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack on a timer until stopped."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter[str]:
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + MAX_PROFILE_SECONDS
+        while not self._stop.wait(self.interval) and time.monotonic() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            frames: list[str] = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            self.stacks[";".join(reversed(frames))] += 1
+
+
+# ---------------------------------------------------------------------------
+# Module state (per worker process)
+# ---------------------------------------------------------------------------
+_sample_rate = 0.0
+_active = threading.Lock()
+_profiles: deque[ProfileInfo] = deque(maxlen=MAX_PROFILES)
+
+
+def get_sample_rate() -> float:
+    return _sample_rate
+
+
+def set_sample_rate(rate: float) -> None:
+    """Profile this fraction of all requests (0 disables sampling)."""
+    global _sample_rate
+    _sample_rate = rate
+
+
+def should_sample() -> bool:
+    return _sample_rate > 0 and random.random() < _sample_rate
+
+
+def try_begin() -> SamplingProfiler | None:
+    """Start profiling the current thread, or None if a profile is running."""
+    if not _active.acquire(blocking=False):
+        return None
+    profiler = SamplingProfiler(threading.get_ident(), PROFILE_INTERVAL_MS / 1000)
+    profiler.start()
+    return profiler
+
+
+def finish(
+    profiler: SamplingProfiler, profile_id: str, method: str, path: str, started: float
+) -> ProfileInfo:
+    """Stop the profiler, write the collapsed stacks and record the profile.
+
+    Does file I/O, so call it off the event loop. The profiling slot is held
+    until the profile is recorded, so two calls never prune concurrently.
+    """
+    try:
+        stacks = profiler.stop()
+        ended = time.time()
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        file_path = os.path.join(PROFILE_DIR, f"{profile_id}.collapsed")
+        with open(file_path, "w", encoding="utf-8") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        if len(_profiles) == _profiles.maxlen:
+            oldest = _profiles[0]
+            try:
+                os.remove(oldest.path_on_disk)
+            except OSError:
+                pass
+
+        info = ProfileInfo(
+            id=profile_id,
+            method=method,
+            path=path,
+            started_at=started,
+            duration_ms=round((ended - started) * 1000, 2),
+            samples=sum(stacks.values()),
+            path_on_disk=file_path,
+        )
+        _profiles.append(info)
+        return info
+    finally:
+        _active.release()
+
+
+def new_profile_id() -> str:
+    return f"prof-{uuid.uuid4().hex[:12]}"
+
+
+def list_profiles() -> list[ProfileInfo]:
+    """Most recent profiles first."""
+    return list(reversed(_profiles))
+
+
+def get_profile(profile_id: str) -> ProfileInfo | None:
+    for info in _profiles:
+        if info.id == profile_id:
+            return info
+    return None
@@ -0,0 +1,66 @@
+"""Pre-serialized JSON bodies for hot read endpoints.
+
+Bodies are cached per store, keyed by endpoint + query parameters and
+tagged with the store's data version (seed_data.get_data_version), so an
+upload implicitly invalidates that store's bodies and no other store's: a
+stale entry is simply rebuilt on the next request. Cross-store bodies
+(the dashboard rollup) use cached_rollup_json and the rollup version.
+Startup warm-up fills the default store's entries before /readyz reports
+ready.
+
+Only the most recently used MAX_CACHED_STORES stores keep bodies, so
+memory stays bounded with hundreds of stores.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+
+from app.config import DEFAULT_STORE_ID
+from app.services.seed_data import get_data_version, get_rollup_version
+
+# Distinct parameter combinations kept per store and data version; cleared when full
+MAX_ENTRIES = 128
+# Stores whose bodies are kept (least recently used are dropped)
+MAX_CACHED_STORES = 64
+# Scope used for cross-store bodies (not a valid store id)
+ROLLUP_SCOPE = "*"
+
+# scope -> (data version, key -> body)
+_scopes: OrderedDict[str, tuple[int, dict[str, bytes]]] = OrderedDict()
+
+
+def _cached(
+    scope: str, version: Callable[[], int], key: str, build: Callable[[], bytes]
+) -> bytes:
+    current = version()
+    entry = _scopes.get(scope)
+    if entry is None or entry[0] != current:
+        entry = _scopes[scope] = (current, {})
+        while len(_scopes) > MAX_CACHED_STORES:
+            _scopes.popitem(last=False)
+    else:
+        _scopes.move_to_end(scope)
+    bodies = entry[1]
+    body = bodies.get(key)
+    if body is None:
+        body = build()
+        if len(bodies) >= MAX_ENTRIES:
+            bodies.clear()
+        # Only keep it if no upload landed while it was being built
+        if version() == current:
+            bodies[key] = body
+    return body
+
+
+def cached_json(
+    key: str, build: Callable[[], bytes], store_id: str = DEFAULT_STORE_ID
+) -> bytes:
+    """Return a store's cached body for `key`, building it if missing or stale."""
+    return _cached(store_id, lambda: get_data_version(store_id), key, build)
+
+
+def cached_rollup_json(key: str, build: Callable[[], bytes]) -> bytes:
+    """Return a cross-store body for `key`, rebuilt after any store changes."""
+    return _cached(ROLLUP_SCOPE, get_rollup_version, key, build)
@@ -3,46 +3,347 @@
 The seed products mirror the frontend mockAtRiskProducts so the dashboard
 renders identically whether data comes from the API or the client fallback.
 
+Uploaded data is partitioned by store (StorePartition): each store has its
+own rows, derived views, SKU indexes, metric totals and data version, so an
+upload only invalidates the store it was made to. Requests that don't name
+a store use DEFAULT_STORE_ID, which serves the seed data until it has its
+own uploads. A cross-store dashboard rollup is kept up to date from the
+per-store totals (get_rollup_metrics).
+
 TODO: Replace all functions in this module with database queries
       when DB is connected (Phase 1, Step 6).
 """
 
 from __future__ import annotations
 
+import math
+import threading
+
+from app.config import DEFAULT_STORE_ID
+from app.services.demand_store import (
+    DemandSeries,
+    build_velocity_index,
+    get_series,
+    ingest_sales_rows,
+    latest_demand_day,
+    rebuild_demand,
+    replace_demand,
+)
+from app.services.lead_times import resolve_lead_time
+from app.services.snapshots import save_snapshot
+
 # Total SKUs in the fictional catalog (shown on the "Total SKUs" metric card).
 # The at-risk table only shows the 6 products below.
 SEED_TOTAL_SKUS = 847
 
+# Trailing window (days) used to measure per-SKU sales velocity
+VELOCITY_WINDOW_DAYS = 28
+# Extra days of demand each reorder should cover beyond lead time + safety stock
+REVIEW_PERIOD_DAYS = 28
+# Reported days_until_stockout for SKUs with no recent sales
+MAX_DAYS_UNTIL_STOCKOUT = 365
+# Weeks of demand held as safety stock (same factor as the seed recommendations)
+SAFETY_STOCK_WEEKS = 1.5
+
 # ---------------------------------------------------------------------------
-# Temporary in-memory store for uploaded CSV data.
-# Keyed by csv_type ("inventory_snapshot", "sales_history").
-# Data is lost on server restart.
+# Temporary in-memory store for uploaded CSV data, one partition per store.
+# Data is lost on server restart unless UPLOAD_PERSIST_DIR is set.
 # TODO: Replace with database persistence (Phase 1, Step 6).
 # ---------------------------------------------------------------------------
-_uploaded_store: dict[str, list[dict]] = {}
-
 
-def store_uploaded_rows(csv_type: str, rows: list[dict]) -> None:
-    """Save validated rows in memory. Overwrites previous upload of same type."""
-    _uploaded_store[csv_type] = rows
 
-
-def get_uploaded_rows(csv_type: str) -> list[dict] | None:
-    """Return uploaded rows for a csv_type, or None if nothing was uploaded."""
-    rows = _uploaded_store.get(csv_type)
+class StorePartition:
+    """One store's uploaded rows and the views derived from them."""
+
+    __slots__ = (
+        "store_id",
+        "uploaded",
+        "products",
+        "products_index",
+        "recommendations",
+        "recommendations_index",
+        "reorder_cost",
+        "version",
+        "inventory_positions",
+        "unsaved",
+    )
+
+    def __init__(self, store_id: str) -> None:
+        self.store_id = store_id
+        # Keyed by csv_type ("inventory_snapshot", "sales_history")
+        self.uploaded: dict[str, list[dict]] = {}
+        # Derived views, built lazily once per upload and dropped whenever
+        # either csv_type is replaced
+        self.products: list[dict] | None = None
+        self.products_index: dict[str, dict] | None = None
+        self.recommendations: list[dict] | None = None
+        self.recommendations_index: dict[str, dict] | None = None
+        # sum(recommended_qty * unit_cost) over `products`, kept in step with it
+        self.reorder_cost: float | None = None
+        # Bumped on every change; this store's cached bodies are tagged with it
+        self.version = 0
+        # SKU -> position of its row in the uploaded inventory (first
+        # occurrence), for streamed upserts. Dropped on a full inventory upload.
+        self.inventory_positions: dict[str, int] | None = None
+        # csv_types changed by streamed events since they were last snapshotted
+        self.unsaved: set[str] = set()
+
+
+_partitions: dict[str, StorePartition] = {}
+
+# Cross-store dashboard rollup: running totals plus each store's last
+# contribution. Stores changed since the last read are in _rollup_dirty and
+# are re-applied (old contribution out, new in) on the next read.
+_rollup_totals: dict[str, float] = {
+    "total_skus": 0,
+    "at_risk_skus": 0,
+    "reorder_cost": 0.0,
+}
+_rollup_parts: dict[str, dict[str, float]] = {}
+_rollup_dirty: set[str] = set()
+# Bumped on every change to any store (tags cached rollup bodies)
+_rollup_version = 0
+
+
+def _get(store_id: str) -> StorePartition | None:
+    return _partitions.get(store_id)
+
+
+def _partition(store_id: str) -> StorePartition:
+    partition = _partitions.get(store_id)
+    if partition is None:
+        partition = _partitions[store_id] = StorePartition(store_id)
+    return partition
+
+
+def store_exists(store_id: str) -> bool:
+    """True for the default store and any store that has received data."""
+    return store_id == DEFAULT_STORE_ID or store_id in _partitions
+
+
+def get_store_ids() -> list[str]:
+    """Return the ids of every store that has received data."""
+    return sorted(_partitions)
+
+
+def get_data_version(store_id: str = DEFAULT_STORE_ID) -> int:
+    """Return a counter that changes whenever a store's data changes."""
+    partition = _get(store_id)
+    return partition.version if partition is not None else 0
+
+
+def get_rollup_version() -> int:
+    """Return a counter that changes whenever any store's data changes."""
+    return _rollup_version
+
+
+def _mark_changed(partition: StorePartition) -> None:
+    global _rollup_version
+    partition.version += 1
+    _rollup_version += 1
+    _rollup_dirty.add(partition.store_id)
+
+
+def _invalidate_views(partition: StorePartition) -> None:
+    partition.products = None
+    partition.products_index = None
+    partition.recommendations = None
+    partition.recommendations_index = None
+    partition.reorder_cost = None
+    _mark_changed(partition)
+
+
+def store_uploaded_rows(
+    csv_type: str,
+    rows: list[dict],
+    *,
+    store_id: str = DEFAULT_STORE_ID,
+    persist: bool = True,
+    demand: dict[str, DemandSeries] | None = None,
+) -> None:
+    """Save validated rows in memory. Overwrites the store's previous upload
+    of the same type.
+
+    sales_history uploads also rebuild the store's daily demand series;
+    pass `demand` (demand_store.build_demand over the same rows, built off
+    the event loop) to swap it in instead. With persist (the default), rows
+    are also snapshotted to UPLOAD_PERSIST_DIR when it is configured;
+    endpoints pass persist=False and call persist_uploaded_rows from a
+    worker thread.
+    """
+    partition = _partition(store_id)
+    if persist:
+        save_snapshot(csv_type, rows, store_id)
+        partition.unsaved.discard(csv_type)
+    partition.uploaded[csv_type] = rows
+    if csv_type == "sales_history":
+        if demand is not None:
+            replace_demand(demand, store_id)
+        else:
+            rebuild_demand(rows, store_id)
+    else:
+        partition.inventory_positions = None
+    _invalidate_views(partition)
+
+
+# Serializes snapshot writes from worker threads
+_persist_lock = threading.Lock()
+
+
+def persist_uploaded_rows(csv_type: str, rows: list[dict], store_id: str) -> None:
+    """Snapshot rows stored with store_uploaded_rows(persist=False).
+
+    Safe to call from a worker thread. Skipped if a later upload of the
+    same csv_type has replaced `rows` (that upload writes its own), so
+    snapshots never go back in time when two uploads finish out of order.
+    """
+    with _persist_lock:
+        partition = _get(store_id)
+        if partition is None or partition.uploaded.get(csv_type) is not rows:
+            return
+        count = len(rows)
+        save_snapshot(csv_type, rows, store_id)
+        # Streamed events may have been appended meanwhile
+        if len(rows) == count:
+            partition.unsaved.discard(csv_type)
+
+
+def _positions(partition: StorePartition, rows: list[dict]) -> dict[str, int]:
+    if partition.inventory_positions is None:
+        positions: dict[str, int] = {}
+        for i, row in enumerate(rows):
+            positions.setdefault((row.get("sku") or "").strip(), i)
+        partition.inventory_positions = positions
+    return partition.inventory_positions
+
+
+def apply_stream_batch(
+    sales: list[dict], inventory: list[dict], store_id: str = DEFAULT_STORE_ID
+) -> set[str]:
+    """Apply a micro-batch of streamed events without a full rebuild.
+
+    Sales rows are appended and added to the demand store; inventory rows
+    are upserted by SKU. When the store's views are already built and its
+    demand "as of" day has not moved, only the touched SKUs' products and
+    recommendations are recomputed; otherwise the views are dropped and
+    rebuilt on next read. Returns the SKUs touched.
+
+    A batch with no accepted rows changes nothing (and creates no store).
+    """
+    if not sales and not inventory:
+        return set()
+    partition = _partition(store_id)
+    had_sales = get_uploaded_rows("sales_history", store_id) is not None
+    as_of = latest_demand_day(store_id)
+    touched: set[str] = set()
+
+    if sales:
+        partition.uploaded.setdefault("sales_history", []).extend(sales)
+        touched |= ingest_sales_rows(sales, store_id)
+        partition.unsaved.add("sales_history")
+
+    if inventory:
+        rows = partition.uploaded.setdefault("inventory_snapshot", [])
+        positions = _positions(partition, rows)
+        for row in inventory:
+            sku = row["sku"]
+            pos = positions.get(sku)
+            if pos is None:
+                positions[sku] = len(rows)
+                rows.append(row)
+            else:
+                rows[pos] = row
+            touched.add(sku)
+        partition.unsaved.add("inventory_snapshot")
+
+    if not touched:
+        return touched
+    if (
+        partition.products is not None
+        and (had_sales or not sales)
+        and latest_demand_day(store_id) == as_of
+    ):
+        _refresh_skus(partition, touched)
+        _mark_changed(partition)
+    else:
+        _invalidate_views(partition)
+    return touched
+
+
+def _refresh_skus(partition: StorePartition, skus: set[str]) -> None:
+    """Recompute a store's cached products/recommendations for `skus` in place."""
+    store_id = partition.store_id
+    rows = partition.uploaded["inventory_snapshot"]
+    positions = _positions(partition, rows)
+    velocity = None
+    if get_uploaded_rows("sales_history", store_id) is not None:
+        # Same figures build_velocity_index would give, for these SKUs only
+        as_of = latest_demand_day(store_id)
+        velocity = {}
+        for sku in skus:
+            series = get_series(sku, store_id)
+            if series is not None and as_of is not None:
+                velocity[sku] = series.rolling_mean(VELOCITY_WINDOW_DAYS, as_of)
+
+    products = partition.products
+    recommendations = partition.recommendations
+    # Ascending so rows appended by this batch extend the views in order
+    for pos in sorted(positions[sku] for sku in skus if sku in positions):
+        product = _normalize_uploaded_row(rows[pos], pos, velocity)
+        partition.reorder_cost += product["recommended_qty"] * product["unit_cost"]
+        if pos == len(products):
+            products.append(product)
+        else:
+            old = products[pos]
+            partition.reorder_cost -= old["recommended_qty"] * old["unit_cost"]
+            products[pos] = product
+        partition.products_index[product["sku"]] = product
+        if recommendations is not None:
+            rec = _build_recommendation(product)
+            if pos == len(recommendations):
+                recommendations.append(rec)
+            else:
+                recommendations[pos] = rec
+            partition.recommendations_index[rec["sku"]] = rec
+
+
+def flush_snapshots() -> None:
+    """Snapshot csv_types changed by streamed events (called at shutdown)."""
+    for partition in list(_partitions.values()):
+        for csv_type in sorted(partition.unsaved):
+            save_snapshot(csv_type, partition.uploaded[csv_type], partition.store_id)
+        partition.unsaved.clear()
+
+
+def get_uploaded_rows(
+    csv_type: str, store_id: str = DEFAULT_STORE_ID
+) -> list[dict] | None:
+    """Return a store's uploaded rows for a csv_type, or None if none were uploaded."""
+    partition = _get(store_id)
+    if partition is None:
+        return None
+    rows = partition.uploaded.get(csv_type)
     return rows if rows else None
 
 
-def _normalize_uploaded_row(row: dict, index: int) -> dict:
+def _normalize_uploaded_row(
+    row: dict, index: int, velocity: dict[str, float] | None
+) -> dict:
     """Convert a raw uploaded inventory_snapshot row dict into the product
     dict format that the rest of the codebase expects.
 
-    Applies the same placeholder heuristics as the frontend for computed
-    fields (days_until_stockout, lead_time_days, recommended_qty).
+    `velocity` maps SKU -> average daily units sold (built once per upload
+    from sales_history). Computed fields come from that join:
+    - days_until_stockout = available / avg_daily_demand
+    - reorder_point = lead_time_demand + safety_stock
+    - recommended_qty tops stock up to reorder_point plus one review period
+    When no sales_history has been uploaded (velocity is None), the frontend
+    placeholder heuristics are used instead.
     """
     sku = (row.get("sku") or "").strip() or f"ROW-{index + 1}"
     name = (row.get("name") or "").strip() or sku
     category = (row.get("category") or "").strip() or "Uncategorized"
+    supplier = (row.get("supplier") or "").strip()
 
     try:
         available = int(row.get("available", 0))
@@ -54,10 +355,27 @@ def _normalize_uploaded_row(row: dict, index: int) -> dict:
     except (ValueError, TypeError):
         unit_cost = 0.0
 
-    # Placeholder heuristics (same as frontend transformUploadedData)
-    days_until_stockout = 3 if available <= 5 else 7
-    lead_time_days = 14
-    recommended_qty = max(0, 50 - available)
+    lead_time_days = resolve_lead_time(row, sku, category)
+
+    if velocity is None:
+        # Placeholder heuristics (same as frontend transformUploadedData)
+        avg_daily_demand = None
+        days_until_stockout = 3 if available <= 5 else 7
+        recommended_qty = max(0, 50 - available)
+        lead_time_demand = safety_stock = reorder_point = None
+    else:
+        avg_daily_demand = velocity.get(sku, 0.0)
+        if avg_daily_demand > 0:
+            days_until_stockout = min(
+                MAX_DAYS_UNTIL_STOCKOUT, int(available / avg_daily_demand)
+            )
+        else:
+            days_until_stockout = MAX_DAYS_UNTIL_STOCKOUT
+        lead_time_demand = avg_daily_demand * lead_time_days
+        safety_stock = avg_daily_demand * 7 * SAFETY_STOCK_WEEKS
+        reorder_point = lead_time_demand + safety_stock
+        target_stock = reorder_point + avg_daily_demand * REVIEW_PERIOD_DAYS
+        recommended_qty = max(0, math.ceil(target_stock - available))
 
     return {
         "id": sku,
@@ -69,9 +387,27 @@ def _normalize_uploaded_row(row: dict, index: int) -> dict:
         "lead_time_days": lead_time_days,
         "recommended_qty": recommended_qty,
         "unit_cost": unit_cost,
+        # Internal fields used to build recommendations (not part of Product)
+        "supplier": supplier,
+        "avg_daily_demand": avg_daily_demand,
+        "lead_time_demand": lead_time_demand,
+        "safety_stock": safety_stock,
+        "reorder_point": reorder_point,
     }
 
 
+def _build_uploaded_products(uploaded: list[dict], store_id: str) -> list[dict]:
+    """Join inventory rows to sales velocity in one pass (hash join on SKU).
+
+    The velocity index is built once here rather than per row, so the whole
+    view is O(inventory rows + sales SKUs).
+    """
+    velocity = None
+    if get_uploaded_rows("sales_history", store_id) is not None:
+        velocity = build_velocity_index(VELOCITY_WINDOW_DAYS, store_id)
+    return [_normalize_uploaded_row(row, i, velocity) for i, row in enumerate(uploaded)]
+
+
 SEED_PRODUCTS: list[dict] = [
     {
         "id": "1",
@@ -142,85 +478,226 @@ SEED_PRODUCTS: list[dict] = [
 ]
 
 
-def get_products() -> list[dict]:
-    """Return products: uploaded inventory data if available, else seed data.
+def _uploaded_products(store_id: str) -> list[dict] | None:
+    """Return a store's cached uploaded product view, building it if needed."""
+    uploaded = get_uploaded_rows("inventory_snapshot", store_id)
+    if uploaded is None:
+        return None
+    partition = _partitions[store_id]
+    if partition.products is None:
+        products = _build_uploaded_products(uploaded, store_id)
+        index: dict[str, dict] = {}
+        for p in products:
+            index.setdefault(p["sku"], p)
+        # Index first: readers check the cache, then use the index, and
+        # warm-up builds these on a thread while requests are served
+        partition.reorder_cost = sum(
+            p["recommended_qty"] * p["unit_cost"] for p in products
+        )
+        partition.products_index = index
+        partition.products = products
+    return partition.products
+
+
+def get_products(store_id: str = DEFAULT_STORE_ID) -> list[dict]:
+    """Return a store's products: uploaded inventory data if available.
 
+    The default store falls back to seed data; other stores have none.
     TODO: Replace with database query (Phase 1, Step 6).
     """
-    uploaded = get_uploaded_rows("inventory_snapshot")
+    uploaded = _uploaded_products(store_id)
     if uploaded is not None:
-        return [_normalize_uploaded_row(row, i) for i, row in enumerate(uploaded)]
-    return list(SEED_PRODUCTS)
+        return list(uploaded)
+    if store_id == DEFAULT_STORE_ID:
+        return list(SEED_PRODUCTS)
+    return []
 
 
-def get_total_skus() -> int:
-    """Return the total SKU count.
+def get_total_skus(store_id: str = DEFAULT_STORE_ID) -> int:
+    """Return a store's total SKU count.
 
     Uses actual uploaded row count when uploaded data exists,
-    otherwise returns the hardcoded seed catalog size.
+    otherwise the default store returns the hardcoded seed catalog size.
     """
-    uploaded = get_uploaded_rows("inventory_snapshot")
+    uploaded = get_uploaded_rows("inventory_snapshot", store_id)
     if uploaded is not None:
         return len(uploaded)
-    return SEED_TOTAL_SKUS
+    return SEED_TOTAL_SKUS if store_id == DEFAULT_STORE_ID else 0
+
+
+def get_dashboard_metrics(store_id: str = DEFAULT_STORE_ID) -> dict[str, float]:
+    """Return the dashboard metric card values for a store's current data.
+
+    Same formulas the frontend uses for its metric cards. Uploaded stores
+    read their running reorder cost total instead of re-summing products.
+    """
+    products = _uploaded_products(store_id)
+    reorder_cost = None
+    if products is not None:
+        reorder_cost = _partitions[store_id].reorder_cost
+    if reorder_cost is None:
+        products = get_products(store_id)
+        reorder_cost = sum(p["recommended_qty"] * p["unit_cost"] for p in products)
+    return {
+        "total_skus": get_total_skus(store_id),
+        "at_risk_skus": len(products),
+        "reorder_cost": reorder_cost,
+        "potential_revenue": reorder_cost * 2.5,  # ~2.5x markup for retail
+    }
 
 
-def get_product_by_id(product_id: str) -> dict | None:
+def get_rollup_metrics() -> tuple[dict[str, float], dict[str, dict[str, float]]]:
+    """Return (cross-store totals, store_id -> that store's metrics).
+
+    Covers stores with uploaded inventory. Only stores changed since the
+    last call are re-read, so the cost is O(changed stores), not O(stores).
+    """
+    while _rollup_dirty:
+        store_id = _rollup_dirty.pop()
+        old = _rollup_parts.pop(store_id, None)
+        if old is not None:
+            for key in _rollup_totals:
+                _rollup_totals[key] -= old[key]
+        if get_uploaded_rows("inventory_snapshot", store_id) is None:
+            continue
+        new = get_dashboard_metrics(store_id)
+        for key in _rollup_totals:
+            _rollup_totals[key] += new[key]
+        _rollup_parts[store_id] = new
+
+    totals = dict(_rollup_totals)
+    totals["potential_revenue"] = totals["reorder_cost"] * 2.5
+    return totals, dict(_rollup_parts)
+
+
+def get_product_by_id(product_id: str, store_id: str = DEFAULT_STORE_ID) -> dict | None:
     """Return a single product by id or sku, or None if not found.
 
-    Searches uploaded data first, then seed data.
+    Searches the store's uploaded data first, then (default store) seed data.
     TODO: Replace with database query (Phase 1, Step 6).
     """
-    for p in get_products():
+    if _uploaded_products(store_id) is not None:
+        # Uploaded products use the SKU as their id
+        p = _partitions[store_id].products_index.get(product_id)
+        return dict(p) if p is not None else None
+    if store_id != DEFAULT_STORE_ID:
+        return None
+    for p in SEED_PRODUCTS:
         if p["id"] == product_id or p["sku"] == product_id:
             return dict(p)
     return None
 
 
-def get_seed_recommendations() -> list[dict]:
-    """Generate recommendation objects from seed products.
+def _build_recommendation(p: dict) -> dict:
+    """Build a recommendation dict from a product dict.
 
-    Uses the same placeholder heuristics as the frontend:
+    Products joined to sales velocity use the real demand figures.
+    Otherwise falls back to the same placeholder heuristics as the frontend:
     - avg_weekly_demand and lead_time_demand are rough estimates
     - safety_stock = avg_weekly_demand * 1.5
     - reorder_point = lead_time_demand + safety_stock
     """
-    # TODO: Replace with database query (Phase 1, Step 6)
-    recs = []
-    for p in SEED_PRODUCTS:
-        available = p["available"]
-        lead_time_days = p["lead_time_days"]
-        recommended_qty = p["recommended_qty"]
-        unit_cost = p["unit_cost"]
-        days_until_stockout = p["days_until_stockout"]
-
+    available = p["available"]
+    lead_time_days = p["lead_time_days"]
+    recommended_qty = p["recommended_qty"]
+    unit_cost = p["unit_cost"]
+    days_until_stockout = p["days_until_stockout"]
+    avg_daily_demand = p.get("avg_daily_demand")
+
+    if avg_daily_demand is None:
         # Rough heuristic: pretend weekly demand ~ recommended_qty / 4
         avg_weekly_demand = round(recommended_qty / 4, 1)
         lead_time_demand = round(avg_weekly_demand * (lead_time_days / 7), 1)
-        safety_stock = round(avg_weekly_demand * 1.5, 1)
+        safety_stock = round(avg_weekly_demand * SAFETY_STOCK_WEEKS, 1)
         reorder_point = round(lead_time_demand + safety_stock, 1)
-
-        recs.append(
-            {
-                "id": f"rec-{p['id']}",
-                "product_id": p["id"],
-                "sku": p["sku"],
-                "name": p["name"],
-                "avg_weekly_demand": avg_weekly_demand,
-                "lead_time_demand": lead_time_demand,
-                "safety_stock": safety_stock,
-                "reorder_point": reorder_point,
-                "recommended_order_qty": recommended_qty,
-                "days_left": days_until_stockout,
-                "unit_cost": unit_cost,
-                "explanation": {
-                    "summary": (
-                        f"{p['name']} has {available} units on hand with "
-                        f"~{days_until_stockout} days until stockout. "
-                        f"Lead time is {lead_time_days} days."
-                    ),
-                    "method": "placeholder_heuristic",
-                },
-            }
+        method = "placeholder_heuristic"
+        summary = (
+            f"{p['name']} has {available} units on hand with "
+            f"~{days_until_stockout} days until stockout. "
+            f"Lead time is {lead_time_days} days."
+        )
+    else:
+        avg_weekly_demand = round(avg_daily_demand * 7, 1)
+        lead_time_demand = round(p["lead_time_demand"], 1)
+        safety_stock = round(p["safety_stock"], 1)
+        reorder_point = round(p["reorder_point"], 1)
+        method = "sales_velocity"
+        summary = (
+            f"{p['name']} sells ~{avg_weekly_demand} units/week "
+            f"(last {VELOCITY_WINDOW_DAYS} days) and has {available} units on "
+            f"hand, ~{days_until_stockout} days until stockout. "
+            f"Lead time is {lead_time_days} days."
         )
-    return recs
+
+    return {
+        "id": f"rec-{p['id']}",
+        "product_id": p["id"],
+        "sku": p["sku"],
+        "name": p["name"],
+        # category/supplier are used for export grouping (not part of the model)
+        "category": p["category"],
+        "supplier": p.get("supplier", ""),
+        "avg_weekly_demand": avg_weekly_demand,
+        "lead_time_demand": lead_time_demand,
+        "safety_stock": safety_stock,
+        "reorder_point": reorder_point,
+        "recommended_order_qty": recommended_qty,
+        "days_left": days_until_stockout,
+        "unit_cost": unit_cost,
+        "explanation": {"summary": summary, "method": method},
+    }
+
+
+def get_seed_recommendations() -> list[dict]:
+    """Generate recommendation objects from seed products."""
+    # TODO: Replace with database query (Phase 1, Step 6)
+    return [_build_recommendation(p) for p in SEED_PRODUCTS]
+
+
+def get_recommendations(store_id: str = DEFAULT_STORE_ID) -> list[dict]:
+    """Return a store's recommendations for uploaded products if available.
+
+    Built once per upload and cached alongside the product view. The
+    default store falls back to seed recommendations.
+    TODO: Replace with database query (Phase 1, Step 6).
+    """
+    uploaded = _uploaded_recommendations(store_id)
+    if uploaded is not None:
+        return list(uploaded)
+    if store_id == DEFAULT_STORE_ID:
+        return get_seed_recommendations()
+    return []
+
+
+def _uploaded_recommendations(store_id: str) -> list[dict] | None:
+    """Return a store's cached uploaded recommendations, building them if needed."""
+    products = _uploaded_products(store_id)
+    if products is None:
+        return None
+    partition = _partitions[store_id]
+    if partition.recommendations is None:
+        recommendations = [_build_recommendation(p) for p in products]
+        index: dict[str, dict] = {}
+        for r in recommendations:
+            index.setdefault(r["sku"], r)
+        partition.recommendations_index = index
+        partition.recommendations = recommendations
+    return partition.recommendations
+
+
+def get_recommendation_by_id(
+    product_id: str, store_id: str = DEFAULT_STORE_ID
+) -> dict | None:
+    """Return the recommendation for a product id or sku, or None.
+
+    TODO: Replace with database query (Phase 1, Step 6).
+    """
+    if _uploaded_recommendations(store_id) is not None:
+        r = _partitions[store_id].recommendations_index.get(product_id)
+        return dict(r) if r is not None else None
+    if store_id != DEFAULT_STORE_ID:
+        return None
+    for r in get_seed_recommendations():
+        if r["product_id"] == product_id or r["sku"] == product_id:
+            return r
+    return None
@@ -0,0 +1,90 @@
+"""Optional on-disk snapshots of uploaded CSV data.
+
+When UPLOAD_PERSIST_DIR is set, every accepted upload is written there and
+reloaded at startup, so a restart or redeploy does not drop the uploaded
+catalog. The default store's files are <csv_type>.json (the layout from
+before stores existed); other stores use
+stores/<store_id>/<csv_type>.json. Files are written to a temp name and
+renamed, so a crash mid-write never leaves a truncated snapshot behind.
+
+Snapshots hold the validated rows exactly as stored in memory (a JSON
+array of objects), so loading skips CSV parsing and validation entirely.
+
+TODO: Remove once uploads are persisted to the database (Phase 1, Step 6).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+
+from app.config import DEFAULT_STORE_ID, UPLOAD_PERSIST_DIR
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TYPES = ("inventory_snapshot", "sales_history")
+STORES_DIR = "stores"
+
+# Store ids are used as directory names, so they are restricted to this
+STORE_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,63}")
+
+
+def _store_dir(store_id: str) -> str:
+    if store_id == DEFAULT_STORE_ID:
+        return UPLOAD_PERSIST_DIR
+    if not STORE_ID_PATTERN.fullmatch(store_id):
+        raise ValueError(f"Invalid store id '{store_id}'")
+    return os.path.join(UPLOAD_PERSIST_DIR, STORES_DIR, store_id)
+
+
+def save_snapshot(
+    csv_type: str, rows: list[dict], store_id: str = DEFAULT_STORE_ID
+) -> None:
+    """Write a store's rows for a csv_type (no-op when UPLOAD_PERSIST_DIR is unset)."""
+    if not UPLOAD_PERSIST_DIR:
+        return
+    directory = _store_dir(store_id)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{csv_type}.json")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(rows, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _load_store(directory: str) -> dict[str, list[dict]]:
+    loaded: dict[str, list[dict]] = {}
+    for csv_type in SNAPSHOT_TYPES:
+        path = os.path.join(directory, f"{csv_type}.json")
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                rows = json.load(f)
+        except (OSError, ValueError):
+            logger.exception("Skipping unreadable snapshot %s", path)
+            continue
+        if isinstance(rows, list) and rows:
+            loaded[csv_type] = rows
+    return loaded
+
+
+def load_snapshots() -> dict[str, dict[str, list[dict]]]:
+    """Read every persisted store -> csv_type -> rows. Unreadable files are skipped."""
+    if not UPLOAD_PERSIST_DIR:
+        return {}
+    stores: dict[str, dict[str, list[dict]]] = {}
+    default = _load_store(UPLOAD_PERSIST_DIR)
+    if default:
+        stores[DEFAULT_STORE_ID] = default
+    stores_root = os.path.join(UPLOAD_PERSIST_DIR, STORES_DIR)
+    if os.path.isdir(stores_root):
+        for store_id in sorted(os.listdir(stores_root)):
+            if store_id == DEFAULT_STORE_ID or not STORE_ID_PATTERN.fullmatch(store_id):
+                continue
+            loaded = _load_store(os.path.join(stores_root, store_id))
+            if loaded:
+                stores[store_id] = loaded
+    return stores
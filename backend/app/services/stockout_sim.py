@@ -0,0 +1,208 @@
+"""Monte Carlo stockout-risk simulation over supplier lead time.
+
+For each SKU, demand over its lead time is sampled `trials` times and
+compared against stock on hand, both as-is and after the recommended order
+arrives. Two demand sources:
+
+  - empirical: bootstrap from the SKU's historical lead-time-length demand
+    windows (trailing EMPIRICAL_LOOKBACK_DAYS of sales_history). Sampling
+    whole windows keeps weekly patterns and demand bursts intact.
+  - forecast: Poisson demand with mean = forecast daily rate x lead time
+    (the same moving-average velocity the recommendations use).
+
+SKUs without enough history for the empirical source fall back to the
+forecast source.
+
+All SKUs are simulated together as (SKU x trial) matrices in batches, and
+batches run on a thread pool of SIMULATION_WORKERS threads (numpy
+releases the GIL for the heavy work; defaults to all cores), so the whole simulation is a
+handful of array ops per batch rather than a Python loop per trial.
+Batches are sized from `trials` so each matrix stays within
+BATCH_MATRIX_BYTES: a worker holds a few of them at once, so a single
+request peaks at roughly SIMULATION_WORKERS x 5 x BATCH_MATRIX_BYTES
+whatever the trial count (lower SIMULATION_WORKERS to trade speed for
+memory).
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.config import DEFAULT_STORE_ID, SIMULATION_WORKERS
+from app.services.demand_store import get_series, latest_demand_day
+
+SOURCES = ("empirical", "forecast")
+
+# History used to build empirical lead-time demand windows
+EMPIRICAL_LOOKBACK_DAYS = 365
+# Need at least this many distinct windows to bootstrap from history
+MIN_EMPIRICAL_WINDOWS = 14
+
+# Upper bound on SKUs per batch (reached with small trial counts)
+BATCH_SKUS = 256
+# Size of one (SKU x trial) 8-byte matrix in a batch
+BATCH_MATRIX_BYTES = 4 * 1024 * 1024
+MAX_TRIALS = 20_000
+
+
+@dataclass
+class SkuRiskInput:
+    sku: str
+    on_hand: int
+    recommended_qty: int
+    lead_time_days: int
+    daily_rate: float
+
+
+@dataclass
+class SkuRisk:
+    sku: str
+    source: str
+    on_hand: int
+    recommended_qty: int
+    lead_time_days: int
+    mean_lead_time_demand: float
+    stockout_probability: float
+    expected_lost_units: float
+    stockout_probability_after_order: float
+    expected_lost_units_after_order: float
+    service_level_order_qty: int
+
+
+def _empirical_windows(
+    sku: str, lead_time: int, as_of: int | None, store_id: str
+) -> np.ndarray | None:
+    """Demand totals of every lead-time-length window in the lookback period."""
+    series = get_series(sku, store_id)
+    if series is None or as_of is None:
+        return None
+    first = max(series.start, as_of - EMPIRICAL_LOOKBACK_DAYS + 1)
+    # Days after the SKU's last sale (up to as_of) count as zero demand
+    daily = np.zeros(as_of - first + 1, dtype=np.int64)
+    lo, hi = first - series.start, min(as_of, series.end) - series.start
+    if hi >= lo:
+        daily[: hi - lo + 1] = np.frombuffer(series.daily, dtype=np.int64)[lo : hi + 1]
+    if len(daily) - lead_time + 1 < MIN_EMPIRICAL_WINDOWS:
+        return None
+    prefix = np.concatenate(([0], np.cumsum(daily)))
+    return prefix[lead_time:] - prefix[:-lead_time]
+
+
+def _batch_size(trials: int) -> int:
+    """SKUs per batch so one (SKU x trial) matrix fits BATCH_MATRIX_BYTES."""
+    return max(1, min(BATCH_SKUS, BATCH_MATRIX_BYTES // (8 * trials)))
+
+
+def _simulate_batch(
+    batch: list[SkuRiskInput],
+    windows: list[np.ndarray | None],
+    trials: int,
+    service_level: float,
+    seed: np.random.SeedSequence,
+) -> list[SkuRisk]:
+    rng = np.random.default_rng(seed)
+    demand = np.empty((len(batch), trials), dtype=np.int64)
+
+    empirical_rows = [i for i, w in enumerate(windows) if w is not None]
+    forecast_rows = [i for i, w in enumerate(windows) if w is None]
+
+    if forecast_rows:
+        lam = np.array(
+            [batch[i].daily_rate * batch[i].lead_time_days for i in forecast_rows]
+        )
+        demand[forecast_rows] = rng.poisson(lam[:, None], size=(len(lam), trials))
+
+    if empirical_rows:
+        # Ragged windows packed flat; sample offset + floor(u * count) per row
+        flat = np.concatenate([windows[i] for i in empirical_rows])
+        counts = np.array([len(windows[i]) for i in empirical_rows])
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        picks = (rng.random((len(empirical_rows), trials)) * counts[:, None]).astype(
+            np.int64
+        )
+        demand[empirical_rows] = flat[offsets[:, None] + picks]
+
+    on_hand = np.array([s.on_hand for s in batch])[:, None]
+    after = on_hand + np.array([s.recommended_qty for s in batch])[:, None]
+
+    short_now = np.maximum(demand - on_hand, 0)
+    short_after = np.maximum(demand - after, 0)
+    p_now = np.count_nonzero(short_now, axis=1) / trials
+    p_after = np.count_nonzero(short_after, axis=1) / trials
+    lost_now = short_now.mean(axis=1)
+    lost_after = short_after.mean(axis=1)
+    mean_demand = demand.mean(axis=1)
+    # Stock needed so P(demand <= stock) >= service_level
+    target_stock = np.quantile(demand, service_level, axis=1, method="higher")
+
+    return [
+        SkuRisk(
+            sku=s.sku,
+            source="empirical" if windows[i] is not None else "forecast",
+            on_hand=s.on_hand,
+            recommended_qty=s.recommended_qty,
+            lead_time_days=s.lead_time_days,
+            mean_lead_time_demand=round(float(mean_demand[i]), 2),
+            stockout_probability=round(float(p_now[i]), 4),
+            expected_lost_units=round(float(lost_now[i]), 2),
+            stockout_probability_after_order=round(float(p_after[i]), 4),
+            expected_lost_units_after_order=round(float(lost_after[i]), 2),
+            service_level_order_qty=max(0, math.ceil(target_stock[i]) - s.on_hand),
+        )
+        for i, s in enumerate(batch)
+    ]
+
+
+def simulate_stockout_risk(
+    inputs: list[SkuRiskInput],
+    *,
+    trials: int = 10_000,
+    source: str = "empirical",
+    service_level: float = 0.95,
+    seed: int | None = None,
+    workers: int | None = None,
+    store_id: str = DEFAULT_STORE_ID,
+) -> list[SkuRisk]:
+    """Simulate lead-time demand for many SKUs at once.
+
+    Results are returned in input order. Raises ValueError on bad arguments.
+    """
+    if source not in SOURCES:
+        raise ValueError(f"source must be one of {', '.join(SOURCES)}")
+    if not 1 <= trials <= MAX_TRIALS:
+        raise ValueError(f"trials must be between 1 and {MAX_TRIALS}")
+    if not 0 < service_level < 1:
+        raise ValueError("service_level must be between 0 and 1 (exclusive)")
+    if not inputs:
+        return []
+
+    as_of = latest_demand_day(store_id)
+    windows = [
+        _empirical_windows(s.sku, s.lead_time_days, as_of, store_id)
+        if source == "empirical"
+        else None
+        for s in inputs
+    ]
+
+    batch_skus = _batch_size(trials)
+    starts = range(0, len(inputs), batch_skus)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    workers = workers or SIMULATION_WORKERS
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(starts))) as pool:
+        futures = [
+            pool.submit(
+                _simulate_batch,
+                inputs[i : i + batch_skus],
+                windows[i : i + batch_skus],
+                trials,
+                service_level,
+                batch_seed,
+            )
+            for i, batch_seed in zip(starts, seeds, strict=True)
+        ]
+        return [risk for f in futures for risk in f.result()]
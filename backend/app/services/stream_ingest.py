@@ -0,0 +1,190 @@
+"""Micro-batched NDJSON event ingestion for point-of-sale integrations.
+
+Producers POST newline-delimited JSON events, one per line:
+
+    {"type": "sale", "order_id": "A1", "order_date": "2025-06-01T10:00:00Z",
+     "sku": "TEE-BLK-M", "quantity": 2, "unit_price": 19.5}
+    {"type": "inventory", "sku": "TEE-BLK-M", "name": "...", "category": "Tops",
+     "available": 40, "unit_cost": 8.5}
+
+Each event is validated with the same rules as CSV rows (validate_row) and
+buffered; the buffer is applied to the store as one micro-batch when it
+reaches STREAM_BATCH_EVENTS or STREAM_FLUSH_SECONDS old, whichever comes
+first, so data becomes visible while a long request is still streaming.
+
+Offsets: line i of a request has offset X-Start-Offset + i. The highest
+offset applied per (store, producer) is remembered, and on a retry any
+event at or below it is skipped as a duplicate, so resending a request
+(or its tail) after a timeout never double-counts sales. Invalid events
+are consumed too: they are reported once and their offsets are committed.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from app.config import DEFAULT_STORE_ID
+from app.services.csv_validator import normalize_value, validate_row
+from app.services.metrics import IMPORT_ROWS, stage_timer
+from app.services.seed_data import apply_stream_batch
+
+# Flush a micro-batch once it holds this many events...
+STREAM_BATCH_EVENTS = 5_000
+# ...or once its oldest event has waited this long (seconds)
+STREAM_FLUSH_SECONDS = 0.5
+# Longest accepted NDJSON line; longer lines are rejected as invalid events
+MAX_EVENT_BYTES = 64 * 1024
+# Invalid events reported back in full per request (all are counted)
+MAX_REPORTED_ERRORS = 100
+
+EVENT_TYPES = {
+    "sale": "sales_history",
+    "sales_history": "sales_history",
+    "inventory": "inventory_snapshot",
+    "inventory_snapshot": "inventory_snapshot",
+}
+
+# Highest applied offset per (store_id, producer) (per worker process)
+# TODO: Store producer offsets alongside the data in the DB (Phase 1, Step 6).
+_committed: dict[tuple[str, str], int] = {}
+
+
+def get_committed_offset(producer: str, store_id: str = DEFAULT_STORE_ID) -> int | None:
+    return _committed.get((store_id, producer))
+
+
+@dataclass
+class BatchAck:
+    first_offset: int
+    last_offset: int
+    accepted: int
+    rejected: int
+    duplicates: int
+
+
+@dataclass
+class EventError:
+    offset: int
+    errors: list[str]
+
+
+def parse_event(line: bytes) -> tuple[str, dict[str, str], list[str]]:
+    """Decode and validate one NDJSON line -> (csv_type, row, errors)."""
+    if len(line) > MAX_EVENT_BYTES:
+        return "", {}, [f"event exceeds {MAX_EVENT_BYTES} bytes"]
+    try:
+        event = json.loads(line)
+    except ValueError as exc:
+        return "", {}, [f"invalid JSON: {exc}"]
+    if not isinstance(event, dict):
+        return "", {}, ["event must be a JSON object"]
+    csv_type = EVENT_TYPES.get(event.pop("type", None))
+    if csv_type is None:
+        return "", {}, ["type must be one of: sale, inventory"]
+    row = {
+        str(key).strip().lower(): normalize_value(value) for key, value in event.items()
+    }
+    return csv_type, row, validate_row(csv_type, row)
+
+
+@dataclass
+class StreamIngestor:
+    """Splits a request body into events and applies them in micro-batches."""
+
+    producer: str | None
+    next_offset: int
+    store_id: str = DEFAULT_STORE_ID
+    # Called with the SKUs touched by each applied batch
+    on_apply: Callable[[set[str]], None] | None = None
+    received: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    duplicates: int = 0
+    batches: list[BatchAck] = field(default_factory=list)
+    errors: list[EventError] = field(default_factory=list)
+    # When the oldest pending event arrived (monotonic), None if empty
+    pending_since: float | None = None
+    # (offset, line) pairs waiting for the next flush
+    _pending: list[tuple[int, bytes]] = field(default_factory=list)
+    _partial: bytes = b""
+
+    def feed(self, chunk: bytes) -> None:
+        """Buffer the complete lines in `chunk` (a trailing fragment waits)."""
+        lines = (self._partial + chunk).split(b"\n")
+        # Cap an unterminated line; it is rejected as too long when it ends
+        self._partial = lines.pop()[: MAX_EVENT_BYTES + 1]
+        for line in lines:
+            self._add(line)
+
+    def _add(self, line: bytes) -> None:
+        line = line.strip()
+        if not line:
+            return
+        if not self._pending:
+            self.pending_since = time.monotonic()
+        self._pending.append((self.next_offset, line))
+        self.next_offset += 1
+        self.received += 1
+        if len(self._pending) >= STREAM_BATCH_EVENTS:
+            self.flush()
+
+    def flush_due(self) -> float | None:
+        """Seconds until the time-based flush is due (None if nothing pending)."""
+        if self.pending_since is None:
+            return None
+        return max(0.0, STREAM_FLUSH_SECONDS - (time.monotonic() - self.pending_since))
+
+    def finish(self) -> None:
+        """Flush the trailing line (no final newline) and the last batch."""
+        self._add(self._partial)
+        self._partial = b""
+        self.flush()
+
+    def flush(self) -> BatchAck | None:
+        """Validate and apply every pending event as one micro-batch.
+
+        Runs without awaiting, so the batch is applied atomically with
+        respect to other requests; the producer's offset is committed with it.
+        """
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, []
+        self.pending_since = None
+        key = (self.store_id, self.producer or "")
+        committed = _committed.get(key, -1) if self.producer else -1
+
+        sales: list[dict] = []
+        inventory: list[dict] = []
+        ack = BatchAck(pending[0][0], pending[-1][0], 0, 0, 0)
+        for offset, line in pending:
+            if offset <= committed:
+                ack.duplicates += 1
+                continue
+            csv_type, row, errors = parse_event(line)
+            if errors:
+                ack.rejected += 1
+                if len(self.errors) < MAX_REPORTED_ERRORS:
+                    self.errors.append(EventError(offset, errors))
+                continue
+            ack.accepted += 1
+            (sales if csv_type == "sales_history" else inventory).append(row)
+
+        with stage_timer("stream_apply"):
+            touched = apply_stream_batch(sales, inventory, self.store_id)
+        if self.producer:
+            _committed[key] = max(committed, ack.last_offset)
+        if touched and self.on_apply is not None:
+            self.on_apply(touched)
+
+        IMPORT_ROWS.inc("sales_history", "accepted", amount=len(sales))
+        IMPORT_ROWS.inc("inventory_snapshot", "accepted", amount=len(inventory))
+        IMPORT_ROWS.inc("stream", "rejected", amount=ack.rejected)
+        IMPORT_ROWS.inc("stream", "duplicate", amount=ack.duplicates)
+        self.accepted += ack.accepted
+        self.rejected += ack.rejected
+        self.duplicates += ack.duplicates
+        self.batches.append(ack)
+        return ack
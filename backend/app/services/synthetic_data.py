@@ -0,0 +1,210 @@
+"""Deterministic synthetic catalog generator for load testing and benchmarks.
+
+Produces inventory_snapshot and sales_history CSVs in the same schema the
+import endpoint accepts, at any catalog size. The same seed always yields
+byte-identical output, so benchmark runs on different commits see the
+same data.
+
+Sales follow a per-SKU base rate (long-tailed across the catalog) shaped
+by weekly and yearly seasonality. A configurable fraction of rows is made
+dirty (empty fields, negative numbers, bad dates, stray whitespace) to
+exercise the validator's rejection paths.
+
+CLI:
+    python -m app.services.synthetic_data --skus 100000 --days 365 --out-dir data/
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+from collections.abc import Iterator
+from datetime import date, timedelta
+
+from app.services.csv_validator import (
+    INVENTORY_SNAPSHOT_REQUIRED,
+    SALES_HISTORY_REQUIRED,
+)
+
+CATEGORIES = ["Tops", "Bottoms", "Outerwear", "Dresses", "Footwear", "Accessories"]
+SUPPLIERS = ["Northwind", "Acme Apparel", "Blue Loom", "Canvas & Co", "Stitchworks"]
+
+# Extra pass-through columns the inventory generator also emits
+INVENTORY_EXTRA = ["lead_time_days", "supplier"]
+
+DEFAULT_START = date(2025, 1, 1)
+
+
+def _sku(i: int) -> str:
+    return f"SKU-{i:07d}"
+
+
+def _dirty_inventory(rng: random.Random, row: list[str]) -> list[str]:
+    """Break one required field the way real exports do."""
+    kind = rng.randrange(4)
+    if kind == 0:
+        row[0] = ""  # empty sku
+    elif kind == 1:
+        row[3] = str(-rng.randint(1, 50))  # negative available
+    elif kind == 2:
+        row[4] = "n/a"  # non-numeric unit_cost
+    else:
+        row[0] = f"  {row[0]} "  # stray whitespace (accepted, warned)
+    return row
+
+
+def _dirty_sale(rng: random.Random, row: list[str]) -> list[str]:
+    kind = rng.randrange(4)
+    if kind == 0:
+        row[1] = "13/45/2025"  # bad date
+    elif kind == 1:
+        row[3] = "0"  # quantity must be > 0
+    elif kind == 2:
+        row[3] = "two"
+    else:
+        row[2] = ""  # empty sku
+    return row
+
+
+def _csv_line(values: list[str]) -> str:
+    # Generated values never contain commas or quotes, so no quoting needed
+    return ",".join(values) + "\n"
+
+
+def iter_inventory_csv(
+    skus: int, *, dirty_rate: float = 0.0, seed: int = 0
+) -> Iterator[str]:
+    """Yield an inventory_snapshot CSV line by line (header first)."""
+    rng = random.Random(f"inventory-{seed}")
+    yield _csv_line(INVENTORY_SNAPSHOT_REQUIRED + INVENTORY_EXTRA)
+    for i in range(skus):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        row = [
+            _sku(i),
+            f"{category} item {i}",
+            category,
+            str(int(rng.expovariate(1 / 40))),
+            f"{rng.uniform(2, 80):.2f}",
+            str(rng.choice((7, 14, 14, 21, 30))),
+            rng.choice(SUPPLIERS),
+        ]
+        if dirty_rate and rng.random() < dirty_rate:
+            row = _dirty_inventory(rng, row)
+        yield _csv_line(row)
+
+
+def iter_sales_csv(
+    skus: int,
+    days: int,
+    *,
+    start: date = DEFAULT_START,
+    weekly_amplitude: float = 0.3,
+    yearly_amplitude: float = 0.2,
+    dirty_rate: float = 0.0,
+    seed: int = 0,
+) -> Iterator[str]:
+    """Yield a sales_history CSV line by line (header first).
+
+    Each SKU gets a base daily rate drawn from a long-tailed distribution,
+    so a few SKUs sell every day and most sell occasionally. At most one
+    order line is written per SKU per day.
+    """
+    rng = random.Random(f"sales-{seed}")
+    base_rates = [rng.paretovariate(1.5) * 0.2 for _ in range(skus)]
+    yield _csv_line(SALES_HISTORY_REQUIRED)
+
+    order_id = 0
+    for d in range(days):
+        day = start + timedelta(days=d)
+        season = (1 + weekly_amplitude * math.sin(2 * math.pi * day.weekday() / 7)) * (
+            1 + yearly_amplitude * math.sin(2 * math.pi * day.timetuple().tm_yday / 365)
+        )
+        order_date = f"{day.isoformat()}T12:00:00Z"
+        for i, rate in enumerate(base_rates):
+            mean = rate * season
+            # Cheap Poisson-ish draw: skip most low-rate SKU-days outright
+            if rng.random() > 1 - math.exp(-mean):
+                continue
+            qty = max(1, round(rng.expovariate(1 / max(mean, 1))))
+            order_id += 1
+            row = [
+                f"ORD-{order_id:09d}",
+                order_date,
+                _sku(i),
+                str(qty),
+                f"{rng.uniform(5, 120):.2f}",
+            ]
+            if dirty_rate and rng.random() < dirty_rate:
+                row = _dirty_sale(rng, row)
+            yield _csv_line(row)
+
+
+def iter_sales_rows_csv(
+    rows: int, *, skus: int | None = None, dirty_rate: float = 0.0, seed: int = 0
+) -> Iterator[str]:
+    """Yield a sales_history CSV with exactly `rows` data rows.
+
+    Used by benchmarks that need a fixed row count rather than a fixed
+    history length: one SKU per 180 rows, with as many days as it takes.
+    """
+    skus = skus or max(1, rows // 180)
+    days = max(1, -(-rows // skus))
+    # Generous history; generation is lazy and stops at `rows`
+    lines = iter_sales_csv(skus, days * 10, dirty_rate=dirty_rate, seed=seed)
+    for n, line in enumerate(lines):
+        if n > rows:
+            return
+        yield line
+
+
+def write_csv(path: str, lines: Iterator[str]) -> int:
+    """Write generated lines to `path`. Returns the number of data rows."""
+    lines_written = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        for line in lines:
+            f.write(line)
+            lines_written += 1
+    return max(lines_written - 1, 0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.services.synthetic_data",
+        description="Generate deterministic inventory_snapshot and sales_history CSVs.",
+    )
+    parser.add_argument("--skus", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=180, help="Days of sales history")
+    parser.add_argument("--dirty-rate", type=float, default=0.0)
+    parser.add_argument("--weekly-amplitude", type=float, default=0.3)
+    parser.add_argument("--yearly-amplitude", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out-dir", default=".")
+    args = parser.parse_args()
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    inv_path = os.path.join(args.out_dir, "inventory_snapshot.csv")
+    sales_path = os.path.join(args.out_dir, "sales_history.csv")
+
+    n_inv = write_csv(
+        inv_path,
+        iter_inventory_csv(args.skus, dirty_rate=args.dirty_rate, seed=args.seed),
+    )
+    n_sales = write_csv(
+        sales_path,
+        iter_sales_csv(
+            args.skus,
+            args.days,
+            weekly_amplitude=args.weekly_amplitude,
+            yearly_amplitude=args.yearly_amplitude,
+            dirty_rate=args.dirty_rate,
+            seed=args.seed,
+        ),
+    )
+    print(f"Wrote {n_inv} rows to {inv_path}")
+    print(f"Wrote {n_sales} rows to {sales_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Startup warm-up and readiness state.
+
+Run from the application lifespan on a worker thread, so /healthz answers
+immediately while /readyz reports not-ready until every phase is done:
+
+  1. load_snapshots   - reload persisted uploads (UPLOAD_PERSIST_DIR)
+  2. build_products   - per-store product view + SKU index (velocity join)
+  3. build_recommendations - per-store recommendation view + SKU index
+  4. serialize_responses   - pre-render hot JSON bodies (response_cache)
+
+Each phase is timed; durations are exposed on /readyz and as the
+startup_phase_duration_seconds gauge. A failing phase is logged and the
+worker still becomes ready: anything not warmed is built lazily on first
+request, exactly as it would be without warm-up.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+
+from app.services.metrics import APP_READY, STARTUP_PHASE_DURATION
+from app.services.seed_data import (
+    get_products,
+    get_recommendations,
+    get_store_ids,
+    store_uploaded_rows,
+)
+from app.services.snapshots import load_snapshots
+
+logger = logging.getLogger(__name__)
+
+_ready = threading.Event()
+_phases: dict[str, float] = {}
+_errors: list[str] = []
+APP_READY.set(0)
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+
+def get_startup_report() -> tuple[dict[str, float], list[str]]:
+    """Return (phase -> milliseconds, error messages) for phases run so far."""
+    return dict(_phases), list(_errors)
+
+
+def _load_snapshots() -> None:
+    for store_id, snapshots in load_snapshots().items():
+        # sales_history first so the inventory view joins against its velocity
+        for csv_type in sorted(snapshots, key=lambda t: t != "sales_history"):
+            store_uploaded_rows(
+                csv_type, snapshots[csv_type], store_id=store_id, persist=False
+            )
+
+
+def _build_products() -> None:
+    get_products()
+    for store_id in get_store_ids():
+        get_products(store_id)
+
+
+def _build_recommendations() -> None:
+    get_recommendations()
+    for store_id in get_store_ids():
+        get_recommendations(store_id)
+
+
+def _run_phase(name: str, fn: Callable[[], object]) -> None:
+    start = time.perf_counter()
+    try:
+        fn()
+    except Exception as exc:
+        logger.exception("Warm-up phase %s failed", name)
+        _errors.append(f"{name}: {exc}")
+    seconds = time.perf_counter() - start
+    _phases[name] = round(seconds * 1000, 2)
+    STARTUP_PHASE_DURATION.set(seconds, name)
+    logger.info("Warm-up phase %s took %.1f ms", name, seconds * 1000)
+
+
+def run_warmup(hot_responses: Sequence[Callable[[], object]] = ()) -> None:
+    """Run every warm-up phase, then mark the worker ready.
+
+    `hot_responses` are callables that pre-serialize endpoint bodies; they
+    are supplied by the app so this module does not import the API layer.
+    """
+    start = time.perf_counter()
+    _run_phase("load_snapshots", _load_snapshots)
+    _run_phase("build_products", _build_products)
+    _run_phase("build_recommendations", _build_recommendations)
+
+    def serialize() -> None:
+        for build in hot_responses:
+            build()
+
+    _run_phase("serialize_responses", serialize)
+    _phases["total"] = round((time.perf_counter() - start) * 1000, 2)
+    _ready.set()
+    APP_READY.set(1)
+    logger.info("Warm-up complete in %.1f ms", _phases["total"])
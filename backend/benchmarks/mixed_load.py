@@ -0,0 +1,145 @@
+"""Mixed read/import load test against a running server.
+
+Reader threads hammer the dashboard read endpoints while importer threads
+upload synthetic CSVs as fast as admission control allows. Reports read
+latency percentiles (overall and while imports were in flight) and import
+outcomes, and exits non-zero if read p99 misses the SLO:
+
+    cd backend
+    uvicorn app.main:app --port 8000 &
+    python -m benchmarks.mixed_load --url http://127.0.0.1:8000 --slo-ms 250
+
+Requires the dev dependencies (httpx).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+
+import httpx
+
+from app.services.synthetic_data import iter_inventory_csv, iter_sales_rows_csv
+from benchmarks.run_benchmarks import ENDPOINTS, _percentile
+
+
+def _reader(
+    url: str,
+    stop: threading.Event,
+    importing: threading.Event,
+    samples: list[tuple[float, bool]],
+) -> None:
+    paths = list(ENDPOINTS.values())
+    with httpx.Client(base_url=url, timeout=30) as client:
+        i = 0
+        while not stop.is_set():
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            client.get(path).raise_for_status()
+            samples.append(((time.perf_counter() - start) * 1000, importing.is_set()))
+
+
+def _importer(
+    url: str,
+    stop: threading.Event,
+    in_flight: list[int],
+    importing: threading.Event,
+    files: list[tuple[str, bytes]],
+    outcomes: Counter,
+    lock: threading.Lock,
+) -> None:
+    with httpx.Client(base_url=url, timeout=120) as client:
+        i = 0
+        while not stop.is_set():
+            name, content = files[i % len(files)]
+            i += 1
+            with lock:
+                in_flight[0] += 1
+                importing.set()
+            try:
+                response = client.post(
+                    "/api/v1/imports/upload",
+                    files={"file": (name, content, "text/csv")},
+                )
+            finally:
+                with lock:
+                    in_flight[0] -= 1
+                    if not in_flight[0]:
+                        importing.clear()
+            outcomes[response.status_code] += 1
+            if response.status_code in (429, 503):
+                # Honour the server's hint, but keep the pressure on
+                time.sleep(min(float(response.headers.get("Retry-After", 1)), 2))
+
+
+def _summary(values: list[float]) -> str:
+    if not values:
+        return "no samples"
+    return (
+        f"n={len(values)} p50={statistics.median(values):.1f}ms "
+        f"p99={_percentile(values, 99):.1f}ms max={max(values):.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.mixed_load",
+        description="Measure read latency while imports run.",
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--importers", type=int, default=3)
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows per upload")
+    parser.add_argument("--slo-ms", type=float, default=250, help="Read p99 target")
+    args = parser.parse_args()
+
+    files = [
+        ("inventory.csv", "".join(iter_inventory_csv(args.rows, seed=1)).encode()),
+        ("sales.csv", "".join(iter_sales_rows_csv(args.rows, seed=1)).encode()),
+    ]
+
+    stop = threading.Event()
+    importing = threading.Event()
+    lock = threading.Lock()
+    in_flight = [0]
+    samples: list[tuple[float, bool]] = []
+    outcomes: Counter = Counter()
+
+    threads = [
+        threading.Thread(target=_reader, args=(args.url, stop, importing, samples))
+        for _ in range(args.readers)
+    ] + [
+        threading.Thread(
+            target=_importer,
+            args=(args.url, stop, in_flight, importing, files, outcomes, lock),
+        )
+        for _ in range(args.importers)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    all_reads = [ms for ms, _ in samples]
+    during = [ms for ms, busy in samples if busy]
+    print(f"reads (all):             {_summary(all_reads)}")
+    print(f"reads (during imports):  {_summary(during)}")
+    print(f"imports by status:       {dict(sorted(outcomes.items()))}")
+
+    p99 = _percentile(during or all_reads, 99) if all_reads else float("inf")
+    if p99 > args.slo_ms:
+        print(f"FAIL: read p99 {p99:.1f}ms exceeds SLO {args.slo_ms:g}ms")
+        sys.exit(1)
+    print(f"OK: read p99 {p99:.1f}ms within SLO {args.slo_ms:g}ms")
+
+
+if __name__ == "__main__":
+    main()
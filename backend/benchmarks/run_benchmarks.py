@@ -0,0 +1,225 @@
+"""Reproducible backend benchmark suite.
+
+For each catalog size, generates deterministic synthetic data
+(app.services.synthetic_data) and measures:
+  - validate_csv throughput (rows/s) for inventory_snapshot and sales_history
+  - import memory: tracemalloc peak while validating + storing both files
+  - API latency (cold first call, p50, p99) of /products,
+    /dashboard/summary and /recommendations, in-process via TestClient
+
+Results are written as JSON keyed by git commit, so two runs can be diffed:
+
+    cd backend
+    python -m benchmarks.run_benchmarks --sizes 1000,100000
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/abc1234.json
+
+Requires the dev dependencies (httpx for TestClient).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import UTC, datetime
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.csv_validator import validate_csv
+from app.services.seed_data import store_uploaded_rows
+from app.services.synthetic_data import iter_inventory_csv, iter_sales_rows_csv
+
+DEFAULT_SIZES = "1000,100000,1000000"
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+ENDPOINTS = {
+    "products": "/api/v1/products",
+    "dashboard_summary": "/api/v1/dashboard/summary",
+    "recommendations": "/api/v1/recommendations",
+}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _bench_validate(content: str, rows: int) -> dict:
+    start = time.perf_counter()
+    result = validate_csv(content, max_rows=None)
+    seconds = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "accepted": len(result.accepted_rows),
+        "rejected": len(result.rejected_rows),
+        "seconds": round(seconds, 4),
+        "rows_per_second": round(rows / seconds) if seconds else None,
+    }
+
+
+def _bench_import_memory(inventory_csv: str, sales_csv: str) -> dict:
+    tracemalloc.start()
+    try:
+        for content in (sales_csv, inventory_csv):
+            result = validate_csv(content, max_rows=None)
+            store_uploaded_rows(result.csv_type, result.accepted_rows)
+            del result
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_mb": round(peak / 1024 / 1024, 2),
+        "retained_mb": round(current / 1024 / 1024, 2),
+    }
+
+
+def _bench_latency(client: TestClient, path: str, requests: int) -> dict:
+    start = time.perf_counter()
+    response = client.get(path)
+    cold_ms = (time.perf_counter() - start) * 1000
+    response.raise_for_status()
+
+    samples: list[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return {
+        "cold_ms": round(cold_ms, 2),
+        "p50_ms": round(statistics.median(samples), 2),
+        "p99_ms": round(_percentile(samples, 99), 2),
+        "requests": requests,
+        "response_bytes": len(response.content),
+    }
+
+
+def run(sizes: list[int], requests: int, dirty_rate: float, seed: int) -> dict:
+    client = TestClient(app)
+    results = []
+    for size in sizes:
+        print(f"size={size}: generating data")
+        inventory_csv = "".join(
+            iter_inventory_csv(size, dirty_rate=dirty_rate, seed=seed)
+        )
+        sales_csv = "".join(iter_sales_rows_csv(size, dirty_rate=dirty_rate, seed=seed))
+
+        print(f"size={size}: validate_csv")
+        validate = {
+            "inventory_snapshot": _bench_validate(inventory_csv, size),
+            "sales_history": _bench_validate(sales_csv, size),
+        }
+
+        print(f"size={size}: import memory")
+        memory = _bench_import_memory(inventory_csv, sales_csv)
+        del inventory_csv, sales_csv
+
+        print(f"size={size}: endpoint latency")
+        latency = {
+            name: _bench_latency(client, path, requests)
+            for name, path in ENDPOINTS.items()
+        }
+
+        results.append(
+            {
+                "size": size,
+                "validate_csv": validate,
+                "import_memory": memory,
+                "latency": latency,
+            }
+        )
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {"requests": requests, "dirty_rate": dirty_rate, "seed": seed},
+        "results": results,
+    }
+
+
+def _flatten(report: dict) -> dict[str, float]:
+    """Flatten a report to {"size/section/.../metric": value} for diffing."""
+    flat: dict[str, float] = {}
+
+    def walk(prefix: str, node: object) -> None:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                walk(f"{prefix}/{key}", value)
+        elif isinstance(node, int | float) and not isinstance(node, bool):
+            flat[prefix] = node
+
+    for entry in report["results"]:
+        walk(str(entry["size"]), {k: v for k, v in entry.items() if k != "size"})
+    return flat
+
+
+def compare(baseline: dict, current: dict) -> str:
+    """Render a table of metrics that changed between two reports."""
+    before, after = _flatten(baseline), _flatten(current)
+    lines = [f"{baseline['commit']} -> {current['commit']}"]
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        if old == new or not old:
+            continue
+        change = (new - old) / old * 100
+        lines.append(f"{key:<60}{old:>14}{new:>14}{change:>+9.1f}%")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run_benchmarks",
+        description="Benchmark CSV validation, import memory and API latency.",
+    )
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help="Comma-separated row counts"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=30, help="Timed requests per endpoint"
+    )
+    parser.add_argument("--dirty-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", help="Result file (default: benchmarks/results/<commit>.json)"
+    )
+    parser.add_argument("--compare", help="Baseline result file to diff against")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    report = run(sizes, args.requests, args.dirty_rate, args.seed)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print(compare(json.load(f), report))
+
+
+if __name__ == "__main__":
+    main()